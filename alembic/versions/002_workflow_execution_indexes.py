@@ -0,0 +1,38 @@
+"""Add composite indexes for workflow execution listings
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_wf_exec_wf_started',
+        'workflow_executions',
+        ['workflow_id', sa.text('started_at DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_wf_exec_wf_status_started',
+        'workflow_executions',
+        ['workflow_id', 'status', sa.text('started_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wf_exec_wf_status_started', table_name='workflow_executions')
+    op.drop_index('ix_wf_exec_wf_started', table_name='workflow_executions')
@@ -1,8 +1,11 @@
 """FastAPI application for AI Automation Boilerplate."""
 
 import time
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import get_settings
 from .logging import setup_logging, get_logger
@@ -22,6 +25,8 @@ app = FastAPI(
     version=settings.version,
     description="AI Automation Boilerplate API",
     debug=settings.debug,
+    # Serialize responses with orjson rather than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -220,10 +225,17 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     from .database import close_db
-    from .caching import close_cache_manager
+    from .caching import close_cache_manager, close_workflow_cache
+    from .workflows.worker import close_workflow_queue
+    from .tools.registry import close_tools
+    from .vector_store import close_vector_store
 
     await close_db()
     await close_cache_manager()
+    await close_workflow_cache()
+    await close_workflow_queue()
+    await close_tools()
+    await close_vector_store()
     logger.info("Application shutdown")
 
 if __name__ == "__main__":
@@ -1,16 +1,21 @@
 """Caching infrastructure for AI Automation Boilerplate."""
 
-from .cache_manager import CacheManager, get_cache_manager
+from .cache_manager import CacheManager, close_cache_manager, get_cache_manager
 from .strategies import (
     LLMCacheStrategy,
     VectorCacheStrategy,
     AgentResultCacheStrategy,
     SemanticCacheStrategy,
 )
+from .workflow_cache import WorkflowCache, close_workflow_cache, get_workflow_cache
 
 __all__ = [
     "CacheManager",
     "get_cache_manager",
+    "close_cache_manager",
+    "WorkflowCache",
+    "get_workflow_cache",
+    "close_workflow_cache",
     "LLMCacheStrategy",
     "VectorCacheStrategy",
     "AgentResultCacheStrategy",
@@ -0,0 +1,125 @@
+"""Redis-backed cache for workflow definitions and listings."""
+
+import json
+import time
+from typing import Any, Optional
+
+import redis.asyncio as redis
+import structlog
+
+from ..config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+WORKFLOW_CACHE_TTL = 300  # 5 minutes
+WORKFLOW_CACHE_RETRY_BACKOFF = 30  # seconds before reconnecting to an unreachable Redis
+WORKFLOW_KEY_PREFIX = "wf:"
+WORKFLOW_LIST_KEY_PREFIX = "wf:list:"
+
+
+class WorkflowCache:
+    """Read-through cache for workflow API responses.
+
+    Workflow definitions are read far more often than they change, so single
+    workflows and listing pages are cached in Redis and invalidated whenever a
+    workflow is created or deleted. If Redis is unavailable every lookup is a
+    miss and callers fall back to the database until a reconnect succeeds.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = WORKFLOW_CACHE_TTL):
+        self.redis_url = redis_url or get_settings().redis.url
+        self.ttl = ttl
+        self._redis: Optional[redis.Redis] = None
+        # Monotonic time before which a failed connection is not retried
+        self._retry_at = 0.0
+
+    async def initialize(self) -> None:
+        """Connect to Redis, retrying after a backoff if it cannot be reached."""
+        if self._redis is not None or time.monotonic() < self._retry_at:
+            return
+        client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        try:
+            await client.ping()
+        except Exception as e:
+            logger.warning(
+                "Workflow cache unavailable, Redis unreachable",
+                error=str(e),
+                retry_in=WORKFLOW_CACHE_RETRY_BACKOFF,
+            )
+            self._retry_at = time.monotonic() + WORKFLOW_CACHE_RETRY_BACKOFF
+            await client.close()
+            return
+        self._redis = client
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+        self._retry_at = 0.0
+
+    @staticmethod
+    def workflow_key(workflow_id: str) -> str:
+        """Cache key for a single workflow."""
+        return f"{WORKFLOW_KEY_PREFIX}{workflow_id}"
+
+    @staticmethod
+    def list_key(skip: int, limit: int, is_active: Optional[bool]) -> str:
+        """Cache key for a page of the workflow listing."""
+        return f"{WORKFLOW_LIST_KEY_PREFIX}{skip}:{limit}:{is_active}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on a miss."""
+        await self.initialize()
+        if not self._redis:
+            return None
+        try:
+            data = await self._redis.get(key)
+        except Exception as e:
+            logger.warning("Workflow cache get failed", key=key, error=str(e))
+            return None
+        return json.loads(data) if data is not None else None
+
+    async def set(self, key: str, value: Any) -> None:
+        """Cache a JSON-serializable value with the configured TTL."""
+        await self.initialize()
+        if not self._redis:
+            return
+        try:
+            await self._redis.setex(key, self.ttl, json.dumps(value, default=str))
+        except Exception as e:
+            logger.warning("Workflow cache set failed", key=key, error=str(e))
+
+    async def invalidate(self, workflow_id: Optional[str] = None) -> None:
+        """Drop a cached workflow (if given) and every cached listing page."""
+        await self.initialize()
+        if not self._redis:
+            return
+        try:
+            keys = [key async for key in self._redis.scan_iter(match=f"{WORKFLOW_LIST_KEY_PREFIX}*")]
+            if workflow_id is not None:
+                keys.append(self.workflow_key(workflow_id))
+            if keys:
+                await self._redis.delete(*keys)
+        except Exception as e:
+            logger.warning("Workflow cache invalidation failed", workflow_id=workflow_id, error=str(e))
+
+
+# Global workflow cache instance
+_workflow_cache: Optional[WorkflowCache] = None
+
+
+def get_workflow_cache() -> WorkflowCache:
+    """Get the global workflow cache instance."""
+    global _workflow_cache
+    if _workflow_cache is None:
+        _workflow_cache = WorkflowCache()
+    return _workflow_cache
+
+
+async def close_workflow_cache() -> None:
+    """Close the global workflow cache."""
+    global _workflow_cache
+    if _workflow_cache:
+        await _workflow_cache.close()
+        _workflow_cache = None
@@ -40,6 +40,17 @@ def serve():
         click.echo("Make sure all dependencies are installed.")
 
 
+@main.command()
+def worker():
+    """Start the background workflow worker."""
+    click.echo("Starting workflow worker...")
+    from arq import run_worker
+
+    from .workflows.worker import WorkerSettings
+
+    run_worker(WorkerSettings)
+
+
 @main.command()
 @click.option("--input", "-i", help="Input file or data")
 @click.option("--output", "-o", help="Output file")
@@ -84,6 +84,11 @@ class VectorStoreSettings(BaseSettings):
 
     provider: str = Field(default="memory", env="VECTOR_STORE_PROVIDER")
     dimension: int = Field(default=1536, env="VECTOR_STORE_DIMENSION")
+    # In-memory store element type: "f32", "f16" or "i8"
+    storage_dtype: str = Field(default="f32", env="VECTOR_STORE_STORAGE_DTYPE")
+    embedding_model: str = Field(default="text-embedding-3-small", env="VECTOR_STORE_EMBEDDING_MODEL")
+    # Directory the in-memory store is saved to on shutdown and memory-mapped from on startup
+    persist_path: Optional[str] = Field(default=None, env="VECTOR_STORE_PERSIST_PATH")
 
     # Pinecone
     pinecone_api_key: Optional[str] = Field(default=None, env="PINECONE_API_KEY")
@@ -126,6 +131,21 @@ class AuthSettings(BaseSettings):
         case_sensitive = False
 
 
+class EmailSettings(BaseSettings):
+    """Email (SMTP) configuration."""
+
+    smtp_host: str = Field(default="localhost", env="SMTP_SERVER")
+    smtp_port: int = Field(default=587, env="SMTP_PORT")
+    smtp_use_tls: bool = Field(default=True, env="SMTP_USE_TLS")
+    smtp_username: Optional[str] = Field(default=None, env="SMTP_USERNAME")
+    smtp_password: Optional[str] = Field(default=None, env="SMTP_PASSWORD")
+    from_email: Optional[str] = Field(default=None, env="EMAIL_FROM")
+
+    class Config:
+        env_file = ".env"
+        case_sensitive = False
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
@@ -144,6 +164,7 @@ class Settings(BaseSettings):
     vector_store: VectorStoreSettings = VectorStoreSettings()
     monitoring: MonitoringSettings = MonitoringSettings()
     auth: AuthSettings = AuthSettings()
+    email: EmailSettings = EmailSettings()
 
     # Backward compatibility
     @property
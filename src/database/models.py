@@ -13,6 +13,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -122,6 +123,12 @@ class WorkflowExecution(Base):
     completed_at = Column(DateTime, nullable=True)
     metadata = Column(JSON, nullable=True, default=dict)
 
+    # Composite indexes matching the execution listing's filter + ORDER BY started_at DESC
+    __table_args__ = (
+        Index("ix_wf_exec_wf_started", workflow_id, started_at.desc()),
+        Index("ix_wf_exec_wf_status_started", workflow_id, status, started_at.desc()),
+    )
+
     # Relationships
     workflow = relationship("Workflow", back_populates="executions")
     step_executions = relationship("WorkflowStepExecution", back_populates="workflow_execution", cascade="all, delete-orphan")
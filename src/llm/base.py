@@ -1,7 +1,9 @@
 """Base LLM provider interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from pydantic import BaseModel
 
@@ -10,6 +12,16 @@ from ..config import get_settings
 settings = get_settings()
 
 
+@lru_cache(maxsize=256)
+def _system_msg(system_prompt: str) -> Mapping[str, str]:
+    """Return a shared, read-only system message for a system prompt.
+
+    Reusing the same object for identical system prompts avoids rebuilding
+    the message on every call and keeps the request prefix stable across calls.
+    """
+    return MappingProxyType({"role": "system", "content": system_prompt})
+
+
 class LLMMessage(BaseModel):
     """Message for LLM chat."""
 
@@ -120,9 +132,16 @@ class BaseLLM(ABC):
         merged.update(kwargs)
         return merged
 
+    def _build_messages(self, prompt: str, system_prompt: Optional[str] = None) -> List[Mapping[str, str]]:
+        """Build a chat-style message list from a prompt and optional system prompt.
 
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
 
-
-
-
-
+        Returns:
+            List of messages with the cached system message first, if any
+        """
+        if system_prompt:
+            return [_system_msg(system_prompt), {"role": "user", "content": prompt}]
+        return [{"role": "user", "content": prompt}]
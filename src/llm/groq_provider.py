@@ -26,10 +26,7 @@ class GroqProvider(BaseLLM):
         **kwargs: Any,
     ) -> LLMResponse:
         """Generate text using Groq."""
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt)
 
         merged_kwargs = self._merge_kwargs(**kwargs)
 
@@ -101,10 +98,7 @@ class GroqProvider(BaseLLM):
         **kwargs: Any,
     ):
         """Stream text generation from Groq."""
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt)
 
         merged_kwargs = self._merge_kwargs(**kwargs)
 
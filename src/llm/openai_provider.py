@@ -30,10 +30,7 @@ class OpenAIProvider(BaseLLM):
         **kwargs: Any,
     ) -> LLMResponse:
         """Generate text using OpenAI with caching support."""
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt)
 
         merged_kwargs = self._merge_kwargs(**kwargs)
 
@@ -128,10 +125,7 @@ class OpenAIProvider(BaseLLM):
         **kwargs: Any,
     ):
         """Stream text generation from OpenAI."""
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt)
 
         merged_kwargs = self._merge_kwargs(**kwargs)
 
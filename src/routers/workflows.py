@@ -1,17 +1,27 @@
 """API routes for workflow management and execution."""
 
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from arq.connections import ArqRedis
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..caching import WorkflowCache, get_workflow_cache
 from ..database import get_db
-from ..database.models import Workflow, WorkflowExecution, WorkflowStatus as DBWorkflowStatus
+from ..database.models import (
+    Workflow,
+    WorkflowExecution,
+    WorkflowStatus as DBWorkflowStatus,
+    WorkflowStepExecution,
+)
 from ..workflows.engine import WorkflowEngine
+from ..workflows.worker import RUN_WORKFLOW_EXECUTION, get_workflow_queue
 from ..workflows.models import Workflow as WorkflowModel, WorkflowConfig, WorkflowStep
 
 logger = structlog.get_logger(__name__)
@@ -23,7 +33,7 @@ class WorkflowCreate(BaseModel):
 
     name: str
     description: Optional[str] = None
-    steps: List[dict]
+    steps: List[WorkflowStep]
     config: dict = {}
 
 
@@ -64,18 +74,23 @@ class WorkflowExecutionResponse(BaseModel):
 
 
 @router.post("/", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
-async def create_workflow(workflow: WorkflowCreate, db: AsyncSession = Depends(get_db)):
+async def create_workflow(
+    workflow: WorkflowCreate,
+    db: AsyncSession = Depends(get_db),
+    cache: WorkflowCache = Depends(get_workflow_cache),
+):
     """Create a new workflow."""
     try:
         db_workflow = Workflow(
             name=workflow.name,
             description=workflow.description,
-            steps=workflow.steps,
+            steps=[step.model_dump() for step in workflow.steps],
             config=workflow.config,
         )
         db.add(db_workflow)
         await db.commit()
         await db.refresh(db_workflow)
+        await cache.invalidate()
 
         logger.info("Workflow created", workflow_id=db_workflow.id, workflow_name=db_workflow.name)
         return db_workflow
@@ -94,18 +109,37 @@ async def list_workflows(
     limit: int = 100,
     is_active: Optional[bool] = None,
     db: AsyncSession = Depends(get_db),
+    cache: WorkflowCache = Depends(get_workflow_cache),
 ):
-    """List all workflows."""
+    """List all workflows.
+
+    Rows are fetched as plain mappings shaped like WorkflowResponse and
+    serialized directly with orjson, skipping ORM hydration and a second
+    Pydantic validation pass over trusted database data.
+    """
     try:
-        query = select(Workflow)
+        cache_key = cache.list_key(skip, limit, is_active)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(cached, headers={"X-Cache": "HIT"})
+
+        query = select(
+            Workflow.id,
+            Workflow.name,
+            Workflow.description,
+            Workflow.steps,
+            Workflow.config,
+            Workflow.is_active,
+        )
         if is_active is not None:
             query = query.where(Workflow.is_active == is_active)
 
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
-        workflows = result.scalars().all()
+        workflows = [dict(row) for row in result.mappings().all()]
 
-        return workflows
+        await cache.set(cache_key, workflows)
+        return ORJSONResponse(workflows, headers={"X-Cache": "MISS"})
 
     except Exception as e:
         logger.error("Failed to list workflows", error=str(e), exc_info=True)
@@ -116,9 +150,20 @@ async def list_workflows(
 
 
 @router.get("/{workflow_id}", response_model=WorkflowResponse)
-async def get_workflow(workflow_id: str, db: AsyncSession = Depends(get_db)):
+async def get_workflow(
+    workflow_id: str,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    cache: WorkflowCache = Depends(get_workflow_cache),
+):
     """Get a specific workflow by ID."""
     try:
+        cache_key = cache.workflow_key(workflow_id)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+
         result = await db.execute(select(Workflow).where(Workflow.id == workflow_id))
         workflow = result.scalar_one_or_none()
 
@@ -128,7 +173,10 @@ async def get_workflow(workflow_id: str, db: AsyncSession = Depends(get_db)):
                 detail=f"Workflow {workflow_id} not found",
             )
 
-        return workflow
+        workflow_data = WorkflowResponse.model_validate(workflow).model_dump()
+        await cache.set(cache_key, workflow_data)
+        response.headers["X-Cache"] = "MISS"
+        return workflow_data
 
     except HTTPException:
         raise
@@ -145,14 +193,20 @@ async def execute_workflow(
     workflow_id: str,
     request: WorkflowExecuteRequest,
     db: AsyncSession = Depends(get_db),
+    queue: ArqRedis = Depends(get_workflow_queue),
 ):
-    """Execute a workflow."""
+    """Queue a workflow for execution by the background worker."""
     try:
-        # Get workflow from database
-        result = await db.execute(select(Workflow).where(Workflow.id == workflow_id))
-        workflow = result.scalar_one_or_none()
+        # Fetch the workflow and create the execution record in one transaction
+        # Only the columns needed to validate and size the execution are loaded
+        result = await db.execute(
+            select(Workflow.id, Workflow.steps, Workflow.is_active)
+            .where(Workflow.id == workflow_id)
+            .with_for_update(read=True)
+        )
+        workflow = result.first()
 
-        if not workflow:
+        if workflow is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Workflow {workflow_id} not found",
@@ -164,21 +218,38 @@ async def execute_workflow(
                 detail=f"Workflow {workflow_id} is not active",
             )
 
-        # Create execution record
-        execution = WorkflowExecution(
-            workflow_id=workflow_id,
-            status=DBWorkflowStatus.RUNNING,
-            input_data=request.input_data,
-            total_steps=len(workflow.steps),
+        # Create execution record, returning the populated row without a refresh
+        result = await db.execute(
+            insert(WorkflowExecution)
+            .values(
+                workflow_id=workflow_id,
+                status=DBWorkflowStatus.PENDING,
+                input_data=request.input_data,
+                total_steps=len(workflow.steps),
+            )
+            .returning(WorkflowExecution)
         )
-        db.add(execution)
+        execution = result.scalar_one()
         await db.commit()
-        await db.refresh(execution)
 
-        # TODO: Execute workflow asynchronously
-        # For now, just mark as pending
+        # Hand off to the worker so request latency is independent of step count
+        try:
+            await queue.enqueue_job(RUN_WORKFLOW_EXECUTION, execution.id)
+        except Exception as e:
+            # No worker will pick this execution up; don't leave it pending
+            await db.execute(
+                update(WorkflowExecution)
+                .where(WorkflowExecution.id == execution.id)
+                .values(
+                    status=DBWorkflowStatus.FAILED,
+                    error=f"Failed to queue execution: {e}",
+                    completed_at=datetime.utcnow(),
+                )
+            )
+            await db.commit()
+            raise
         logger.info(
-            "Workflow execution created",
+            "Workflow execution queued",
             workflow_id=workflow_id,
             execution_id=execution.id
         )
@@ -205,16 +276,30 @@ async def list_workflow_executions(
 ):
     """List executions for a workflow."""
     try:
-        query = select(WorkflowExecution).where(WorkflowExecution.workflow_id == workflow_id)
-
+        # Project only the response columns and stream rows instead of hydrating ORM objects
+        query = select(
+            WorkflowExecution.id,
+            WorkflowExecution.workflow_id,
+            WorkflowExecution.status,
+            WorkflowExecution.input_data,
+            WorkflowExecution.output_data,
+            WorkflowExecution.error,
+            WorkflowExecution.current_step,
+            WorkflowExecution.total_steps,
+        ).where(WorkflowExecution.workflow_id == workflow_id)
+
+        # Filters follow the (workflow_id, status, started_at DESC) index column order
+        # so the listing is served by an index scan instead of a sort
         if status_filter:
             query = query.where(WorkflowExecution.status == status_filter)
 
         query = query.order_by(WorkflowExecution.started_at.desc()).offset(skip).limit(limit)
-        result = await db.execute(query)
-        executions = result.scalars().all()
+        result = await db.stream(query.execution_options(yield_per=100))
 
-        return executions
+        return [
+            WorkflowExecutionResponse.model_validate(row)
+            async for row in result.mappings()
+        ]
 
     except Exception as e:
         logger.error("Failed to list workflow executions", workflow_id=workflow_id, error=str(e), exc_info=True)
@@ -225,20 +310,32 @@ async def list_workflow_executions(
 
 
 @router.delete("/{workflow_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_workflow(workflow_id: str, db: AsyncSession = Depends(get_db)):
+async def delete_workflow(
+    workflow_id: str,
+    db: AsyncSession = Depends(get_db),
+    cache: WorkflowCache = Depends(get_workflow_cache),
+):
     """Delete a workflow."""
     try:
-        result = await db.execute(select(Workflow).where(Workflow.id == workflow_id))
-        workflow = result.scalar_one_or_none()
+        # Bulk-delete dependents in place of the ORM cascade, which would load every row
+        execution_ids = select(WorkflowExecution.id).where(WorkflowExecution.workflow_id == workflow_id)
+        await db.execute(
+            delete(WorkflowStepExecution).where(WorkflowStepExecution.workflow_execution_id.in_(execution_ids))
+        )
+        await db.execute(delete(WorkflowExecution).where(WorkflowExecution.workflow_id == workflow_id))
 
-        if not workflow:
+        result = await db.execute(delete(Workflow).where(Workflow.id == workflow_id).returning(Workflow.id))
+        deleted = result.scalar_one_or_none()
+
+        if deleted is None:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Workflow {workflow_id} not found",
             )
 
-        await db.delete(workflow)
         await db.commit()
+        await cache.invalidate(workflow_id)
 
         logger.info("Workflow deleted", workflow_id=workflow_id)
 
@@ -1,12 +1,20 @@
 """Secrets providers for different backends."""
 
+import asyncio
 import os
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
-import hvac
 import boto3
+import hvac
+import hvac.exceptions
+import requests
+import structlog
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
+
+logger = structlog.get_logger(__name__)
 
 
 class SecretsProvider(ABC):
@@ -14,7 +22,11 @@ class SecretsProvider(ABC):
 
     @abstractmethod
     async def get_secret(self, key: str, default: Any = None) -> Optional[str]:
-        """Get a secret value."""
+        """Get a secret value.
+
+        Returns ``default`` only when the secret does not exist; errors
+        reaching the backend are raised so callers can tell them apart.
+        """
         pass
 
     @abstractmethod
@@ -73,29 +85,37 @@ class VaultProvider(SecretsProvider):
         self.client = None
 
         if self.token:
-            self.client = hvac.Client(url=url, token=self.token)
+            self.client = self._build_client()
+
+    def _build_client(self) -> hvac.Client:
+        """Create a Vault client backed by a pooled keep-alive HTTP session."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return hvac.Client(url=self.url, token=self.token, session=session)
 
     async def _ensure_client(self):
         """Ensure Vault client is initialized."""
         if self.client is None:
             if not self.token:
                 raise ValueError("Vault token not provided")
-            self.client = hvac.Client(url=self.url, token=self.token)
+            self.client = self._build_client()
 
         if not self.client.is_authenticated():
             raise ValueError("Vault client not authenticated")
 
     async def get_secret(self, key: str, default: Any = None) -> Optional[str]:
         """Get secret from Vault."""
+        await self._ensure_client()
         try:
-            await self._ensure_client()
             response = self.client.secrets.kv.v2.read_secret_version(
                 path=key,
                 mount_point=self.mount_point
             )
-            return response["data"]["data"].get(key.split("/")[-1])
-        except Exception:
+        except hvac.exceptions.InvalidPath:
             return default
+        return response["data"]["data"].get(key.split("/")[-1], default)
 
     async def set_secret(self, key: str, value: str) -> None:
         """Set secret in Vault."""
@@ -129,57 +149,98 @@ class VaultProvider(SecretsProvider):
                 if value:
                     secrets[full_key] = value
             return secrets
-        except Exception:
+        except Exception as e:
+            logger.warning("Failed to list Vault secrets", prefix=prefix, error=str(e))
             return {}
 
 
+# Secrets Manager clients shared per region (boto3 clients are thread-safe)
+_AWS_CLIENTS: Dict[str, Any] = {}
+
+
+def _get_aws_client(region_name: str) -> Any:
+    """Get the shared Secrets Manager client for a region, creating it once."""
+    client = _AWS_CLIENTS.get(region_name)
+    if client is None:
+        client = boto3.client(
+            "secretsmanager",
+            region_name=region_name,
+            config=Config(
+                max_pool_connections=50,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
+        _AWS_CLIENTS[region_name] = client
+    return client
+
+
 class AWSSecretsProvider(SecretsProvider):
-    """AWS Secrets Manager provider."""
+    """AWS Secrets Manager provider.
+
+    boto3 is synchronous, so every API call runs in a worker thread via
+    ``asyncio.to_thread`` to keep the event loop responsive.
+    """
+
+    # Maximum SecretIdList size accepted by BatchGetSecretValue
+    BATCH_GET_MAX_IDS = 20
 
     def __init__(self, region_name: str = "us-east-1", **kwargs):
         self.region_name = region_name
-        self.client = boto3.client("secretsmanager", region_name=region_name)
+        self.client = _get_aws_client(region_name)
 
     async def get_secret(self, key: str, default: Any = None) -> Optional[str]:
         """Get secret from AWS Secrets Manager."""
         try:
-            response = self.client.get_secret_value(SecretId=key)
+            response = await asyncio.to_thread(self.client.get_secret_value, SecretId=key)
             return response["SecretString"]
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceNotFoundException":
                 return default
             raise
-        except Exception:
-            return default
 
     async def set_secret(self, key: str, value: str) -> None:
         """Set secret in AWS Secrets Manager."""
         try:
             # Try to update existing secret
-            self.client.update_secret(SecretId=key, SecretString=value)
+            await asyncio.to_thread(self.client.update_secret, SecretId=key, SecretString=value)
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceNotFoundException":
                 # Create new secret
-                self.client.create_secret(Name=key, SecretString=value)
+                await asyncio.to_thread(self.client.create_secret, Name=key, SecretString=value)
             else:
                 raise
 
     async def delete_secret(self, key: str) -> None:
         """Delete secret from AWS Secrets Manager."""
-        self.client.delete_secret(SecretId=key, ForceDeleteWithoutRecovery=True)
+        await asyncio.to_thread(
+            self.client.delete_secret, SecretId=key, ForceDeleteWithoutRecovery=True
+        )
 
     async def list_secrets(self, prefix: str = "") -> Dict[str, str]:
-        """List secrets with prefix."""
-        secrets = {}
+        """List secrets with prefix.
+
+        Values are fetched with BatchGetSecretValue in chunks of
+        ``BATCH_GET_MAX_IDS`` names instead of one call per secret.
+        """
         paginator = self.client.get_paginator("list_secrets")
+        pages = await asyncio.to_thread(lambda: list(paginator.paginate()))
+        names = [
+            secret["Name"]
+            for page in pages
+            for secret in page["SecretList"]
+            if secret["Name"].startswith(prefix)
+        ]
 
-        for page in paginator.paginate():
-            for secret in page["SecretList"]:
-                name = secret["Name"]
-                if name.startswith(prefix):
-                    value = await self.get_secret(name)
-                    if value:
-                        secrets[name] = value
+        secrets = {}
+        for i in range(0, len(names), self.BATCH_GET_MAX_IDS):
+            response = await asyncio.to_thread(
+                self.client.batch_get_secret_value,
+                SecretIdList=names[i:i + self.BATCH_GET_MAX_IDS],
+            )
+            for secret in response["SecretValues"]:
+                value = secret.get("SecretString")
+                if value:
+                    secrets[secret["Name"]] = value
 
         return secrets
 
@@ -1,71 +1,146 @@
 """Secrets manager with multiple provider support."""
 
+import asyncio
 import os
-from typing import Any, Dict, List, Optional
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import structlog
 
 from ..config import get_settings
 from .providers import SecretsProvider, EnvProvider, VaultProvider, AWSSecretsProvider
 
+logger = structlog.get_logger(__name__)
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
 
 class SecretsManager:
-    """Central secrets management with fallback providers."""
+    """Central secrets management with fallback providers.
 
-    def __init__(self):
+    Resolved secrets are cached in-process for ``cache_ttl`` seconds so hot
+    lookups don't round-trip to Vault or AWS on every call. Secrets no
+    provider has are remembered for ``miss_ttl`` seconds, and lookups where a
+    provider failed are not cached at all.
+    """
+
+    def __init__(self, cache_ttl: float = 300, miss_ttl: float = 10, max_concurrency: int = 4):
         self.settings = get_settings()
         self.providers: Dict[str, SecretsProvider] = {}
         self.provider_priority: List[str] = []
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        # key -> (expiry on the monotonic clock, value or None for a miss)
+        self._cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._cache_ttl = cache_ttl
+        self._miss_ttl = miss_ttl
+        self._key_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Bumped by invalidate_cache, so a fetch that started before a write
+        # or delete does not cache the value it read
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._cache_epoch = 0
+        self.max_concurrency = max_concurrency
 
     async def initialize(self) -> None:
         """Initialize secrets providers."""
         if self._initialized:
             return
 
-        # Environment provider (always available as fallback)
-        self.providers["env"] = EnvProvider()
-
-        # Vault provider
-        vault_url = os.getenv("VAULT_URL")
-        vault_token = os.getenv("VAULT_TOKEN")
-        if vault_url and vault_token:
-            try:
-                self.providers["vault"] = VaultProvider(
-                    url=vault_url,
-                    token=vault_token
-                )
-                self.provider_priority.insert(0, "vault")
-            except Exception as e:
-                print(f"Failed to initialize Vault provider: {e}")
-
-        # AWS Secrets Manager
-        aws_region = os.getenv("AWS_REGION", "us-east-1")
-        if os.getenv("AWS_ACCESS_KEY_ID") or os.getenv("AWS_PROFILE"):
-            try:
-                self.providers["aws"] = AWSSecretsProvider(region_name=aws_region)
-                self.provider_priority.insert(0, "aws")
-            except Exception as e:
-                print(f"Failed to initialize AWS provider: {e}")
-
-        # Add env as lowest priority
-        self.provider_priority.append("env")
-        self._initialized = True
+        async with self._init_lock:
+            # Another caller may have finished initializing while we waited
+            if self._initialized:
+                return
+
+            # Environment provider (always available as fallback)
+            self.providers["env"] = EnvProvider()
+
+            # Vault provider
+            vault_url = os.getenv("VAULT_URL")
+            vault_token = os.getenv("VAULT_TOKEN")
+            if vault_url and vault_token:
+                try:
+                    self.providers["vault"] = VaultProvider(
+                        url=vault_url,
+                        token=vault_token
+                    )
+                    self.provider_priority.insert(0, "vault")
+                except Exception as e:
+                    logger.warning("Failed to initialize Vault provider", error=str(e))
+
+            # AWS Secrets Manager
+            aws_region = os.getenv("AWS_REGION", "us-east-1")
+            if os.getenv("AWS_ACCESS_KEY_ID") or os.getenv("AWS_PROFILE"):
+                try:
+                    self.providers["aws"] = AWSSecretsProvider(region_name=aws_region)
+                    self.provider_priority.insert(0, "aws")
+                except Exception as e:
+                    logger.warning("Failed to initialize AWS provider", error=str(e))
+
+            # Add env as lowest priority
+            self.provider_priority.append("env")
+            self._initialized = True
 
     async def get_secret(self, key: str, default: Any = None) -> Optional[str]:
         """Get secret from the highest priority provider that has it."""
         await self.initialize()
 
+        value = self._get_cached(key)
+        if value is not _MISSING:
+            return default if value is None else value
+
+        # One fetch per key on a cold cache; concurrent callers wait for it
+        async with self._key_locks[key]:
+            value = self._get_cached(key)
+            if value is _MISSING:
+                generation = (self._cache_epoch, self._generations[key])
+                value, complete = await self._fetch_secret(key)
+                if complete and generation == (self._cache_epoch, self._generations[key]):
+                    ttl = self._miss_ttl if value is None else self._cache_ttl
+                    self._cache[key] = (time.monotonic() + ttl, value)
+
+        return default if value is None else value
+
+    async def _fetch_secret(self, key: str) -> Tuple[Optional[str], bool]:
+        """Look up a secret across providers in priority order.
+
+        Returns:
+            Tuple of (value or None, whether every provider consulted answered
+            without error); only complete lookups are safe to cache
+        """
+        complete = True
         for provider_name in self.provider_priority:
             provider = self.providers.get(provider_name)
             if provider:
                 try:
                     value = await provider.get_secret(key)
                     if value is not None:
-                        return value
+                        return value, complete
                 except Exception as e:
-                    print(f"Error getting secret from {provider_name}: {e}")
-                    continue
-
-        return default
+                    logger.warning("Error getting secret", provider=provider_name, error=str(e))
+                    complete = False
+
+        return None, complete
+
+    def _get_cached(self, key: str) -> Any:
+        """Return a fresh cached value for key, or _MISSING."""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return _MISSING
+
+    def invalidate_cache(self, key: Optional[str] = None) -> None:
+        """Drop a cached secret, or the whole cache if no key is given.
+
+        Lookups already in flight for the key will not cache their result.
+        """
+        if key is None:
+            self._cache.clear()
+            self._cache_epoch += 1
+        else:
+            self._cache.pop(key, None)
+            self._generations[key] += 1
 
     async def set_secret(self, key: str, value: str, provider: str = "auto") -> None:
         """Set secret in specified provider (or auto-select)."""
@@ -79,35 +154,41 @@ class SecretsManager:
                     if provider_obj:
                         try:
                             await provider_obj.set_secret(key, value)
+                            self.invalidate_cache(key)
                             return
                         except Exception as e:
-                            print(f"Failed to set secret in {provider_name}: {e}")
+                            logger.warning("Failed to set secret", provider=provider_name, error=str(e))
                             continue
 
             # Fallback to env
             await self.providers["env"].set_secret(key, value)
+            self.invalidate_cache(key)
 
         else:
             provider_obj = self.providers.get(provider)
             if not provider_obj:
                 raise ValueError(f"Provider {provider} not available")
             await provider_obj.set_secret(key, value)
+            self.invalidate_cache(key)
 
     async def delete_secret(self, key: str, provider: str = "all") -> None:
         """Delete secret from providers."""
         await self.initialize()
 
         if provider == "all":
-            for provider_obj in self.providers.values():
-                try:
-                    await provider_obj.delete_secret(key)
-                except Exception as e:
-                    print(f"Failed to delete secret from provider: {e}")
+            results = await self._gather_providers(
+                lambda provider_obj: provider_obj.delete_secret(key)
+            )
+            for provider_name, result in zip(self.providers, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to delete secret from provider", provider=provider_name, error=str(result))
         else:
             provider_obj = self.providers.get(provider)
             if provider_obj:
                 await provider_obj.delete_secret(key)
 
+        self.invalidate_cache(key)
+
     async def list_secrets(self, prefix: str = "", provider: str = "auto") -> Dict[str, str]:
         """List secrets with prefix."""
         await self.initialize()
@@ -115,12 +196,14 @@ class SecretsManager:
         if provider == "auto":
             # Merge secrets from all providers
             all_secrets = {}
-            for provider_obj in self.providers.values():
-                try:
-                    provider_secrets = await provider_obj.list_secrets(prefix)
-                    all_secrets.update(provider_secrets)
-                except Exception as e:
-                    print(f"Failed to list secrets from provider: {e}")
+            results = await self._gather_providers(
+                lambda provider_obj: provider_obj.list_secrets(prefix)
+            )
+            for provider_name, result in zip(self.providers, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to list secrets from provider", provider=provider_name, error=str(result))
+                else:
+                    all_secrets.update(result)
 
             return all_secrets
         else:
@@ -129,6 +212,24 @@ class SecretsManager:
                 return await provider_obj.list_secrets(prefix)
             return {}
 
+    async def _gather_providers(
+        self, call: Callable[[SecretsProvider], Awaitable[Any]]
+    ) -> List[Any]:
+        """Run call against every provider concurrently, in provider order.
+
+        Exceptions are returned in place of results rather than raised.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run(provider_obj: SecretsProvider) -> Any:
+            async with semaphore:
+                return await call(provider_obj)
+
+        return await asyncio.gather(
+            *(_run(provider_obj) for provider_obj in self.providers.values()),
+            return_exceptions=True,
+        )
+
     def get_provider_status(self) -> Dict[str, Any]:
         """Get status of all providers."""
         return {
@@ -3,9 +3,12 @@
 import asyncio
 import time
 from typing import Any, Dict, List, Optional, Callable
+
+import orjson
 import pytest
 
 from ..agents.base import BaseAgent, AgentConfig, AgentResult
+from ..agents.task import TaskAgent
 from .llm_mocker import LLMMocker
 
 
@@ -59,7 +62,7 @@ class TestResult:
             "passed": self.passed,
             "execution_time": self.execution_time,
             "failure_reason": self.failure_reason,
-            "result": self.result.dict() if self.result else None,
+            "result": self.result.model_dump(mode="json") if self.result else None,
             "expected_success": self.scenario.expected_success,
             "expected_error": self.scenario.expected_error,
         }
@@ -68,12 +71,21 @@ class TestResult:
 class AgentTester:
     """Test runner for agents."""
 
-    def __init__(self, agent_class: type, agent_config: Optional[AgentConfig] = None):
+    def __init__(
+        self,
+        agent_class: type,
+        agent_config: Optional[AgentConfig] = None,
+        max_concurrency: int = 8,
+    ):
         self.agent_class = agent_class
         self.agent_config = agent_config or AgentConfig(name="test_agent")
+        self.max_concurrency = max_concurrency
         self.llm_mocker = LLMMocker()
         self.test_scenarios: List[TestScenario] = []
         self.test_results: List[TestResult] = []
+        # Agents are reused across scenarios; at most max_concurrency are created
+        self._agent_pool: asyncio.Queue[BaseAgent] = asyncio.Queue()
+        self._agents_created = 0
 
     def add_scenario(self, scenario: TestScenario) -> None:
         """Add a test scenario."""
@@ -101,17 +113,36 @@ class AgentTester:
         # For now, we'll assume the agent accepts an llm_provider parameter
         pass
 
+    async def _acquire_agent(self) -> BaseAgent:
+        """Take an idle agent from the pool, creating one if the pool isn't full."""
+        if self._agent_pool.empty() and self._agents_created < self.max_concurrency:
+            self._agents_created += 1
+            try:
+                return self.agent_class(self.agent_config)
+            except Exception:
+                self._agents_created -= 1
+                raise
+        return await self._agent_pool.get()
+
+    def _release_agent(self, agent: BaseAgent) -> None:
+        """Return an agent to the pool, resetting it if it supports reset()."""
+        reset = getattr(agent, "reset", None)
+        if callable(reset):
+            reset()
+        self._agent_pool.put_nowait(agent)
+
     async def run_test_scenario(self, scenario: TestScenario) -> TestResult:
         """Run a single test scenario."""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        agent = None
 
         try:
             # Setup
             if scenario.setup_func:
                 await scenario.setup_func()
 
-            # Create agent instance
-            agent = self.agent_class(self.agent_config)
+            # Reuse a pooled agent instance
+            agent = await self._acquire_agent()
 
             # Run agent
             timeout = scenario.timeout or 30.0
@@ -120,7 +151,7 @@ class AgentTester:
                 timeout=timeout
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             # Validate result
             passed = self._validate_result(scenario, result)
@@ -135,7 +166,7 @@ class AgentTester:
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_result = AgentResult(
                 success=False,
                 error=f"Test execution failed: {str(e)}",
@@ -151,6 +182,9 @@ class AgentTester:
             )
 
         finally:
+            if agent is not None:
+                self._release_agent(agent)
+
             # Teardown
             if scenario.teardown_func:
                 try:
@@ -161,12 +195,20 @@ class AgentTester:
         return test_result
 
     async def run_all_tests(self) -> List[TestResult]:
-        """Run all test scenarios."""
-        self.test_results.clear()
+        """Run all test scenarios concurrently, at most max_concurrency at a time.
+
+        Results keep scenario order. Use max_concurrency=1 for scenarios whose
+        setup/teardown functions share state and must not overlap.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        for scenario in self.test_scenarios:
-            result = await self.run_test_scenario(scenario)
-            self.test_results.append(result)
+        async def _run(scenario: TestScenario) -> TestResult:
+            async with semaphore:
+                return await self.run_test_scenario(scenario)
+
+        self.test_results = list(
+            await asyncio.gather(*(_run(scenario) for scenario in self.test_scenarios))
+        )
 
         return self.test_results
 
@@ -188,6 +230,13 @@ class AgentTester:
             "average_execution_time": average_execution_time,
         }
 
+    def to_json_report(self) -> bytes:
+        """Serialize all test results to a JSON report."""
+        return orjson.dumps(
+            [result.to_dict() for result in self.test_results],
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
     def get_failed_tests(self) -> List[TestResult]:
         """Get failed test results."""
         return [result for result in self.test_results if not result.passed]
@@ -232,20 +281,26 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "agent_test: mark test as agent test")
 
 
+def _create_tester(agent_class=None, config=None) -> AgentTester:
+    """Create an AgentTester, defaulting to TaskAgent."""
+    return AgentTester(agent_class or TaskAgent, config)
+
+
 @pytest.fixture
 def agent_tester():
     """Pytest fixture for agent testing."""
-    from ..agents.task import TaskAgent
+    return _create_tester
 
-    def _create_tester(agent_class=None, config=None):
-        agent_class = agent_class or TaskAgent
-        return AgentTester(agent_class, config)
 
-    return _create_tester
+@pytest.fixture(scope="session")
+def _shared_llm_mocker():
+    """Single LLMMocker constructed once per test session."""
+    return LLMMocker()
 
 
 @pytest.fixture
-def llm_mocker():
-    """Pytest fixture for LLM mocking."""
-    return LLMMocker()
+def llm_mocker(_shared_llm_mocker):
+    """Pytest fixture for LLM mocking, reset before each test."""
+    _shared_llm_mocker.reset()
+    return _shared_llm_mocker
 
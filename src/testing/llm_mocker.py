@@ -1,11 +1,19 @@
 """LLM response mocking for testing."""
 
 import re
-from typing import Any, Dict, List, Optional, Pattern, Union
+from collections import Counter
+from time import time as _now
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 from unittest.mock import AsyncMock, MagicMock
 
 from ..llm.base import LLMResponse
 
+# Flags of patterns compiled by MockResponse, which can be merged into one regex
+_COMBINED_FLAGS = re.compile("", re.IGNORECASE).flags
+
+# Compiled input patterns shared across MockResponse instances, keyed by (pattern, flags)
+_PATTERN_CACHE: Dict[Tuple[str, int], Pattern] = {}
+
 
 class MockResponse:
     """Mock LLM response with pattern matching."""
@@ -34,9 +42,13 @@ class MockResponse:
         self.kwargs_pattern = kwargs_pattern
 
     def _compile_pattern(self, pattern: Optional[Union[str, Pattern]]) -> Optional[Pattern]:
-        """Compile string pattern to regex."""
+        """Compile string pattern to regex, reusing previously compiled patterns."""
         if isinstance(pattern, str):
-            return re.compile(pattern, re.IGNORECASE)
+            key = (pattern, re.IGNORECASE)
+            compiled = _PATTERN_CACHE.get(key)
+            if compiled is None:
+                compiled = _PATTERN_CACHE[key] = re.compile(pattern, re.IGNORECASE)
+            return compiled
         return pattern
 
     def matches(
@@ -78,14 +90,31 @@ class MockResponse:
 class LLMMocker:
     """Mock LLM provider for testing."""
 
-    def __init__(self):
+    def __init__(self, record_history: bool = True, compact_history: bool = False):
+        """Initialize the mocker.
+
+        Args:
+            record_history: Record every call in call_history. Tests that only
+                assert call counts can disable this to skip building the records.
+            compact_history: For chat calls, record the message count and last
+                user message instead of keeping a reference to the full list.
+        """
         self.mock_responses: List[MockResponse] = []
+        self.record_history = record_history
+        self.compact_history = compact_history
         self.call_history: List[Dict[str, Any]] = []
+        self._call_counts: Counter = Counter()
         self.default_response = MockResponse("This is a default mock response.")
+        # Combined input-pattern regex, rebuilt lazily when responses change
+        self._combined: Optional[Pattern] = None
+        self._combined_size = 0
+        self._index_by_group: Dict[str, int] = {}
+        self._fallback_indices: List[int] = []
 
     def add_response(self, mock_response: MockResponse) -> None:
         """Add a mock response."""
         self.mock_responses.append(mock_response)
+        self._combined = None
 
     def add_simple_response(
         self,
@@ -107,13 +136,68 @@ class LLMMocker:
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> MockResponse:
-        """Find the first matching mock response."""
-        for mock_response in self.mock_responses:
+        """Find the first matching mock response.
+
+        Mocks constrained only by a plain input pattern are matched with one
+        search of a combined regex; the rest are checked individually, and the
+        earliest registered match wins either way.
+        """
+        if self._combined is None or self._combined_size != len(self.mock_responses):
+            self._build_combined_pattern()
+
+        combined_index = len(self.mock_responses)
+        if self._combined is not None:
+            match = self._combined.match(prompt)
+            if match:
+                combined_index = self._index_by_group[match.lastgroup]
+
+        for index in self._fallback_indices:
+            if index > combined_index:
+                break
+            mock_response = self.mock_responses[index]
             if mock_response.matches(prompt, system_prompt, **kwargs):
                 return mock_response
 
+        if combined_index < len(self.mock_responses):
+            return self.mock_responses[combined_index]
         return self.default_response
 
+    def _build_combined_pattern(self) -> None:
+        """Merge eligible input patterns into one alternation of named lookaheads.
+
+        Each alternative is a lookahead anchored at the start of the prompt, so
+        alternatives are tried in registration order rather than by match position.
+        """
+        alternatives = []
+        self._index_by_group = {}
+        self._fallback_indices = []
+
+        for index, mock_response in enumerate(self.mock_responses):
+            pattern = mock_response.input_pattern
+            combinable = (
+                mock_response.system_prompt_pattern is None
+                and not mock_response.kwargs_pattern
+                and (pattern is None or (pattern.groups == 0 and pattern.flags == _COMBINED_FLAGS))
+            )
+            if not combinable:
+                self._fallback_indices.append(index)
+                continue
+
+            group = f"m{index}"
+            body = rf"[\s\S]*?(?:{pattern.pattern})" if pattern is not None else ""
+            alternatives.append(f"(?P<{group}>(?={body}))")
+            self._index_by_group[group] = index
+
+        self._combined = None
+        if alternatives:
+            try:
+                self._combined = re.compile("|".join(alternatives), re.IGNORECASE)
+            except re.error:
+                # Patterns that can't be embedded (e.g. global inline flags) use the loop
+                self._index_by_group = {}
+                self._fallback_indices = list(range(len(self.mock_responses)))
+        self._combined_size = len(self.mock_responses)
+
     async def generate(
         self,
         prompt: str,
@@ -122,13 +206,15 @@ class LLMMocker:
     ) -> LLMResponse:
         """Mock generate method."""
         # Record the call
-        self.call_history.append({
-            "method": "generate",
-            "prompt": prompt,
-            "system_prompt": system_prompt,
-            "kwargs": kwargs,
-            "timestamp": self._get_timestamp(),
-        })
+        self._call_counts["generate"] += 1
+        if self.record_history:
+            self.call_history.append({
+                "method": "generate",
+                "prompt": prompt,
+                "system_prompt": system_prompt,
+                "kwargs": kwargs,
+                "timestamp": _now(),
+            })
 
         # Find matching response
         mock_response = self.find_matching_response(prompt, system_prompt, **kwargs)
@@ -140,22 +226,33 @@ class LLMMocker:
         **kwargs: Any,
     ) -> LLMResponse:
         """Mock chat method."""
-        # Convert messages to prompt for pattern matching
-        prompt = " ".join([msg.get("content", "") for msg in messages if msg.get("role") == "user"])
-        system_prompt = next(
-            (msg.get("content", "") for msg in messages if msg.get("role") == "system"),
-            None
-        )
+        # Convert messages to prompt for pattern matching in a single pass
+        system_prompt = None
+        user_contents = []
+        for msg in messages:
+            role = msg.get("role")
+            if role == "user":
+                user_contents.append(msg.get("content", ""))
+            elif role == "system" and system_prompt is None:
+                system_prompt = msg.get("content", "")
+        prompt = " ".join(user_contents)
 
         # Record the call
-        self.call_history.append({
-            "method": "chat",
-            "messages": messages,
-            "prompt": prompt,
-            "system_prompt": system_prompt,
-            "kwargs": kwargs,
-            "timestamp": self._get_timestamp(),
-        })
+        self._call_counts["chat"] += 1
+        if self.record_history:
+            record = {
+                "method": "chat",
+                "prompt": prompt,
+                "system_prompt": system_prompt,
+                "kwargs": kwargs,
+                "timestamp": _now(),
+            }
+            if self.compact_history:
+                record["message_count"] = len(messages)
+                record["last_user_message"] = user_contents[-1] if user_contents else None
+            else:
+                record["messages"] = messages
+            self.call_history.append(record)
 
         # Find matching response
         mock_response = self.find_matching_response(prompt, system_prompt, **kwargs)
@@ -174,6 +271,14 @@ class LLMMocker:
         for word in words:
             yield word + " "
 
+    def reset(self) -> None:
+        """Drop all mock responses and call history, restoring the default response."""
+        self.mock_responses.clear()
+        self._combined = None
+        self.call_history.clear()
+        self._call_counts.clear()
+        self.default_response = MockResponse("This is a default mock response.")
+
     def get_call_history(self) -> List[Dict[str, Any]]:
         """Get call history."""
         return self.call_history.copy()
@@ -181,17 +286,13 @@ class LLMMocker:
     def clear_call_history(self) -> None:
         """Clear call history."""
         self.call_history.clear()
+        self._call_counts.clear()
 
     def get_call_count(self, method: Optional[str] = None) -> int:
         """Get call count for a method."""
         if method:
-            return sum(1 for call in self.call_history if call["method"] == method)
-        return len(self.call_history)
-
-    def _get_timestamp(self) -> float:
-        """Get current timestamp."""
-        import time
-        return time.time()
+            return self._call_counts[method]
+        return sum(self._call_counts.values())
 
     def create_mock_provider(self):
         """Create a mock provider instance."""
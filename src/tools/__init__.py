@@ -1,7 +1,7 @@
 """Tools system for AI automation."""
 
 from .base import Tool, ToolResult, ToolConfig
-from .registry import ToolRegistry, register_tool, get_tool
+from .registry import ToolRegistry, register_tool, get_tool, close_tools
 from .web_scraper import WebScraperTool
 from .email_tool import EmailTool
 from .api_tool import APITool
@@ -14,6 +14,7 @@ __all__ = [
     "ToolRegistry",
     "register_tool",
     "get_tool",
+    "close_tools",
     "WebScraperTool",
     "EmailTool",
     "APITool",
@@ -2,12 +2,15 @@
 
 from typing import Dict, Optional, Any
 import httpx
+import orjson
 import structlog
 
 from .base import Tool, ToolResult, ToolConfig
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_MAX_BYTES = 1024 * 1024  # 1MB cap for non-JSON response bodies
+
 
 class APITool(Tool):
     """Tool for making API requests."""
@@ -20,6 +23,52 @@ class APITool(Tool):
         """
         super().__init__(config)
         self.logger = logger.bind(tool="api")
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive across calls instead of
+        paying a TCP/TLS handshake for every request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    async def _read_body(response: httpx.Response, max_bytes: int) -> tuple:
+        """Read a streamed response body.
+
+        JSON bodies are read in full and parsed with orjson. Other bodies are
+        read up to ``max_bytes`` so a misbehaving endpoint cannot exhaust memory.
+
+        Returns:
+            Tuple of (parsed data or text, whether the body was truncated)
+        """
+        if "json" in response.headers.get("content-type", ""):
+            content = await response.aread()
+            try:
+                return orjson.loads(content), False
+            except orjson.JSONDecodeError:
+                return content.decode(response.encoding or "utf-8", errors="replace"), False
+
+        buf = bytearray()
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            buf.extend(chunk)
+            if len(buf) > max_bytes:
+                truncated = True
+                del buf[max_bytes:]
+                break
+        return buf.decode(response.encoding or "utf-8", errors="replace"), truncated
 
     async def execute(
         self,
@@ -31,6 +80,8 @@ class APITool(Tool):
         data: Dict[str, Any] = None,
         timeout: int = 30,
         auth: tuple = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        include_headers: bool = False,
     ) -> ToolResult:
         """Make an API request.
 
@@ -43,6 +94,8 @@ class APITool(Tool):
             data: Form data
             timeout: Request timeout in seconds
             auth: Basic auth tuple (username, password)
+            max_bytes: Maximum number of bytes to read from a non-JSON body
+            include_headers: Copy the response headers into the result
 
         Returns:
             API response
@@ -50,54 +103,53 @@ class APITool(Tool):
         try:
             self.logger.info("Making API request", url=url, method=method)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method.upper(),
+            client = self._get_client()
+            request = client.build_request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                timeout=timeout,
+            )
+            response = await client.send(request, auth=auth, stream=True)
+            try:
+                response_data, truncated = await self._read_body(response, max_bytes)
+            finally:
+                await response.aclose()
+
+            result_data = {
+                'status_code': response.status_code,
+                'headers': dict(response.headers) if include_headers else None,
+                'data': response_data,
+                'url': str(response.url),
+                'truncated': truncated,
+            }
+
+            # Check if request was successful
+            if response.is_success:
+                self.logger.info(
+                    "API request successful",
                     url=url,
-                    headers=headers,
-                    params=params,
-                    json=json,
-                    data=data,
-                    timeout=timeout,
-                    auth=auth,
+                    status_code=response.status_code,
+                )
+                return ToolResult(
+                    success=True,
+                    data=result_data,
+                    metadata={'method': method, 'status_code': response.status_code},
+                )
+            else:
+                self.logger.warning(
+                    "API request failed",
+                    url=url,
+                    status_code=response.status_code,
+                )
+                return ToolResult(
+                    success=False,
+                    error=f"API request failed with status {response.status_code}",
+                    data=result_data,
                 )
-
-                # Try to parse JSON response
-                try:
-                    response_data = response.json()
-                except Exception:
-                    response_data = response.text
-
-                result_data = {
-                    'status_code': response.status_code,
-                    'headers': dict(response.headers),
-                    'data': response_data,
-                    'url': str(response.url),
-                }
-
-                # Check if request was successful
-                if response.is_success:
-                    self.logger.info(
-                        "API request successful",
-                        url=url,
-                        status_code=response.status_code,
-                    )
-                    return ToolResult(
-                        success=True,
-                        data=result_data,
-                        metadata={'method': method, 'status_code': response.status_code},
-                    )
-                else:
-                    self.logger.warning(
-                        "API request failed",
-                        url=url,
-                        status_code=response.status_code,
-                    )
-                    return ToolResult(
-                        success=False,
-                        error=f"API request failed with status {response.status_code}",
-                        data=result_data,
-                    )
 
         except Exception as e:
             self.logger.error("API request error", url=url, error=str(e))
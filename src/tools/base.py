@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import time
 
 
@@ -24,7 +24,7 @@ class ToolResult(BaseModel):
     data: Optional[Any] = None
     error: Optional[str] = None
     execution_time: float = 0.0
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class Tool(ABC):
@@ -73,6 +73,10 @@ class Tool(ABC):
                 execution_time=time.time() - start_time,
             )
 
+    async def aclose(self) -> None:
+        """Release resources held by the tool (connections, browsers, etc.)."""
+        pass
+
     def validate_input(self, **kwargs) -> bool:
         """Validate tool input.
 
@@ -1,6 +1,13 @@
 """Data processing tool."""
 
-from typing import Any, Dict, List
+import csv
+import io
+import operator
+import os
+import re
+from typing import Any, Callable, Dict, List
+import numpy as np
+import orjson
 import pandas as pd
 import structlog
 
@@ -8,10 +15,227 @@ from .base import Tool, ToolResult, ToolConfig
 
 logger = structlog.get_logger(__name__)
 
+# Named column transforms, applied to the whole Series in one vectorized call
+_NAMED_TRANSFORMS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    "log": np.log,
+    "log1p": np.log1p,
+    "log10": np.log10,
+    "exp": np.exp,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+    "round": np.round,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "upper": lambda s: s.str.upper(),
+    "lower": lambda s: s.str.lower(),
+    "strip": lambda s: s.str.strip(),
+    "title": lambda s: s.str.title(),
+    "len": lambda s: s.str.len(),
+}
+
+# Arithmetic shorthand such as "*2", "+ 1.5" or "/100"
+_ARITHMETIC_TRANSFORM = re.compile(r"^\s*([*/+\-])\s*(-?\d+(?:\.\d+)?)\s*$")
+_ARITHMETIC_OPS = {
+    "*": operator.mul,
+    "/": operator.truediv,
+    "+": operator.add,
+    "-": operator.sub,
+}
+
+
+def _named_transform(series: pd.Series, name: str) -> pd.Series:
+    """Apply a string-named transform to a column without a per-row Python call."""
+    transform = _NAMED_TRANSFORMS.get(name)
+    if transform is not None:
+        return transform(series)
+
+    match = _ARITHMETIC_TRANSFORM.match(name)
+    if match:
+        op, operand = match.groups()
+        return _ARITHMETIC_OPS[op](series, float(operand))
+
+    raise ValueError(f"Unknown transformation: {name}")
+
+
+def _vectorized_apply(series: pd.Series, func: Callable) -> pd.Series:
+    """Call func on the whole column, falling back to per-row apply.
+
+    Works for element-wise functions such as ``lambda x: x * 2``; functions that
+    fail on a Series or do not return one value per row are applied row by row.
+    """
+    try:
+        result = func(series)
+    except Exception:
+        return series.apply(func)
+    if isinstance(result, (pd.Series, np.ndarray)) and len(result) == len(series):
+        return result
+    return series.apply(func)
+
+
+# Object columns with fewer distinct values than this share of rows become categorical
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _categorize(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Convert low-cardinality string columns to ``category`` dtype.
+
+    Categoricals store integer codes instead of one Python object per row, which
+    cuts memory and lets groupby hash small integers instead of strings.
+    """
+    converted = None
+    for column in columns:
+        series = df[column]
+        is_text = series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+        if not is_text or not len(series):
+            continue
+        if series.nunique() / len(series) < CATEGORY_MAX_UNIQUE_RATIO:
+            if converted is None:
+                # Shallow copy so a caller-supplied DataFrame is not modified in place
+                converted = df.copy(deep=False)
+            converted[column] = series.astype("category")
+    return df if converted is None else converted
+
+
+def _is_records(data: Any) -> bool:
+    """Check whether data is a non-empty list of dicts (pandas "records" form)."""
+    return isinstance(data, list) and bool(data) and all(isinstance(row, dict) for row in data)
+
+
+def _records_to_csv(records: List[Dict[str, Any]]) -> str:
+    """Write records as CSV without building a DataFrame."""
+    # Columns in first-seen order, matching pd.DataFrame(records).columns
+    fieldnames = list(dict.fromkeys(key for row in records for key in row))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator=os.linesep)
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue()
+
+
+# Serialization operations that can skip pandas entirely when the input is
+# already a list of records and the requested output is records-shaped
+_RECORDS_FAST_PATHS = {
+    "to_dict": lambda records, **kwargs: records,
+    "to_json": lambda records, **kwargs: orjson.dumps(records).decode(),
+    "to_csv": lambda records, **kwargs: _records_to_csv(records),
+}
+
+
+def _records_fast_path(operation: str, data: Any, **kwargs) -> Any:
+    """Return the fast-path handler for this call, or None if pandas is needed."""
+    handler = _RECORDS_FAST_PATHS.get(operation)
+    if handler is None or not _is_records(data):
+        return None
+    if operation == "to_csv":
+        if kwargs.get("index", False):
+            return None
+    elif kwargs.get("orient", "records") != "records":
+        return None
+    return handler
+
+
+# Operation handlers: each takes the input DataFrame plus the operation kwargs
+
+def _op_to_dataframe(df: pd.DataFrame, **kwargs) -> Any:
+    return df
+
+
+def _op_filter(df: pd.DataFrame, **kwargs) -> Any:
+    condition = kwargs.get("condition")
+    if condition:
+        return df.query(condition)
+    return df
+
+
+def _op_aggregate(df: pd.DataFrame, **kwargs) -> Any:
+    group_by = kwargs.get("group_by", [])
+    aggregations = kwargs.get("aggregations", {})
+    if group_by and aggregations:
+        keys = [group_by] if isinstance(group_by, str) else list(group_by)
+        df = _categorize(df, keys)
+        # observed=True keeps only key combinations present in the data, as with object keys
+        return df.groupby(group_by, observed=True).agg(aggregations)
+    return df
+
+
+def _op_transform(df: pd.DataFrame, **kwargs) -> Any:
+    transformations = kwargs.get("transformations", {})
+    vectorize = kwargs.get("vectorize", False)
+    # Shallow copy so a caller-supplied DataFrame is not modified in place
+    df = df.copy(deep=False)
+    for column, func in transformations.items():
+        if isinstance(func, str):
+            df[column] = _named_transform(df[column], func)
+        elif callable(func):
+            if vectorize:
+                df[column] = _vectorized_apply(df[column], func)
+            else:
+                df[column] = df[column].apply(func)
+    return df
+
+
+def _op_merge(df: pd.DataFrame, **kwargs) -> Any:
+    other_data = kwargs.get("other_data")
+    if not other_data:
+        return df
+    other = pd.DataFrame(other_data)
+    on = kwargs.get("on")
+    how = kwargs.get("how", "inner")
+    return pd.merge(df, other, on=on, how=how)
+
+
+def _op_sort(df: pd.DataFrame, **kwargs) -> Any:
+    by = kwargs.get("by", [])
+    ascending = kwargs.get("ascending", True)
+    return df.sort_values(by=by, ascending=ascending)
+
+
+def _op_deduplicate(df: pd.DataFrame, **kwargs) -> Any:
+    subset = kwargs.get("subset")
+    return df.drop_duplicates(subset=subset)
+
+
+def _op_fillna(df: pd.DataFrame, **kwargs) -> Any:
+    value = kwargs.get("value", 0)
+    method = kwargs.get("method")
+    if method:
+        return df.fillna(method=method)
+    return df.fillna(value)
+
+
+def _op_to_dict(df: pd.DataFrame, **kwargs) -> Any:
+    orient = kwargs.get("orient", "records")
+    return df.to_dict(orient=orient)
+
+
+def _op_to_json(df: pd.DataFrame, **kwargs) -> Any:
+    orient = kwargs.get("orient", "records")
+    return df.to_json(orient=orient)
+
+
+def _op_to_csv(df: pd.DataFrame, **kwargs) -> Any:
+    index = kwargs.get("index", False)
+    return df.to_csv(index=index)
+
 
 class DataProcessorTool(Tool):
     """Tool for data processing and transformation."""
 
+    # Operation name -> handler taking the input DataFrame and operation kwargs
+    _OPS = {
+        "to_dataframe": _op_to_dataframe,
+        "filter": _op_filter,
+        "aggregate": _op_aggregate,
+        "transform": _op_transform,
+        "merge": _op_merge,
+        "sort": _op_sort,
+        "deduplicate": _op_deduplicate,
+        "fillna": _op_fillna,
+        "to_dict": _op_to_dict,
+        "to_json": _op_to_json,
+        "to_csv": _op_to_csv,
+    }
+
     def __init__(self, config: ToolConfig):
         """Initialize data processor tool.
 
@@ -36,90 +260,48 @@ class DataProcessorTool(Tool):
 
         Returns:
             Processed data
+
+        Note:
+            ``transform`` accepts either callables or string names per column
+            (``"log"``, ``"sqrt"``, ``"abs"``, ``"upper"``, ``"*2"``, ...). String
+            names run as a single NumPy/pandas operation over the column and are
+            much faster than callables on large numeric data. Pass
+            ``vectorize=True`` to try calling a callable on the whole column
+            before falling back to per-row ``apply``.
+
+            ``dtypes`` casts columns before the operation runs, and
+            ``low_memory=True`` converts every low-cardinality string column
+            to ``category`` dtype (``aggregate`` always does this for its
+            ``group_by`` columns).
+
+            ``to_dict``/``to_json``/``to_csv`` on a list of dicts with records
+            orient (and no index for CSV) skip pandas and emit the records as
+            given, so missing keys are not filled with nulls.
         """
         try:
             self.logger.info("Processing data", operation=operation)
 
-            if operation == "to_dataframe":
-                result = pd.DataFrame(data)
-
-            elif operation == "filter":
-                df = pd.DataFrame(data)
-                condition = kwargs.get("condition")
-                if condition:
-                    result = df.query(condition)
-                else:
-                    result = df
-
-            elif operation == "aggregate":
-                df = pd.DataFrame(data)
-                group_by = kwargs.get("group_by", [])
-                aggregations = kwargs.get("aggregations", {})
-                if group_by and aggregations:
-                    result = df.groupby(group_by).agg(aggregations)
-                else:
-                    result = df
-
-            elif operation == "transform":
-                df = pd.DataFrame(data)
-                transformations = kwargs.get("transformations", {})
-                for column, func in transformations.items():
-                    if callable(func):
-                        df[column] = df[column].apply(func)
-                result = df
-
-            elif operation == "merge":
-                df1 = pd.DataFrame(data)
-                other_data = kwargs.get("other_data")
-                if other_data:
-                    df2 = pd.DataFrame(other_data)
-                    on = kwargs.get("on")
-                    how = kwargs.get("how", "inner")
-                    result = pd.merge(df1, df2, on=on, how=how)
-                else:
-                    result = df1
-
-            elif operation == "sort":
-                df = pd.DataFrame(data)
-                by = kwargs.get("by", [])
-                ascending = kwargs.get("ascending", True)
-                result = df.sort_values(by=by, ascending=ascending)
-
-            elif operation == "deduplicate":
-                df = pd.DataFrame(data)
-                subset = kwargs.get("subset")
-                result = df.drop_duplicates(subset=subset)
-
-            elif operation == "fillna":
-                df = pd.DataFrame(data)
-                value = kwargs.get("value", 0)
-                method = kwargs.get("method")
-                if method:
-                    result = df.fillna(method=method)
-                else:
-                    result = df.fillna(value)
-
-            elif operation == "to_dict":
-                df = pd.DataFrame(data)
-                orient = kwargs.get("orient", "records")
-                result = df.to_dict(orient=orient)
-
-            elif operation == "to_json":
-                df = pd.DataFrame(data)
-                orient = kwargs.get("orient", "records")
-                result = df.to_json(orient=orient)
-
-            elif operation == "to_csv":
-                df = pd.DataFrame(data)
-                index = kwargs.get("index", False)
-                result = df.to_csv(index=index)
-
-            else:
+            op = self._OPS.get(operation)
+            if op is None:
                 return ToolResult(
                     success=False,
                     error=f"Unknown operation: {operation}",
                 )
 
+            fast_path = _records_fast_path(operation, data, **kwargs)
+            if fast_path is not None:
+                self.logger.info("Data processing completed", operation=operation)
+                return ToolResult(success=True, data=fast_path(data, **kwargs), metadata={})
+
+            # Build the DataFrame once; operations share it instead of re-parsing data
+            df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+            dtypes = kwargs.get("dtypes")
+            if dtypes:
+                df = df.astype(dtypes)
+            if kwargs.get("low_memory", False):
+                df = _categorize(df, list(df.columns))
+            result = op(df, **kwargs)
+
             # Convert DataFrame to dict for serialization
             if isinstance(result, pd.DataFrame):
                 result_data = result.to_dict(orient="records")
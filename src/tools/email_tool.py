@@ -1,9 +1,9 @@
 """Email automation tool."""
 
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
+import asyncio
+from email.message import EmailMessage
+from typing import Any, Dict, List, Optional, Tuple
+import aiosmtplib
 import structlog
 
 from .base import Tool, ToolResult, ToolConfig
@@ -25,6 +25,124 @@ class EmailTool(Tool):
         super().__init__(config)
         self.logger = logger.bind(tool="email")
 
+        # Snapshot SMTP settings once instead of resolving them on every send
+        email_settings = settings.email
+        self._smtp_host = email_settings.smtp_host
+        self._smtp_port = email_settings.smtp_port
+        self._use_tls = email_settings.smtp_use_tls
+        self._smtp_user = email_settings.smtp_username
+        self._smtp_pass = email_settings.smtp_password
+        self._from_email = email_settings.from_email
+
+        # One authenticated connection is reused across sends; the lock keeps
+        # concurrent sends from interleaving SMTP commands on it
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._smtp_lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open a new SMTP connection, upgrading to TLS and logging in if configured."""
+        server = aiosmtplib.SMTP(
+            hostname=self._smtp_host,
+            port=self._smtp_port,
+            use_tls=False,
+            start_tls=self._use_tls,
+        )
+        await server.connect()
+        try:
+            if self._smtp_user and self._smtp_pass:
+                await server.login(self._smtp_user, self._smtp_pass)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    async def _disconnect(self) -> None:
+        """Close the persistent SMTP connection, ignoring errors from a dead socket."""
+        if self._smtp is None:
+            return
+        try:
+            await self._smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        """Get a live SMTP connection, reconnecting if the current one has dropped."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.is_connected and (await self._smtp.noop()).code == 250:
+                    return self._smtp
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+            await self._disconnect()
+
+        self._smtp = await self._connect()
+        return self._smtp
+
+    async def _send(self, msg: EmailMessage, recipients: Tuple[str, ...]) -> None:
+        """Send a message over the persistent connection."""
+        server = await self._get_smtp()
+        try:
+            await server.send_message(msg, recipients=recipients)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Server closed the connection between the health check and the send
+            await self._disconnect()
+            server = await self._get_smtp()
+            await server.send_message(msg, recipients=recipients)
+
+    async def aclose(self) -> None:
+        """Close the persistent SMTP connection."""
+        async with self._smtp_lock:
+            await self._disconnect()
+
+    def _build_message(
+        self,
+        to_emails: List[str],
+        subject: str,
+        body: str,
+        html: bool = False,
+        from_email: str = None,
+        cc_emails: List[str] = None,
+        bcc_emails: List[str] = None,
+        attachments: List[str] = None,
+    ) -> Tuple[EmailMessage, Tuple[str, ...]]:
+        """Build a message and its envelope recipients.
+
+        Returns:
+            Tuple of (message, all To/Cc/Bcc recipients)
+        """
+        # Create message: a single-part body needs no multipart wrapper
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = from_email or self._from_email
+        msg['To'] = ', '.join(to_emails)
+
+        if cc_emails:
+            msg['Cc'] = ', '.join(cc_emails)
+
+        # Add body
+        msg.set_content(body, subtype='html' if html else 'plain')
+
+        # TODO: Add attachment support
+        if attachments:
+            self.logger.warning("Attachments not yet implemented")
+
+        recipients = (*to_emails, *(cc_emails or ()), *(bcc_emails or ()))
+        return msg, recipients
+
+    @staticmethod
+    def _sent_result(to_emails: List[str], subject: str) -> ToolResult:
+        """Build the result for a successfully sent email."""
+        return ToolResult(
+            success=True,
+            data={
+                'sent_to': to_emails,
+                'subject': subject,
+                'message': 'Email sent successfully',
+            },
+            metadata={'recipients_count': len(to_emails)},
+        )
+
     async def execute(
         self,
         to_emails: List[str],
@@ -54,47 +172,24 @@ class EmailTool(Tool):
         try:
             self.logger.info("Sending email", to=to_emails, subject=subject)
 
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = from_email or settings.email.from_email
-            msg['To'] = ', '.join(to_emails)
-
-            if cc_emails:
-                msg['Cc'] = ', '.join(cc_emails)
-
-            # Add body
-            if html:
-                msg.attach(MIMEText(body, 'html'))
-            else:
-                msg.attach(MIMEText(body, 'plain'))
-
-            # TODO: Add attachment support
-            if attachments:
-                self.logger.warning("Attachments not yet implemented")
+            msg, recipients = self._build_message(
+                to_emails,
+                subject,
+                body,
+                html=html,
+                from_email=from_email,
+                cc_emails=cc_emails,
+                bcc_emails=bcc_emails,
+                attachments=attachments,
+            )
 
             # Send email
-            with smtplib.SMTP(settings.email.smtp_host, settings.email.smtp_port) as server:
-                if settings.email.smtp_use_tls:
-                    server.starttls()
-
-                if settings.email.smtp_username and settings.email.smtp_password:
-                    server.login(settings.email.smtp_username, settings.email.smtp_password)
-
-                recipients = to_emails + (cc_emails or []) + (bcc_emails or [])
-                server.send_message(msg, to_addrs=recipients)
+            async with self._smtp_lock:
+                await self._send(msg, recipients)
 
             self.logger.info("Email sent successfully", to=to_emails)
 
-            return ToolResult(
-                success=True,
-                data={
-                    'sent_to': to_emails,
-                    'subject': subject,
-                    'message': 'Email sent successfully',
-                },
-                metadata={'recipients_count': len(to_emails)},
-            )
+            return self._sent_result(to_emails, subject)
 
         except Exception as e:
             self.logger.error("Email sending failed", error=str(e))
@@ -103,7 +198,46 @@ class EmailTool(Tool):
                 error=f"Email sending failed: {str(e)}",
             )
 
+    async def send_batch(self, messages: List[Dict[str, Any]]) -> List[ToolResult]:
+        """Send several emails over a single SMTP connection.
 
+        Messages are sent one after another: SMTP does not allow concurrent
+        transactions on one connection, so this avoids a reconnect per email
+        rather than parallelizing delivery.
 
+        Args:
+            messages: Keyword arguments for each email, as accepted by execute()
 
+        Returns:
+            One result per message, in the same order
+        """
+        results: List[Optional[ToolResult]] = [None] * len(messages)
+        built: List[Tuple[EmailMessage, Tuple[str, ...]]] = []
+        built_indices: List[int] = []
+
+        for i, message in enumerate(messages):
+            try:
+                built.append(self._build_message(**message))
+                built_indices.append(i)
+            except Exception as e:
+                results[i] = ToolResult(success=False, error=f"Email sending failed: {str(e)}")
+
+        self.logger.info("Sending email batch", count=len(built))
+
+        errors: List[Optional[Exception]] = []
+        async with self._smtp_lock:
+            for msg, recipients in built:
+                try:
+                    await self._send(msg, recipients)
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(e)
+
+        for i, error in zip(built_indices, errors):
+            if error is None:
+                results[i] = self._sent_result(messages[i]["to_emails"], messages[i]["subject"])
+            else:
+                self.logger.error("Email sending failed", to=messages[i].get("to_emails"), error=str(error))
+                results[i] = ToolResult(success=False, error=f"Email sending failed: {str(error)}")
 
+        return results
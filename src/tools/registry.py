@@ -7,10 +7,14 @@ from .base import Tool, ToolConfig
 class ToolRegistry:
     """Registry for managing available tools."""
 
+    __slots__ = ("_tools", "_instances", "_default_configs")
+
     def __init__(self):
         """Initialize tool registry."""
         self._tools: Dict[str, Type[Tool]] = {}
         self._instances: Dict[str, Tool] = {}
+        # Built once per tool at registration so get() skips model validation
+        self._default_configs: Dict[str, ToolConfig] = {}
 
     def register(self, tool_class: Type[Tool], name: str = None):
         """Register a tool class.
@@ -21,6 +25,7 @@ class ToolRegistry:
         """
         tool_name = name or tool_class.__name__
         self._tools[tool_name] = tool_class
+        self._default_configs[tool_name] = ToolConfig(name=tool_name, description="")
 
     def get(self, name: str, config: ToolConfig = None) -> Optional[Tool]:
         """Get a tool instance.
@@ -32,21 +37,25 @@ class ToolRegistry:
         Returns:
             Tool instance or None if not found
         """
-        if config:
-            # Create new instance with config
-            if name in self._tools:
-                return self._tools[name](config)
+        tool_class = self._tools.get(name)
+        if tool_class is None:
             return None
 
+        if config is not None:
+            # Create new instance with config
+            return tool_class(config)
+
         # Return cached instance or create new one with default config
-        if name not in self._instances:
-            if name in self._tools:
-                default_config = ToolConfig(name=name, description="")
-                self._instances[name] = self._tools[name](default_config)
-            else:
-                return None
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = tool_class(self._default_configs[name])
+            self._instances[name] = instance
+        return instance
 
-        return self._instances[name]
+    async def aclose(self) -> None:
+        """Close all cached tool instances and release their resources."""
+        for instance in self._instances.values():
+            await instance.aclose()
 
     def list_tools(self) -> list[str]:
         """List all registered tools.
@@ -62,10 +71,9 @@ class ToolRegistry:
         Args:
             name: Tool name to unregister
         """
-        if name in self._tools:
-            del self._tools[name]
-        if name in self._instances:
-            del self._instances[name]
+        self._tools.pop(name, None)
+        self._instances.pop(name, None)
+        self._default_configs.pop(name, None)
 
 
 # Global registry instance
@@ -104,6 +112,11 @@ def list_tools() -> list[str]:
     return _global_registry.list_tools()
 
 
+async def close_tools() -> None:
+    """Close all cached tool instances in the global registry."""
+    await _global_registry.aclose()
+
+
 
 
 
@@ -1,13 +1,25 @@
 """Web scraping tool using Playwright."""
 
+import asyncio
 from typing import Dict, List, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, Page, Playwright
 import structlog
 
 from .base import Tool, ToolResult, ToolConfig
 
 logger = structlog.get_logger(__name__)
 
+# Extracts innerText for every selector in one round trip to the page
+_EXTRACT_SELECTORS_JS = """
+(selectors) => {
+    const out = {};
+    for (const [key, selector] of Object.entries(selectors)) {
+        out[key] = Array.from(document.querySelectorAll(selector), (el) => el.innerText);
+    }
+    return out;
+}
+"""
+
 
 class WebScraperTool(Tool):
     """Web scraping tool with JavaScript support."""
@@ -20,8 +32,36 @@ class WebScraperTool(Tool):
         """
         super().__init__(config)
         self.browser: Optional[Browser] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser_lock = asyncio.Lock()
         self.logger = logger.bind(tool="web_scraper")
 
+    async def _ensure_browser(self) -> Browser:
+        """Launch the shared browser on first use.
+
+        Launching Chromium is far more expensive than a scrape, so one browser is
+        kept for the tool's lifetime and each call gets its own context.
+        """
+        async with self._browser_lock:
+            if self.browser is None or not self.browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self.browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=['--no-sandbox']
+                )
+            return self.browser
+
+    async def aclose(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        async with self._browser_lock:
+            if self.browser is not None:
+                await self.browser.close()
+                self.browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
     async def execute(
         self,
         url: str,
@@ -29,6 +69,8 @@ class WebScraperTool(Tool):
         wait_for: str = None,
         screenshot: bool = False,
         javascript: bool = True,
+        return_html: bool = False,
+        screenshot_path: Optional[str] = None,
     ) -> ToolResult:
         """Scrape a website.
 
@@ -36,8 +78,11 @@ class WebScraperTool(Tool):
             url: URL to scrape
             selectors: CSS selectors to extract data
             wait_for: Selector to wait for before scraping
-            screenshot: Take a screenshot
+            screenshot: Take a screenshot and return its bytes
             javascript: Enable JavaScript rendering
+            return_html: Include the full page HTML in the result
+            screenshot_path: Save a full-page screenshot to this path and
+                return the path instead of the image bytes
 
         Returns:
             Scraped data
@@ -45,15 +90,13 @@ class WebScraperTool(Tool):
         try:
             self.logger.info("Scraping website", url=url)
 
-            async with async_playwright() as playwright:
-                # Launch browser
-                browser = await playwright.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox']
-                )
+            browser = await self._ensure_browser()
 
+            # A fresh context per call keeps cookies and storage isolated
+            context = await browser.new_context(java_script_enabled=javascript)
+            try:
                 # Create page
-                page = await browser.new_page()
+                page = await context.new_page()
 
                 # Navigate to URL
                 await page.goto(url, wait_until="networkidle")
@@ -65,35 +108,34 @@ class WebScraperTool(Tool):
                 # Extract data using selectors
                 data = {}
                 if selectors:
-                    for key, selector in selectors.items():
-                        elements = await page.query_selector_all(selector)
-                        if elements:
-                            texts = []
-                            for element in elements:
-                                text = await element.inner_text()
-                                texts.append(text)
+                    extracted = await page.evaluate(_EXTRACT_SELECTORS_JS, selectors)
+                    for key, texts in extracted.items():
+                        if texts:
                             data[key] = texts if len(texts) > 1 else texts[0]
                         else:
                             data[key] = None
 
-                # Get page content
-                html_content = await page.content()
-                data['html'] = html_content
+                # Full HTML can be many MB, so only fetch it when asked for
+                if return_html:
+                    data['html'] = await page.content()
                 data['title'] = await page.title()
                 data['url'] = url
 
                 # Take screenshot if requested
-                if screenshot:
+                if screenshot_path:
+                    await page.screenshot(path=screenshot_path, full_page=True)
+                    data['screenshot_path'] = screenshot_path
+                elif screenshot:
                     screenshot_bytes = await page.screenshot(full_page=True)
                     data['screenshot'] = screenshot_bytes
+            finally:
+                await context.close()
 
-                await browser.close()
-
-                return ToolResult(
-                    success=True,
-                    data=data,
-                    metadata={'url': url, 'selectors_used': list(selectors.keys()) if selectors else []},
-                )
+            return ToolResult(
+                success=True,
+                data=data,
+                metadata={'url': url, 'selectors_used': list(selectors.keys()) if selectors else []},
+            )
 
         except Exception as e:
             self.logger.error("Web scraping failed", url=url, error=str(e))
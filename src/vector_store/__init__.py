@@ -1,17 +1,36 @@
 """Vector store integration for embeddings and similarity search."""
 
-from typing import List, Optional
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 import numpy as np
-from pydantic import BaseModel
+from numpy.typing import ArrayLike
+from pydantic import BaseModel, ConfigDict
 
 from ..config import get_settings
 
 settings = get_settings()
 
 
-class VectorSearchResult(BaseModel):
-    """Result from a vector search."""
+@dataclass(slots=True, frozen=True)
+class VectorSearchResult:
+    """Result from a vector search.
+
+    A plain dataclass so stores can build results without per-object
+    validation; use VectorSearchResultModel when serializing at the API layer.
+    """
+
+    id: str
+    score: float
+    metadata: dict = field(default_factory=dict)
+    content: Optional[str] = None
+
+
+class VectorSearchResultModel(BaseModel):
+    """Serializable vector search result for API responses."""
+
+    model_config = ConfigDict(from_attributes=True)
 
     id: str
     score: float
@@ -26,7 +45,7 @@ class BaseVectorStore:
         """Initialize the vector store."""
         self.settings = settings
 
-    async def store(self, id: str, vector: List[float], metadata: dict = None) -> bool:
+    async def store(self, id: str, vector: ArrayLike, metadata: dict = None) -> bool:
         """Store a vector with metadata.
 
         Args:
@@ -39,7 +58,33 @@ class BaseVectorStore:
         """
         raise NotImplementedError
 
-    async def search(self, query_vector: List[float], limit: int = 10) -> List[VectorSearchResult]:
+    async def store_many(
+        self,
+        ids: List[str],
+        vectors: ArrayLike,
+        metadatas: Optional[List[Optional[dict]]] = None,
+    ) -> bool:
+        """Store a batch of vectors.
+
+        Backends that can insert in bulk should override this; the default
+        stores one vector at a time.
+
+        Args:
+            ids: Unique identifiers, one per vector
+            vectors: Vector embeddings, one row per id
+            metadatas: Optional metadata per vector
+
+        Returns:
+            True if every vector was stored, False otherwise
+        """
+        metadatas = metadatas or [None] * len(ids)
+        results = [
+            await self.store(id, vector, metadata or {})
+            for id, vector, metadata in zip(ids, vectors, metadatas)
+        ]
+        return all(results)
+
+    async def search(self, query_vector: ArrayLike, limit: int = 10) -> List[VectorSearchResult]:
         """Search for similar vectors.
 
         Args:
@@ -51,6 +96,23 @@ class BaseVectorStore:
         """
         raise NotImplementedError
 
+    async def search_batch(
+        self, query_vectors: ArrayLike, limit: int = 10
+    ) -> List[List[VectorSearchResult]]:
+        """Search for several query vectors.
+
+        Backends that can score queries together should override this; the
+        default runs one search per query.
+
+        Args:
+            query_vectors: Query vectors, one row per query
+            limit: Maximum number of results per query
+
+        Returns:
+            One list of search results per query
+        """
+        return [await self.search(query, limit) for query in query_vectors]
+
     async def delete(self, id: str) -> bool:
         """Delete a vector by ID.
 
@@ -62,6 +124,10 @@ class BaseVectorStore:
         """
         raise NotImplementedError
 
+    async def close(self) -> None:
+        """Release resources held by the store."""
+        pass
+
 
 class VectorStoreManager:
     """Manager for vector store operations."""
@@ -69,6 +135,7 @@ class VectorStoreManager:
     def __init__(self):
         """Initialize the vector store manager."""
         self.store: Optional[BaseVectorStore] = None
+        self._embedding_client = None
         self._initialize_store()
 
     def _initialize_store(self) -> None:
@@ -93,6 +160,15 @@ class VectorStoreManager:
                 from .memory_store import MemoryVectorStore
                 self.store = MemoryVectorStore()
 
+        elif provider == "hnsw":
+            try:
+                from .hnsw_store import HNSWMemoryStore
+                self.store = HNSWMemoryStore()
+            except ImportError:
+                print("hnswlib not available, falling back to in-memory store")
+                from .memory_store import MemoryVectorStore
+                self.store = MemoryVectorStore()
+
         else:
             # Default to in-memory store
             from .memory_store import MemoryVectorStore
@@ -112,11 +188,32 @@ class VectorStoreManager:
         if not self.store:
             return False
 
-        # Generate embedding (placeholder - would use actual embedding model)
         vector = await self._generate_embedding(content)
 
         return await self.store.store(id, vector, metadata or {})
 
+    async def store_documents(self, documents: List[Dict[str, Any]]) -> bool:
+        """Store several documents with one embedding call and one bulk insert.
+
+        Args:
+            documents: Documents with "id", "content" and optional "metadata" keys
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.store:
+            return False
+        if not documents:
+            return True
+
+        vectors = await self.embed_batch([doc["content"] for doc in documents])
+
+        return await self.store.store_many(
+            [doc["id"] for doc in documents],
+            vectors,
+            [doc.get("metadata") or {} for doc in documents],
+        )
+
     async def search_similar(self, query: str, limit: int = 10) -> List[VectorSearchResult]:
         """Search for similar documents.
 
@@ -135,36 +232,94 @@ class VectorStoreManager:
 
         return await self.store.search(query_vector, limit)
 
-    async def _generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text.
+    async def search_similar_batch(
+        self, queries: List[str], limit: int = 10
+    ) -> List[List[VectorSearchResult]]:
+        """Search for documents similar to each of several queries.
 
         Args:
-            text: Text to embed
+            queries: Search queries
+            limit: Maximum results per query
+
+        Returns:
+            One list of similar documents per query
+        """
+        if not self.store:
+            return [[] for _ in queries]
+        if not queries:
+            return []
+
+        query_vectors = await self.embed_batch(queries)
+
+        return await self.store.search_batch(query_vectors, limit)
+
+    async def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed several texts in one call.
+
+        Uses the OpenAI embeddings API when an OpenAI key is configured and a
+        deterministic hash-based placeholder otherwise (development and tests).
+
+        Args:
+            texts: Texts to embed
 
         Returns:
-            Vector embedding
+            float32 matrix with one embedding row per text
         """
-        # Placeholder implementation
-        # In production, this would use a proper embedding model
-        import hashlib
-        import numpy as np
-
-        # Simple hash-based embedding for demo purposes
-        hash_obj = hashlib.md5(text.encode())
-        hash_bytes = hash_obj.digest()
-
-        # Convert to float array and normalize
-        vector = np.frombuffer(hash_bytes, dtype=np.float32)
-        # Pad or truncate to match expected dimension
         target_dim = settings.vector_store.dimension
-        if len(vector) < target_dim:
-            # Pad with zeros
-            vector = np.pad(vector, (0, target_dim - len(vector)))
-        elif len(vector) > target_dim:
-            # Truncate
-            vector = vector[:target_dim]
+        if not texts:
+            return np.empty((0, target_dim), dtype=np.float32)
+
+        client = self._get_embedding_client()
+        if client is None:
+            return self._hash_embeddings(texts, target_dim)
+
+        response = await client.embeddings.create(
+            model=settings.vector_store.embedding_model,
+            input=texts,
+            dimensions=target_dim,
+        )
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return np.asarray([item.embedding for item in ordered], dtype=np.float32)
+
+    def _get_embedding_client(self):
+        """Get the OpenAI client used for embeddings, or None if no key is configured."""
+        if self._embedding_client is None and settings.llm.openai_api_key:
+            from openai import AsyncOpenAI
 
-        return vector.tolist()
+            self._embedding_client = AsyncOpenAI(api_key=settings.llm.openai_api_key)
+        return self._embedding_client
+
+    @staticmethod
+    def _hash_embeddings(texts: List[str], target_dim: int) -> np.ndarray:
+        """Deterministic placeholder embeddings derived from a hash of each text.
+
+        Each text is hashed once with BLAKE2b (faster per byte than MD5) and
+        the digest seeds a generator that fills all ``target_dim`` components,
+        so no dimension is left as zero padding.
+
+        Args:
+            texts: Texts to embed
+            target_dim: Embedding dimension
+
+        Returns:
+            float32 matrix with one row per text, values in [0, 1)
+        """
+        vectors = np.empty((len(texts), target_dim), dtype=np.float32)
+        for row, text in zip(vectors, texts):
+            seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=16).digest(), "little")
+            np.random.default_rng(seed).random(out=row, dtype=np.float32)
+        return vectors
+
+    async def _generate_embedding(self, text: str) -> np.ndarray:
+        """Generate embedding for text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Contiguous float32 embedding, passed to the store without a list round-trip
+        """
+        return (await self.embed_batch([text]))[0]
 
 
 # Global vector store instance
@@ -177,3 +332,12 @@ def get_vector_store() -> VectorStoreManager:
     if _vector_store_manager is None:
         _vector_store_manager = VectorStoreManager()
     return _vector_store_manager
+
+
+async def close_vector_store() -> None:
+    """Close the global vector store manager."""
+    global _vector_store_manager
+    if _vector_store_manager:
+        if _vector_store_manager.store:
+            await _vector_store_manager.store.close()
+        _vector_store_manager = None
@@ -0,0 +1,144 @@
+"""In-memory HNSW vector store for approximate nearest-neighbour search."""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import hnswlib
+import numpy as np
+from numpy.typing import ArrayLike
+
+from . import BaseVectorStore, VectorSearchResult
+
+# HNSW graph parameters: M links per node, ef_construction build-time beam width,
+# ef_search query-time beam width (higher values trade speed for recall)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+# Elements allocated for a new index; capacity doubles whenever it runs out
+_INITIAL_CAPACITY = 1024
+
+
+class HNSWMemoryStore(BaseVectorStore):
+    """In-memory vector store backed by an hnswlib HNSW graph.
+
+    Searches visit a logarithmic number of graph nodes instead of scanning every
+    stored vector, at the cost of approximate (typically >95% recall) results.
+    """
+
+    def __init__(self):
+        """Initialize the HNSW store."""
+        super().__init__()
+        # Created on the first store, once the vector dimension is known
+        self._index: Optional[hnswlib.Index] = None
+        self._id_to_label: Dict[str, int] = {}
+        self._label_to_id: Dict[int, str] = {}
+        self._meta: Dict[int, dict] = {}
+        self._next_label = 0
+        self._lock = asyncio.Lock()
+
+    def _create_index(self, dimension: int) -> hnswlib.Index:
+        """Create an empty cosine-space index."""
+        index = hnswlib.Index(space="cosine", dim=dimension)
+        index.init_index(
+            max_elements=_INITIAL_CAPACITY,
+            M=HNSW_M,
+            ef_construction=HNSW_EF_CONSTRUCTION,
+            allow_replace_deleted=True,
+        )
+        index.set_ef(HNSW_EF_SEARCH)
+        return index
+
+    async def store(self, id: str, vector: ArrayLike, metadata: dict = None) -> bool:
+        """Store a vector in the index.
+
+        Args:
+            id: Unique identifier for the vector
+            vector: Vector embedding
+            metadata: Additional metadata
+
+        Returns:
+            True if successful, False otherwise
+        """
+        row = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+
+        async with self._lock:
+            if self._index is None:
+                self._index = self._create_index(row.shape[1])
+
+            label = self._id_to_label.get(id)
+            if label is None:
+                label = self._next_label
+                self._next_label += 1
+                # Count includes deleted slots, which replace_deleted reuses
+                if self._index.element_count >= self._index.max_elements:
+                    self._index.resize_index(2 * self._index.max_elements)
+                self._id_to_label[id] = label
+                self._label_to_id[label] = id
+
+            self._index.add_items(row, np.asarray([label]), replace_deleted=True)
+            self._meta[label] = metadata or {}
+        return True
+
+    async def search(self, query_vector: ArrayLike, limit: int = 10) -> List[VectorSearchResult]:
+        """Search for approximately nearest vectors.
+
+        Args:
+            query_vector: Query vector
+            limit: Maximum number of results
+
+        Returns:
+            List of search results
+        """
+        k = min(limit, len(self._id_to_label))
+        if self._index is None or k <= 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+        labels, distances = self._index.knn_query(query, k=k)
+
+        results = []
+        for label, distance in zip(labels[0], distances[0]):
+            id = self._label_to_id.get(int(label))
+            if id is None:
+                continue
+            metadata = self._meta[int(label)]
+            results.append(VectorSearchResult(
+                id=id,
+                # hnswlib reports cosine distance (1 - similarity)
+                score=float(1.0 - distance),
+                metadata=metadata,
+                content=metadata.get("content"),
+            ))
+        return results
+
+    async def delete(self, id: str) -> bool:
+        """Delete a vector from the index.
+
+        Args:
+            id: Vector ID to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        async with self._lock:
+            label = self._id_to_label.pop(id, None)
+            if label is None:
+                return False
+
+            self._index.mark_deleted(label)
+            del self._label_to_id[label]
+            del self._meta[label]
+            return True
+
+    def get_stats(self) -> Dict:
+        """Get statistics about the vector store.
+
+        Returns:
+            Dictionary with store statistics
+        """
+        return {
+            "total_vectors": len(self._id_to_label),
+            "vector_dimension": self._index.dim if self._index is not None else self.settings.vector_store.dimension,
+            "store_type": "hnsw"
+        }
@@ -1,23 +1,315 @@
 """In-memory vector store implementation."""
 
 import asyncio
-from typing import Dict, List, Optional
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
+from numpy.typing import ArrayLike
+
+try:
+    # SIMD distance kernels with runtime CPU dispatch (AVX-512, NEON, ...)
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 from . import BaseVectorStore, VectorSearchResult
 
+STORAGE_DTYPES = {"f32": np.float32, "f16": np.float16, "i8": np.int8}
+
+# Searches over fewer matrix elements than this run inline; larger ones are
+# moved to a worker thread (numpy releases the GIL during the scan)
+_INLINE_SEARCH_MAX_ELEMENTS = 1 << 16
+
+# Rows allocated for the first insert; capacity doubles whenever it runs out
+_INITIAL_CAPACITY = 64
+
+# Rows converted to float32 at a time when scoring f16/i8 matrices without SimSIMD
+_DECODE_BLOCK_ROWS = 4096
+
+# Files written to settings.vector_store.persist_path
+_VECTORS_FILE = "vectors.npy"
+_SCALES_FILE = "scales.npy"
+_INDEX_FILE = "index.json"
+
+# Suffix of the previous save while a new one is being swapped in
+_PREVIOUS_SUFFIX = ".old"
+
+# Bytes of stored rows scored per tile in batched searches, sized to stay in L2
+_SCAN_BLOCK_BYTES = 256 * 1024
+
+# Queries multiplied against each tile of stored rows in batched searches
+_QUERY_BLOCK_ROWS = 64
+
+
+def _normalize_rows(rows: np.ndarray) -> np.ndarray:
+    """Scale each row of a float32 matrix to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0)
+
+
+def _normalize(vector: ArrayLike) -> np.ndarray:
+    """Convert a vector to a float32 unit vector (zero vectors stay zero)."""
+    return _normalize_rows(np.asarray(vector, dtype=np.float32).reshape(1, -1))[0]
+
+
+def _encode_rows(rows: np.ndarray, dtype: type) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert float32 rows to the storage dtype.
+
+    int8 rows are scaled so their largest component maps to 127.
+
+    Returns:
+        Tuple of (encoded rows, per-row scale such that row ~= encoded * scale)
+    """
+    if dtype is np.int8:
+        peaks = np.abs(rows).max(axis=1) if rows.shape[1] else np.zeros(rows.shape[0])
+        factors = np.divide(127.0, peaks, out=np.zeros_like(peaks), where=peaks > 0)
+        encoded = np.round(rows * factors[:, None]).astype(np.int8)
+        return encoded, (peaks / 127.0).astype(np.float32)
+    return rows.astype(dtype, copy=False), np.ones(rows.shape[0], dtype=np.float32)
+
+
+def _encode(row: np.ndarray, dtype: type) -> Tuple[np.ndarray, float]:
+    """Convert a single float32 vector to the storage dtype (see _encode_rows)."""
+    encoded, scales = _encode_rows(row.reshape(1, -1), dtype)
+    return encoded[0], float(scales[0])
+
+
+if numba is not None:
+    # Explicit signatures compile at import, so the first search does not pay
+    # for JIT compilation; cache=True keeps the machine code across restarts.
+    # Contiguous (::1) layouts let LLVM emit packed loads and FMA loops. Rows
+    # and query are unit length, so the dot product is the cosine similarity.
+    @numba.njit(
+        ["f4[::1](f4[:, ::1], f4[::1])", "f4[::1](i1[:, ::1], f4[::1])"],
+        parallel=True, fastmath=True, cache=True, boundscheck=False,
+    )
+    def _dot_rows_kernel(matrix, query):
+        """Dot product of every matrix row with a float32 query, rows in parallel."""
+        out = np.empty(matrix.shape[0], dtype=np.float32)
+        for r in numba.prange(matrix.shape[0]):
+            acc = np.float32(0.0)
+            for i in range(matrix.shape[1]):
+                acc += np.float32(matrix[r, i]) * query[i]
+            out[r] = acc
+        return out
+else:
+    _dot_rows_kernel = None
+
+
+def _similarity_scores(matrix: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Cosine similarity of a unit query against every (unit) row of a matrix.
+
+    Rows and query are normalized up front, so this is a bare dot product.
+    Uses SimSIMD when installed (with native f16/i8 kernels for compact
+    storage) and a BLAS matrix-vector product otherwise. Without SimSIMD,
+    int8 rows go through the Numba kernel when available instead of being
+    decoded to float32. int8 dot products are rescaled by the per-row
+    quantization scale.
+    """
+    if simsimd is not None:
+        encoded, query_scale = _encode(query, matrix.dtype.type)
+        dots = np.asarray(simsimd.cdist(encoded[None, :], matrix, metric="dot")).ravel()
+        if matrix.dtype == np.int8:
+            dots = dots * (query_scale * scales)
+        return dots
+
+    if matrix.dtype == np.float32:
+        return matrix @ query
+
+    if _dot_rows_kernel is not None and matrix.dtype == np.int8:
+        return _dot_rows_kernel(np.ascontiguousarray(matrix), query) * scales
+
+    # Decode in blocks so compact storage never needs a full float32 copy
+    dots = np.empty(matrix.shape[0], dtype=np.float32)
+    for start in range(0, matrix.shape[0], _DECODE_BLOCK_ROWS):
+        block = matrix[start:start + _DECODE_BLOCK_ROWS]
+        dots[start:start + block.shape[0]] = block.astype(np.float32) @ query
+    if matrix.dtype == np.int8:
+        dots *= scales
+    return dots
+
+
+def _similarity_scores_batch(
+    matrix: np.ndarray, scales: np.ndarray, queries: np.ndarray
+) -> np.ndarray:
+    """Cosine similarity of several unit queries against every (unit) row of a matrix.
+
+    Without SimSIMD the product is tiled: each block of stored rows small
+    enough to stay in L2 is multiplied against a block of queries while it is
+    cached, so the matrix is streamed from memory once per batch rather than
+    once per query.
+
+    Returns:
+        Scores of shape (number of queries, number of rows)
+    """
+    if simsimd is not None:
+        encoded, query_scales = _encode_rows(queries, matrix.dtype.type)
+        dots = np.asarray(simsimd.cdist(encoded, matrix, metric="dot"))
+        if matrix.dtype == np.int8:
+            dots = dots * np.outer(query_scales, scales)
+        return dots
+
+    block_rows = max(1, _SCAN_BLOCK_BYTES // max(1, matrix.shape[1] * 4))
+    dots = np.empty((queries.shape[0], matrix.shape[0]), dtype=np.float32)
+    for start in range(0, matrix.shape[0], block_rows):
+        block = matrix[start:start + block_rows].astype(np.float32, copy=False)
+        stop = start + block.shape[0]
+        for q_start in range(0, queries.shape[0], _QUERY_BLOCK_ROWS):
+            q_stop = q_start + _QUERY_BLOCK_ROWS
+            dots[q_start:q_stop, start:stop] = queries[q_start:q_stop] @ block.T
+    if matrix.dtype == np.int8:
+        dots *= scales
+    return dots
+
+
+class _Snapshot(NamedTuple):
+    """View of the store contents that searches read without locking.
+
+    Writers never modify rows or list entries a published snapshot can see:
+    appends go past its last row, and updates and deletes copy first.
+    """
+
+    matrix: np.ndarray
+    scales: np.ndarray
+    ids: List[str]
+    meta: List[dict]
+
 
 class MemoryVectorStore(BaseVectorStore):
-    """In-memory vector store for development and testing."""
+    """In-memory vector store for development and testing.
+
+    Vectors are kept as rows of one contiguous matrix so a search scores every
+    stored vector with a single matrix-vector product. The element type comes
+    from ``settings.vector_store.storage_dtype``: float16 or int8 storage
+    halves or quarters the memory each search has to stream.
+
+    When ``settings.vector_store.persist_path`` is set the store is saved
+    there on close and memory-mapped back on startup, so a restart neither
+    re-embeds the corpus nor reads the whole matrix before the first search.
+    """
 
     def __init__(self):
         """Initialize the in-memory store."""
         super().__init__()
-        self._vectors: Dict[str, Dict] = {}
-        self._lock = asyncio.Lock()
+        storage_dtype = self.settings.vector_store.storage_dtype.lower()
+        if storage_dtype not in STORAGE_DTYPES:
+            raise ValueError(
+                f"Unsupported vector storage dtype '{storage_dtype}', "
+                f"expected one of {sorted(STORAGE_DTYPES)}"
+            )
+        self._dtype = STORAGE_DTYPES[storage_dtype]
 
-    async def store(self, id: str, vector: List[float], metadata: dict = None) -> bool:
+        # Backing buffers with spare capacity; rows [:self._size] are live.
+        # Growing by doubling makes inserts amortized O(1) instead of copying
+        # the whole matrix on every store.
+        self._size = 0
+        self._buffer: np.ndarray = np.empty((0, 0), dtype=self._dtype)
+        # Per-row int8 quantization scales (unused for float storage)
+        self._scale_buffer: np.ndarray = np.empty(0, dtype=np.float32)
+        self._ids: List[str] = []
+        self._meta: List[dict] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._write_lock = asyncio.Lock()
+
+        self._persist_path = self.settings.vector_store.persist_path
+        if self._persist_path:
+            self._load(self._persist_path)
+
+        # Writers publish a new snapshot after each change, so searches read it
+        # without taking a lock
+        self._publish()
+
+    def _load(self, path: str) -> None:
+        """Restore a saved store, memory-mapping its matrix read-only.
+
+        The mapped matrix has no spare capacity, so the first append or
+        in-place change copies it into memory and the file is never written.
+        """
+        path = os.path.normpath(path)
+        if not os.path.exists(os.path.join(path, _INDEX_FILE)):
+            # A save interrupted between moving the old directory out and the
+            # new one in leaves only the previous copy
+            path += _PREVIOUS_SUFFIX
+            if not os.path.exists(os.path.join(path, _INDEX_FILE)):
+                return
+
+        with open(os.path.join(path, _INDEX_FILE)) as f:
+            index = json.load(f)
+        if index["dtype"] != self._dtype.__name__:
+            raise ValueError(
+                f"Saved vector store at '{path}' uses {index['dtype']} storage, "
+                f"expected {self._dtype.__name__}"
+            )
+
+        matrix = np.load(os.path.join(path, _VECTORS_FILE), mmap_mode="r")
+        scales = np.load(os.path.join(path, _SCALES_FILE))
+        ids, meta = index["ids"], index["metadata"]
+        if matrix.ndim != 2 or not (matrix.shape[0] == scales.shape[0] == len(ids) == len(meta)):
+            raise ValueError(
+                f"Saved vector store at '{path}' is inconsistent: {matrix.shape[0]} vectors, "
+                f"{scales.shape[0]} scales and {len(ids)} ids"
+            )
+
+        self._buffer = matrix
+        self._scale_buffer = scales
+        self._ids = ids
+        self._meta = meta
+        self._id_to_row = {id: row for row, id in enumerate(self._ids)}
+        self._size = len(self._ids)
+
+    def _save(self, path: str, snap: _Snapshot) -> None:
+        """Write a snapshot to ``path``, replacing the whole directory at once.
+
+        The files are written to a staging directory next to ``path`` which is
+        then renamed over it, so readers never see files from two different saves.
+        """
+        path = os.path.normpath(path)
+        parent = os.path.dirname(path) or "."
+        os.makedirs(parent, exist_ok=True)
+
+        staging = tempfile.mkdtemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=parent)
+        try:
+            np.save(os.path.join(staging, _VECTORS_FILE), snap.matrix)
+            np.save(os.path.join(staging, _SCALES_FILE), snap.scales)
+            index = {"dtype": self._dtype.__name__, "ids": snap.ids, "metadata": snap.meta}
+            with open(os.path.join(staging, _INDEX_FILE), "w") as f:
+                json.dump(index, f, default=str)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # Directories cannot be renamed over a non-empty one, so move the old
+        # save aside first; _load falls back to it if we stop in between
+        previous = path + _PREVIOUS_SUFFIX
+        shutil.rmtree(previous, ignore_errors=True)
+        if os.path.exists(path):
+            os.replace(path, previous)
+        os.replace(staging, path)
+        # The live store may still memory-map the old matrix; unlinking it is safe
+        shutil.rmtree(previous, ignore_errors=True)
+
+    async def persist(self) -> None:
+        """Save the current contents to ``settings.vector_store.persist_path``."""
+        if not self._persist_path:
+            return
+        async with self._write_lock:
+            snap = self._snapshot
+            await asyncio.to_thread(self._save, self._persist_path, snap)
+
+    async def close(self) -> None:
+        """Save the store if persistence is configured."""
+        await self.persist()
+
+    async def store(self, id: str, vector: ArrayLike, metadata: dict = None) -> bool:
         """Store a vector in memory.
 
         Args:
@@ -28,15 +320,98 @@ class MemoryVectorStore(BaseVectorStore):
         Returns:
             True if successful, False otherwise
         """
-        async with self._lock:
-            self._vectors[id] = {
-                "vector": np.array(vector),
-                "metadata": metadata or {},
-                "id": id
-            }
+        row = np.ascontiguousarray(vector, dtype=np.float32).reshape(1, -1)
+        return await self.store_many([id], row, [metadata])
+
+    async def store_many(
+        self,
+        ids: List[str],
+        vectors: ArrayLike,
+        metadatas: Optional[List[Optional[dict]]] = None,
+    ) -> bool:
+        """Store a batch of vectors, publishing one new snapshot for all of them.
+
+        Args:
+            ids: Unique identifiers, one per vector (a repeated id keeps the last one)
+            vectors: Vector embeddings as a (len(ids), dimension) matrix or list of rows
+            metadatas: Optional metadata per vector
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not ids:
+            return True
+        metadatas = metadatas or [None] * len(ids)
+
+        # Normalize once here so search scores are plain dot products
+        rows = np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1)
+        encoded, scales = _encode_rows(_normalize_rows(rows), self._dtype)
+
+        # Last occurrence wins for ids repeated within the batch
+        latest = {id: i for i, id in enumerate(ids)}
+
+        async with self._write_lock:
+            dimension = encoded.shape[1]
+            if self._size and dimension != self._buffer.shape[1]:
+                raise ValueError(
+                    f"Vector dimension {dimension} does not match store dimension "
+                    f"{self._buffer.shape[1]}"
+                )
+
+            updates = [(self._id_to_row[id], i) for id, i in latest.items() if id in self._id_to_row]
+            if updates:
+                self._copy_on_write()
+                for row_index, i in updates:
+                    self._buffer[row_index] = encoded[i]
+                    self._scale_buffer[row_index] = scales[i]
+                    self._meta[row_index] = metadatas[i] or {}
+
+            appends = [i for id, i in latest.items() if id not in self._id_to_row]
+            if appends:
+                self._reserve(len(appends), dimension)
+                start, end = self._size, self._size + len(appends)
+                self._buffer[start:end] = encoded[appends]
+                self._scale_buffer[start:end] = scales[appends]
+                for offset, i in enumerate(appends):
+                    self._id_to_row[ids[i]] = start + offset
+                self._ids.extend(ids[i] for i in appends)
+                self._meta.extend(metadatas[i] or {} for i in appends)
+                self._size = end
+
+            self._publish()
         return True
 
-    async def search(self, query_vector: List[float], limit: int = 10) -> List[VectorSearchResult]:
+    def _reserve(self, extra: int, dimension: int) -> None:
+        """Make room for ``extra`` more rows, doubling capacity when full."""
+        needed = self._size + extra
+        if self._size == 0 and self._buffer.shape[1:] != (dimension,):
+            capacity = max(_INITIAL_CAPACITY, needed)
+        elif needed > self._buffer.shape[0]:
+            capacity = max(2 * self._buffer.shape[0], needed)
+        else:
+            return
+
+        buffer = np.empty((capacity, dimension), dtype=self._dtype)
+        scale_buffer = np.empty(capacity, dtype=np.float32)
+        if self._size:
+            buffer[:self._size] = self._buffer[:self._size]
+            scale_buffer[:self._size] = self._scale_buffer[:self._size]
+        self._buffer, self._scale_buffer = buffer, scale_buffer
+
+    def _copy_on_write(self) -> None:
+        """Detach the buffers and lists from the published snapshot before an in-place change."""
+        self._buffer = self._buffer.copy()
+        self._scale_buffer = self._scale_buffer.copy()
+        self._ids = list(self._ids)
+        self._meta = list(self._meta)
+
+    def _publish(self) -> None:
+        """Expose the live rows to searches."""
+        self._snapshot = _Snapshot(
+            self._buffer[:self._size], self._scale_buffer[:self._size], self._ids, self._meta
+        )
+
+    async def search(self, query_vector: ArrayLike, limit: int = 10) -> List[VectorSearchResult]:
         """Search for similar vectors in memory.
 
         Args:
@@ -46,30 +421,87 @@ class MemoryVectorStore(BaseVectorStore):
         Returns:
             List of search results
         """
-        async with self._lock:
-            if not self._vectors:
-                return []
+        snap = self._snapshot
+        if not snap.matrix.shape[0]:
+            return []
 
-            query_array = np.array(query_vector)
-            results = []
+        if snap.matrix.size <= _INLINE_SEARCH_MAX_ELEMENTS:
+            return self._search_sync(query_vector, limit, snap)
+        # Keep large scans off the event loop
+        return await asyncio.to_thread(self._search_sync, query_vector, limit, snap)
 
-            for id, data in self._vectors.items():
-                vector = data["vector"]
-                metadata = data["metadata"]
+    def _search_sync(
+        self, query_vector: ArrayLike, limit: int, snap: _Snapshot
+    ) -> List[VectorSearchResult]:
+        """Score and rank a snapshot (CPU-bound, safe to run in a thread)."""
+        scores = _similarity_scores(snap.matrix, snap.scales, _normalize(query_vector))
 
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(query_array, vector)
+        top = self._top_k(scores, limit)
+        return [
+            VectorSearchResult(
+                id=snap.ids[i],
+                score=float(scores[i]),
+                metadata=snap.meta[i],
+                content=snap.meta[i].get("content"),
+            )
+            for i in top
+        ]
 
-                results.append(VectorSearchResult(
-                    id=id,
-                    score=float(similarity),
-                    metadata=metadata,
-                    content=metadata.get("content")
-                ))
+    async def search_batch(
+        self, query_vectors: ArrayLike, limit: int = 10
+    ) -> List[List[VectorSearchResult]]:
+        """Search for several query vectors with one tiled scan of the matrix.
+
+        Args:
+            query_vectors: Query vectors, one row per query
+            limit: Maximum number of results per query
+
+        Returns:
+            One list of search results per query
+        """
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        snap = self._snapshot
+        if not snap.matrix.shape[0]:
+            return [[] for _ in range(queries.shape[0])]
 
-            # Sort by similarity (descending) and limit results
-            results.sort(key=lambda x: x.score, reverse=True)
-            return results[:limit]
+        if snap.matrix.size * queries.shape[0] <= _INLINE_SEARCH_MAX_ELEMENTS:
+            return self._search_batch_sync(queries, limit, snap)
+        return await asyncio.to_thread(self._search_batch_sync, queries, limit, snap)
+
+    def _search_batch_sync(
+        self, queries: np.ndarray, limit: int, snap: _Snapshot
+    ) -> List[List[VectorSearchResult]]:
+        """Score and rank a snapshot for several queries (safe to run in a thread)."""
+        scores = _similarity_scores_batch(snap.matrix, snap.scales, _normalize_rows(queries))
+
+        results = []
+        for row in scores:
+            results.append([
+                VectorSearchResult(
+                    id=snap.ids[i],
+                    score=float(row[i]),
+                    metadata=snap.meta[i],
+                    content=snap.meta[i].get("content"),
+                )
+                for i in self._top_k(row, limit)
+            ])
+        return results
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, limit: int) -> np.ndarray:
+        """Indices of the highest scores, best first.
+
+        argpartition selects the top ``limit`` in linear time so only those
+        survivors need sorting.
+        """
+        k = min(limit, scores.shape[0])
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k < scores.shape[0]:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(scores.shape[0])
+        return top[np.argsort(-scores[top], kind="stable")]
 
     async def delete(self, id: str) -> bool:
         """Delete a vector from memory.
@@ -80,31 +512,27 @@ class MemoryVectorStore(BaseVectorStore):
         Returns:
             True if successful, False otherwise
         """
-        async with self._lock:
-            if id in self._vectors:
-                del self._vectors[id]
-                return True
-            return False
+        async with self._write_lock:
+            index = self._id_to_row.pop(id, None)
+            if index is None:
+                return False
 
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors.
-
-        Args:
-            a: First vector
-            b: Second vector
-
-        Returns:
-            Cosine similarity score
-        """
-        # Add small epsilon to avoid division by zero
-        epsilon = 1e-8
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
+            self._copy_on_write()
 
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
+            # Move the last row into the freed slot so rows stay contiguous
+            last = self._size - 1
+            if index != last:
+                self._buffer[index] = self._buffer[last]
+                self._scale_buffer[index] = self._scale_buffer[last]
+                self._ids[index] = self._ids[last]
+                self._meta[index] = self._meta[last]
+                self._id_to_row[self._ids[index]] = index
 
-        return float(np.dot(a, b) / (norm_a * norm_b + epsilon))
+            self._ids.pop()
+            self._meta.pop()
+            self._size = last
+            self._publish()
+            return True
 
     def get_stats(self) -> Dict:
         """Get statistics about the vector store.
@@ -113,7 +541,7 @@ class MemoryVectorStore(BaseVectorStore):
             Dictionary with store statistics
         """
         return {
-            "total_vectors": len(self._vectors),
+            "total_vectors": self._size,
             "vector_dimension": self.settings.vector_store.dimension,
             "store_type": "memory"
         }
@@ -1,14 +1,20 @@
 """Fluent workflow builder for easy workflow construction."""
 
+import sys
+from collections import deque
 from typing import Any, Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
+import numpy as np
+
 from .models import (
     Workflow,
     WorkflowStep,
     WorkflowConfig,
     StepCondition,
+    WorkflowAdjacency,
+    build_adjacency,
 )
 
 
@@ -22,11 +28,23 @@ class WorkflowBuilder:
             name: Workflow name
             description: Workflow description
         """
-        self.workflow_id = str(uuid.uuid4())
+        # Generated on first access, so builders that never build skip the urandom read
+        self._workflow_id: Optional[str] = None
         self.config = WorkflowConfig(name=name, description=description)
         self.steps: List[WorkflowStep] = []
         self._last_step_id: Optional[str] = None
 
+    @property
+    def workflow_id(self) -> str:
+        """Workflow ID, generated lazily."""
+        if self._workflow_id is None:
+            self._workflow_id = str(uuid.uuid4())
+        return self._workflow_id
+
+    @workflow_id.setter
+    def workflow_id(self, value: str) -> None:
+        self._workflow_id = value
+
     def with_config(
         self,
         max_retries: int = None,
@@ -65,6 +83,7 @@ class WorkflowBuilder:
         depends_on: List[str] = None,
         timeout: int = 300,
         step_id: str = None,
+        cacheable: bool = False,
     ) -> "WorkflowBuilder":
         """Add a step to the workflow.
 
@@ -76,6 +95,7 @@ class WorkflowBuilder:
             depends_on: List of step IDs this step depends on
             timeout: Step timeout in seconds
             step_id: Optional custom step ID
+            cacheable: Reuse results for identical inputs (side-effect-free steps only)
 
         Returns:
             Self for chaining
@@ -86,11 +106,14 @@ class WorkflowBuilder:
         step = WorkflowStep(
             id=step_id,
             name=name,
-            agent_type=agent_type,
+            # Interned: agent types repeat across every step of every workflow,
+            # so the engine's comparisons on them short-circuit on identity
+            agent_type=sys.intern(agent_type),
             agent_config=agent_config or {},
             inputs=inputs or {},
             depends_on=depends_on or [],
             timeout=timeout,
+            cacheable=cacheable,
         )
 
         self.steps.append(step)
@@ -209,13 +232,13 @@ class WorkflowBuilder:
             type="simple",
             field=condition_field,
             value=condition_value,
-            operator=condition_operator,
+            operator=sys.intern(condition_operator),
         )
 
         step = WorkflowStep(
             id=step_id,
             name=name,
-            agent_type=agent_type,
+            agent_type=sys.intern(agent_type),
             agent_config=agent_config or {},
             inputs=inputs or {},
             depends_on=depends_on or [],
@@ -263,14 +286,89 @@ class WorkflowBuilder:
 
         Returns:
             Complete workflow
+
+        Raises:
+            ValueError: If step IDs are duplicated, a dependency names an
+                unknown step, or the dependencies form a cycle
         """
-        return Workflow(
+        # Naive UTC, matching Workflow's own defaults and the database columns
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        workflow = Workflow(
             id=self.workflow_id,
             config=self.config,
             steps=self.steps,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
+        # Resolve string dependencies to integer indices once, so the engine
+        # schedules on arrays instead of re-hashing step ids every run
+        workflow._adjacency = build_adjacency(workflow.steps)
+        self._validate(workflow._adjacency)
+
+        # Dispatch condition operators now rather than on every evaluation
+        for step in workflow.steps:
+            if step.condition is not None:
+                step.condition.compile()
+
+        return workflow
+
+    def _validate(self, adjacency: WorkflowAdjacency) -> None:
+        """Check the step graph once so the engine never meets a broken one.
+
+        Args:
+            adjacency: Adjacency built from ``self.steps``
+
+        Raises:
+            ValueError: On duplicate step IDs, unknown dependencies or cycles
+        """
+        if len(adjacency.step_index) != len(self.steps):
+            seen = set()
+            duplicates = [s.id for s in self.steps if s.id in seen or seen.add(s.id)]
+            raise ValueError(f"Duplicate step IDs: {sorted(set(duplicates))}")
+
+        for step in self.steps:
+            unknown = [dep for dep in step.depends_on if dep not in adjacency.step_index]
+            if unknown:
+                raise ValueError(f"Step '{step.id}' depends on unknown steps: {unknown}")
+
+        # Kahn's algorithm: every step is visited unless it sits on or behind a cycle
+        indeg = adjacency.indeg.copy()
+        offsets = adjacency.succ_offsets
+        queue = deque(i for i, d in enumerate(indeg) if d == 0)
+        visited = 0
+        while queue:
+            i = queue.popleft()
+            visited += 1
+            for j in adjacency.succ_indices[offsets[i]:offsets[i + 1]]:
+                indeg[j] -= 1
+                if indeg[j] == 0:
+                    queue.append(j)
+
+        if visited != len(self.steps):
+            raise ValueError(f"cycle: {' -> '.join(self._find_cycle(adjacency, indeg))}")
+
+    def _find_cycle(self, adjacency: WorkflowAdjacency, indeg: np.ndarray) -> List[str]:
+        """Return the step IDs of one dependency cycle, in execution order.
+
+        Every step Kahn's algorithm left unvisited has an unvisited dependency,
+        so following those backwards from any of them must revisit a step.
+        """
+        path: List[int] = []
+        position: Dict[int, int] = {}
+        i = int(np.flatnonzero(indeg > 0)[0])
+        while i not in position:
+            position[i] = len(path)
+            path.append(i)
+            i = next(
+                adjacency.step_index[dep]
+                for dep in self.steps[i].depends_on
+                if indeg[adjacency.step_index[dep]] > 0
+            )
+        cycle = path[position[i]:][::-1]
+        # Start from the earliest declared step so the message is stable
+        start = cycle.index(min(cycle))
+        cycle = cycle[start:] + cycle[:start]
+        return [self.steps[j].id for j in cycle + cycle[:1]]
 
 
 # Convenience functions
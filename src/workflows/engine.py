@@ -1,10 +1,16 @@
 """Workflow execution engine."""
 
 import asyncio
+import hashlib
+import json
+import logging
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import structlog
 
 from ..agents.base import BaseAgent, AgentResult
@@ -17,18 +23,51 @@ from .models import (
     StepResult,
     WorkflowStatus,
     WorkflowExecutionContext,
+    WorkflowAdjacency,
+    StepCondition,
+    ContextPath,
+    build_adjacency,
 )
 
 logger = structlog.get_logger(__name__)
+# Underlying stdlib logger, for cheap level checks
+_stdlib_logger = logging.getLogger(__name__)
+
+# Workflow versions whose dependency levels each engine keeps cached
+DEPENDENCY_GRAPH_CACHE_SIZE = 256
+
+# Results of cacheable steps each engine keeps, least recently used evicted first
+STEP_RESULT_CACHE_SIZE = 1024
+
+# Agent calls in flight at once per engine, across all running workflows
+DEFAULT_MAX_CONCURRENT_STEPS = 64
 
 
 class WorkflowEngine:
     """Engine for executing workflows."""
 
-    def __init__(self):
-        """Initialize workflow engine."""
+    def __init__(self, max_concurrent_steps: int = DEFAULT_MAX_CONCURRENT_STEPS):
+        """Initialize workflow engine.
+
+        Args:
+            max_concurrent_steps: Agent calls allowed in flight at once, shared
+                by every workflow this engine runs
+        """
         self.logger = logger.bind(component="workflow_engine")
         self.running_workflows: Dict[str, WorkflowExecutionContext] = {}
+        # Dependency levels as step indices, keyed by (workflow id, updated_at),
+        # least recently used first
+        self._dep_graph_cache: "OrderedDict[Tuple[str, datetime], List[List[int]]]" = (
+            OrderedDict()
+        )
+        # Outputs of cacheable steps: content hash -> (expiry time, output, metadata)
+        self._result_cache: "OrderedDict[str, Tuple[float, Any, Dict[str, Any]]]" = OrderedDict()
+        # Engine-wide gate on agent calls, so concurrent workflows cannot oversubscribe
+        self._step_slots = asyncio.Semaphore(max_concurrent_steps)
+        # Agents shared by steps with identical type and config; held alive by the steps
+        self._agents: "weakref.WeakValueDictionary[Tuple[str, str], BaseAgent]" = (
+            weakref.WeakValueDictionary()
+        )
 
     async def execute(
         self,
@@ -44,65 +83,69 @@ class WorkflowEngine:
         Returns:
             Workflow execution result
         """
-        start_time = time.time()
+        # One wall-clock reading per run; durations and the completion time
+        # come from the monotonic clock
+        started_at = datetime.utcnow()
+        start_time = time.perf_counter()
+        # Bound once so per-step log calls don't repeat the workflow fields
+        log = self.logger.bind(workflow_id=workflow.id, workflow_name=workflow.config.name)
         context = WorkflowExecutionContext(
             workflow_id=workflow.id,
             variables=initial_input or {},
+            started_at=started_at,
+            logger=log,
         )
         self.running_workflows[workflow.id] = context
 
         result = WorkflowResult(
             workflow_id=workflow.id,
             status=WorkflowStatus.RUNNING,
-            started_at=datetime.utcnow(),
+            started_at=started_at,
         )
 
         try:
-            self.logger.info(
-                "Starting workflow execution",
-                workflow_id=workflow.id,
-                workflow_name=workflow.config.name,
-                num_steps=len(workflow.steps),
-            )
+            log.info("Starting workflow execution", num_steps=len(workflow.steps))
 
             # Build dependency graph
-            dependency_graph = self._build_dependency_graph(workflow.steps)
-
-            # Execute steps in order
-            for step_batch in dependency_graph:
-                if workflow.config.parallel_execution and len(step_batch) > 1:
-                    # Execute steps in parallel
-                    batch_results = await self._execute_step_batch_parallel(
-                        step_batch, workflow, context
-                    )
-                else:
-                    # Execute steps sequentially
-                    batch_results = await self._execute_step_batch_sequential(
-                        step_batch, workflow, context
-                    )
-
-                # Store results
-                for step_id, step_result in batch_results.items():
-                    result.step_results[step_id] = step_result
-                    context.completed_steps.append(step_id)
-
-                    if step_result.output:
-                        context.step_outputs[step_id] = step_result.output
-
-                    # Check for failures
-                    if step_result.status == WorkflowStatus.FAILED:
-                        if workflow.config.on_failure == "stop":
-                            result.status = WorkflowStatus.FAILED
-                            result.error = f"Step {step_id} failed: {step_result.error}"
-                            break
-                        elif workflow.config.on_failure == "rollback":
-                            await self._rollback_workflow(workflow, context)
-                            result.status = WorkflowStatus.FAILED
-                            result.error = f"Workflow rolled back due to step {step_id} failure"
-                            break
-
-                if result.status == WorkflowStatus.FAILED:
-                    break
+            dependency_graph = self._get_dependency_graph(workflow)
+
+            # One deadline for the whole run; exceeding it raises TimeoutError below
+            async with asyncio.timeout(workflow.config.timeout):
+                # Execute steps in order
+                for step_batch in dependency_graph:
+                    if workflow.config.parallel_execution and len(step_batch) > 1:
+                        # Execute steps in parallel
+                        batch_results = await self._execute_step_batch_parallel(
+                            step_batch, workflow, context
+                        )
+                    else:
+                        # Execute steps sequentially
+                        batch_results = await self._execute_step_batch_sequential(
+                            step_batch, workflow, context
+                        )
+
+                    # Store results
+                    for step_id, step_result in batch_results.items():
+                        result.step_results[step_id] = step_result
+                        context.mark_completed(step_id)
+
+                        if step_result.output:
+                            context.step_outputs[step_id] = step_result.output
+
+                        # Check for failures
+                        if step_result.status == WorkflowStatus.FAILED:
+                            if workflow.config.on_failure == "stop":
+                                result.status = WorkflowStatus.FAILED
+                                result.error = f"Step {step_id} failed: {step_result.error}"
+                                break
+                            elif workflow.config.on_failure == "rollback":
+                                await self._rollback_workflow(workflow, context)
+                                result.status = WorkflowStatus.FAILED
+                                result.error = f"Workflow rolled back due to step {step_id} failure"
+                                break
+
+                    if result.status == WorkflowStatus.FAILED:
+                        break
 
             # Set final status
             if result.status != WorkflowStatus.FAILED:
@@ -115,72 +158,135 @@ class WorkflowEngine:
         except asyncio.TimeoutError:
             result.status = WorkflowStatus.FAILED
             result.error = f"Workflow execution timed out after {workflow.config.timeout} seconds"
-            self.logger.error("Workflow timeout", workflow_id=workflow.id)
+            log.error("Workflow timeout")
 
         except Exception as e:
             result.status = WorkflowStatus.FAILED
-            result.error = f"Workflow execution failed: {str(e)}"
-            self.logger.error(
-                "Workflow execution failed",
-                workflow_id=workflow.id,
-                error=str(e),
-                exc_info=True,
-            )
+            error = str(e)
+            result.error = f"Workflow execution failed: {error}"
+            log.error("Workflow execution failed", error=error, exc_info=True)
 
         finally:
-            result.completed_at = datetime.utcnow()
-            result.total_execution_time = time.time() - start_time
+            result.total_execution_time = time.perf_counter() - start_time
+            result.completed_at = started_at + timedelta(seconds=result.total_execution_time)
 
             if workflow.id in self.running_workflows:
                 del self.running_workflows[workflow.id]
 
-            self.logger.info(
+            log.info(
                 "Workflow execution completed",
-                workflow_id=workflow.id,
                 status=result.status,
                 execution_time=result.total_execution_time,
             )
 
         return result
 
+    def prepare(self, workflow: Workflow) -> Workflow:
+        """Precompute what execute() derives from a workflow definition.
+
+        Caches the dependency levels and parses every step's input templates
+        and condition up front, so runs of the returned workflow only do the
+        per-run work. Callers that execute the same definition repeatedly
+        should keep and reuse the prepared object.
+
+        Args:
+            workflow: Workflow to prepare
+
+        Returns:
+            The same workflow, with its execution plan cached
+
+        Raises:
+            ValueError: If a numeric condition compares against a non-number
+        """
+        self._get_dependency_graph(workflow)
+        for step in workflow.steps:
+            step.compiled_inputs()
+            if step.condition is not None:
+                step.condition.prepare()
+        return workflow
+
+    def _get_dependency_graph(self, workflow: Workflow) -> List[List[WorkflowStep]]:
+        """Get the dependency levels for a workflow, reusing them across executions.
+
+        Entries are keyed by ``updated_at``, so a modified workflow is rebuilt.
+        Only step indices are cached; the levels are filled from the workflow
+        passed in, so each execution runs its own step objects.
+
+        Args:
+            workflow: Workflow to execute
+
+        Returns:
+            List of step batches that can be executed in parallel
+        """
+        key = (workflow.id, workflow.updated_at)
+        levels = self._dep_graph_cache.get(key)
+        if levels is not None:
+            self._dep_graph_cache.move_to_end(key)
+        else:
+            levels = self._build_dependency_levels(workflow.steps, workflow.get_adjacency())
+            self._dep_graph_cache[key] = levels
+            if len(self._dep_graph_cache) > DEPENDENCY_GRAPH_CACHE_SIZE:
+                self._dep_graph_cache.popitem(last=False)
+
+        steps = workflow.steps
+        return [[steps[i] for i in level] for level in levels]
+
     def _build_dependency_graph(
-        self, steps: List[WorkflowStep]
+        self,
+        steps: List[WorkflowStep],
+        adjacency: Optional[WorkflowAdjacency] = None,
     ) -> List[List[WorkflowStep]]:
         """Build dependency graph for parallel execution.
 
         Args:
             steps: Workflow steps
+            adjacency: Precomputed adjacency for the steps, built if not given
 
         Returns:
             List of step batches that can be executed in parallel
         """
-        # Simple implementation: group steps by dependency level
-        step_dict = {step.id: step for step in steps}
-        levels: List[List[WorkflowStep]] = []
-        completed = set()
-
-        while len(completed) < len(steps):
-            current_level = []
-
-            for step in steps:
-                if step.id in completed:
-                    continue
-
-                # Check if all dependencies are completed
-                if all(dep in completed for dep in step.depends_on):
-                    current_level.append(step)
-
-            if not current_level:
-                # Circular dependency or missing dependencies
-                remaining = [s for s in steps if s.id not in completed]
-                self.logger.warning(
-                    "Circular or missing dependencies detected",
-                    remaining_steps=[s.id for s in remaining],
-                )
-                break
+        levels = self._build_dependency_levels(steps, adjacency)
+        return [[steps[i] for i in level] for level in levels]
+
+    def _build_dependency_levels(
+        self,
+        steps: List[WorkflowStep],
+        adjacency: Optional[WorkflowAdjacency] = None,
+    ) -> List[List[int]]:
+        """Group step indices into levels that can be executed in parallel.
+
+        Args:
+            steps: Workflow steps
+            adjacency: Precomputed adjacency for the steps, built if not given
 
-            levels.append(current_level)
-            completed.update(step.id for step in current_level)
+        Returns:
+            List of batches of indices into ``steps``
+        """
+        # Kahn's algorithm one level at a time over the CSR adjacency
+        if adjacency is None:
+            adjacency = build_adjacency(steps)
+        indeg = adjacency.indeg.copy()
+        offsets = adjacency.succ_offsets
+        levels: List[List[int]] = []
+        scheduled = 0
+
+        ready = np.flatnonzero(indeg == 0)
+        while ready.size:
+            levels.append(ready.tolist())
+            scheduled += ready.size
+
+            successors = np.concatenate(
+                [adjacency.succ_indices[offsets[i]:offsets[i + 1]] for i in ready]
+            )
+            np.subtract.at(indeg, successors, 1)
+            ready = np.unique(successors[indeg[successors] == 0])
+
+        if scheduled < len(steps):
+            # Circular dependency or missing dependencies
+            self.logger.warning(
+                "Circular or missing dependencies detected",
+                remaining_steps=[steps[i].id for i in np.flatnonzero(indeg > 0)],
+            )
 
         return levels
 
@@ -200,19 +306,30 @@ class WorkflowEngine:
         Returns:
             Dictionary of step results
         """
-        tasks = [
-            self._execute_step(step, workflow, context) for step in steps
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # A fixed pool of workers pulls steps from a shared iterator, so a layer
+        # of thousands of steps keeps only max_parallel_steps tasks alive
+        # instead of one (mostly waiting) task per step
+        pending = iter(steps)
+        results: Dict[str, StepResult] = {}
+
+        async def worker() -> None:
+            for step in pending:
+                try:
+                    results[step.id] = await self._execute_step(step, workflow, context)
+                except Exception as e:
+                    # Keep one failing step from cancelling the rest of the group
+                    results[step.id] = StepResult.model_construct(
+                        step_id=step.id,
+                        status=WorkflowStatus.FAILED,
+                        error=str(e),
+                    )
 
-        return {
-            step.id: result if not isinstance(result, Exception) else StepResult(
-                step_id=step.id,
-                status=WorkflowStatus.FAILED,
-                error=str(result),
-            )
-            for step, result in zip(steps, results)
-        }
+        async with asyncio.TaskGroup() as group:
+            for _ in range(max(1, min(workflow.config.max_parallel_steps, len(steps)))):
+                group.create_task(worker())
+
+        # Report in step order regardless of completion order
+        return {step.id: results[step.id] for step in steps}
 
     async def _execute_step_batch_sequential(
         self,
@@ -253,21 +370,19 @@ class WorkflowEngine:
         Returns:
             Step execution result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         context.current_step = step.id
 
-        self.logger.info(
-            "Executing workflow step",
-            workflow_id=workflow.id,
-            step_id=step.id,
-            step_name=step.name,
-        )
+        log = context.logger or self.logger
+        # Quiet workflows report per-step progress at debug level only
+        log_step = log.debug if workflow.config.quiet else log.info
+        log_step("Executing workflow step", step_id=step.id, step_name=step.name)
 
         try:
             # Check condition
             if step.condition and not self._evaluate_condition(step.condition, context):
-                self.logger.info("Step condition not met, skipping", step_id=step.id)
-                return StepResult(
+                log_step("Step condition not met, skipping", step_id=step.id)
+                return StepResult.model_construct(
                     step_id=step.id,
                     status=WorkflowStatus.COMPLETED,
                     output={"skipped": True, "reason": "condition_not_met"},
@@ -275,29 +390,49 @@ class WorkflowEngine:
                 )
 
             # Resolve inputs from context
-            inputs = self._resolve_inputs(step.inputs, context)
+            inputs = self._resolve_inputs(step, context)
+
+            cache_key = self._step_cache_key(step, inputs) if step.cacheable else None
+            if cache_key is not None:
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    output, metadata = cached
+                    log_step("Reusing cached step result", step_id=step.id)
+                    return StepResult.model_construct(
+                        step_id=step.id,
+                        status=WorkflowStatus.COMPLETED,
+                        output=output,
+                        execution_time=0.0,
+                        metadata={**metadata, "cache_hit": True, "cache_key": cache_key},
+                    )
 
-            # Create agent
-            agent = self._create_agent(step)
+            # Get (or create) the step's agent
+            agent = self._get_agent(step)
 
-            # Execute agent
-            agent_result = await asyncio.wait_for(
-                agent.execute(inputs),
-                timeout=step.timeout,
-            )
+            # Execute agent; waiting for a slot does not count against the step timeout
+            async with self._step_slots, asyncio.timeout(step.timeout):
+                agent_result = await agent.execute(inputs)
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             if agent_result.success:
-                return StepResult(
+                metadata = agent_result.metadata
+                if cache_key is not None:
+                    self._cache_result(
+                        cache_key, agent_result.data, metadata,
+                        workflow.config.result_cache_ttl,
+                    )
+                    # Lets warm_cache_from() re-seed this output from the result
+                    metadata = {**metadata, "cache_key": cache_key}
+                return StepResult.model_construct(
                     step_id=step.id,
                     status=WorkflowStatus.COMPLETED,
                     output=agent_result.data,
                     execution_time=execution_time,
-                    metadata=agent_result.metadata,
+                    metadata=metadata,
                 )
             else:
-                return StepResult(
+                return StepResult.model_construct(
                     step_id=step.id,
                     status=WorkflowStatus.FAILED,
                     error=agent_result.error,
@@ -306,27 +441,104 @@ class WorkflowEngine:
                 )
 
         except asyncio.TimeoutError:
-            return StepResult(
+            return StepResult.model_construct(
                 step_id=step.id,
                 status=WorkflowStatus.FAILED,
                 error=f"Step execution timed out after {step.timeout} seconds",
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
             )
 
         except Exception as e:
-            self.logger.error(
+            error = str(e)
+            # Formatting the traceback is costly when steps fail in bulk; only
+            # attach it when debug logging would actually show it
+            log.error(
                 "Step execution failed",
                 step_id=step.id,
-                error=str(e),
-                exc_info=True,
+                error=error,
+                exc_info=_stdlib_logger.isEnabledFor(logging.DEBUG),
             )
-            return StepResult(
+            return StepResult.model_construct(
                 step_id=step.id,
                 status=WorkflowStatus.FAILED,
-                error=str(e),
-                execution_time=time.time() - start_time,
+                error=error,
+                execution_time=time.perf_counter() - start_time,
             )
 
+    def warm_cache_from(self, result: WorkflowResult, ttl: int = 3600) -> int:
+        """Seed the step result cache with the cacheable outputs of an earlier run.
+
+        Useful for sharing work between engines (e.g. across worker processes)
+        or after a restart, given a stored WorkflowResult.
+
+        Args:
+            result: Result of a previous execution
+            ttl: Seconds the imported entries stay valid
+
+        Returns:
+            Number of step outputs imported
+        """
+        imported = 0
+        for step_result in result.step_results.values():
+            metadata = dict(step_result.metadata)
+            cache_key = metadata.pop("cache_key", None)
+            if cache_key is None or step_result.status != WorkflowStatus.COMPLETED:
+                continue
+            metadata.pop("cache_hit", None)
+            self._cache_result(cache_key, step_result.output, metadata, ttl)
+            imported += 1
+        return imported
+
+    @staticmethod
+    def _step_cache_key(step: WorkflowStep, inputs: Dict[str, Any]) -> str:
+        """Content hash identifying a step's agent configuration and resolved inputs."""
+        payload = json.dumps(
+            {"at": step.agent_type, "ac": step.agent_config, "in": inputs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_result(self, key: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Get a cached (output, metadata) pair, or None if missing or expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, output, metadata = entry
+        if expires_at <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return output, metadata
+
+    def _cache_result(self, key: str, output: Any, metadata: Dict[str, Any], ttl: int) -> None:
+        """Cache a successful step output."""
+        self._result_cache[key] = (time.monotonic() + ttl, output, metadata or {})
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > STEP_RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _get_agent(self, step: WorkflowStep) -> BaseAgent:
+        """Get the agent for a step, creating it on the step's first execution.
+
+        Reusing the agent skips re-validating its config on every run. Steps
+        with the same agent type and config share one agent, across workflows.
+
+        Args:
+            step: Workflow step
+
+        Returns:
+            Agent instance
+        """
+        if step._agent is None:
+            key = (step.agent_type, json.dumps(step.agent_config, sort_keys=True, default=str))
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = self._create_agent(step)
+                self._agents[key] = agent
+            step._agent = agent
+        return step._agent
+
     def _create_agent(self, step: WorkflowStep) -> BaseAgent:
         """Create agent for step execution.
 
@@ -347,41 +559,37 @@ class WorkflowEngine:
 
     def _resolve_inputs(
         self,
-        inputs: Dict[str, Any],
+        step: WorkflowStep,
         context: WorkflowExecutionContext,
     ) -> Dict[str, Any]:
         """Resolve step inputs from context.
 
+        Templates are parsed once per step (see WorkflowStep.compiled_inputs),
+        so each execution only performs the lookups.
+
         Args:
-            inputs: Input template
+            step: Step whose inputs to resolve
             context: Execution context
 
         Returns:
             Resolved inputs
         """
-        resolved = {}
-
-        for key, value in inputs.items():
-            if isinstance(value, str) and value.startswith("{{") and value.endswith("}}"):
-                # Template variable
-                var_path = value[2:-2].strip()
-                resolved[key] = self._get_context_value(var_path, context)
-            else:
-                resolved[key] = value
-
-        return resolved
+        return {
+            key: self._get_context_value(value, context) if isinstance(value, ContextPath) else value
+            for key, value in step.compiled_inputs()
+        }
 
-    def _get_context_value(self, path: str, context: WorkflowExecutionContext) -> Any:
+    def _get_context_value(self, path: ContextPath, context: WorkflowExecutionContext) -> Any:
         """Get value from context by path.
 
         Args:
-            path: Dot-separated path (e.g., "step1.output.result")
+            path: Pre-split path (e.g., from "step1.output.result")
             context: Execution context
 
         Returns:
             Value from context
         """
-        parts = path.split(".")
+        parts = path.parts
 
         if parts[0] in context.step_outputs:
             value = context.step_outputs[parts[0]]
@@ -392,9 +600,11 @@ class WorkflowEngine:
                     return None
             return value
 
-        return context.variables.get(path)
+        return context.variables.get(path.path)
 
-    def _evaluate_condition(self, condition, context: WorkflowExecutionContext) -> bool:
+    def _evaluate_condition(
+        self, condition: StepCondition, context: WorkflowExecutionContext
+    ) -> bool:
         """Evaluate step condition.
 
         Args:
@@ -404,20 +614,8 @@ class WorkflowEngine:
         Returns:
             True if condition is met
         """
-        value = self._get_context_value(condition.field, context)
-
-        if condition.operator == "equals":
-            return value == condition.value
-        elif condition.operator == "not_equals":
-            return value != condition.value
-        elif condition.operator == "contains":
-            return condition.value in str(value)
-        elif condition.operator == "greater_than":
-            return float(value) > float(condition.value)
-        elif condition.operator == "less_than":
-            return float(value) < float(condition.value)
-        else:
-            return False
+        value = self._get_context_value(condition.field_path, context)
+        return condition.compile()(value)
 
     async def _rollback_workflow(
         self,
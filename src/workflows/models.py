@@ -1,10 +1,14 @@
 """Workflow models and data structures."""
 
+import operator
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class WorkflowStatus(str, Enum):
@@ -18,6 +22,46 @@ class WorkflowStatus(str, Enum):
     PAUSED = "paused"
 
 
+class ContextPath(NamedTuple):
+    """A context lookup path split into its parts once, ahead of execution.
+
+    ``"step1.output.result"`` reads ``result`` from the ``output`` of step
+    ``step1``; a path that does not start with a step ID names a workflow
+    variable as a whole.
+    """
+
+    path: str
+    parts: Tuple[str, ...]
+
+    @classmethod
+    def parse(cls, path: str) -> "ContextPath":
+        """Split a dot-separated path."""
+        return cls(path, tuple(path.split(".")))
+
+
+def _numeric_predicate(compare: Callable[[float, float], bool]) -> Callable[[Any], Callable[[Any], bool]]:
+    """Predicate builder comparing a value as a float against a pre-parsed threshold."""
+    def build(expected: Any) -> Callable[[Any], bool]:
+        threshold = float(expected)
+        return lambda value: compare(float(value), threshold)
+    return build
+
+
+def _never(value: Any) -> bool:
+    """Predicate for unknown operators."""
+    return False
+
+
+# Condition operator -> builder turning the expected value into a predicate
+_PREDICATE_BUILDERS: Dict[str, Callable[[Any], Callable[[Any], bool]]] = {
+    "equals": lambda expected: partial(operator.eq, expected),
+    "not_equals": lambda expected: partial(operator.ne, expected),
+    "contains": lambda expected: lambda value: expected in str(value),
+    "greater_than": _numeric_predicate(operator.gt),
+    "less_than": _numeric_predicate(operator.lt),
+}
+
+
 class StepCondition(BaseModel):
     """Condition for conditional step execution."""
 
@@ -26,6 +70,44 @@ class StepCondition(BaseModel):
     value: Any = Field(..., description="Value to compare against")
     operator: str = Field(default="equals", description="Comparison operator")
 
+    # Cached results of compile() and field_path; not part of the serialized model
+    _predicate: Optional[Callable[[Any], bool]] = PrivateAttr(default=None)
+    _field_path: Optional[ContextPath] = PrivateAttr(default=None)
+
+    @property
+    def field_path(self) -> ContextPath:
+        """The checked field as a pre-split context path."""
+        if self._field_path is None:
+            self._field_path = ContextPath.parse(self.field)
+        return self._field_path
+
+    def compile(self) -> Callable[[Any], bool]:
+        """Compile the condition into a predicate over the checked field's value.
+
+        The operator is looked up once here instead of on every evaluation,
+        and the result is cached on the condition.
+
+        Returns:
+            Function returning True if the condition is met for a value
+
+        Raises:
+            ValueError: If a numeric comparison value is not a number
+        """
+        if self._predicate is None:
+            build = _PREDICATE_BUILDERS.get(self.operator)
+            self._predicate = build(self.value) if build else _never
+        return self._predicate
+
+    def prepare(self) -> None:
+        """Compile the predicate and parse the field path ahead of evaluation.
+
+        Raises:
+            ValueError: If a numeric comparison value is not a number
+        """
+        self.compile()
+        if self._field_path is None:
+            self._field_path = ContextPath.parse(self.field)
+
 
 class WorkflowStep(BaseModel):
     """Workflow step definition."""
@@ -40,10 +122,41 @@ class WorkflowStep(BaseModel):
     retry_on_failure: bool = Field(default=True, description="Retry on failure")
     timeout: int = Field(default=300, description="Step timeout in seconds")
     parallel: bool = Field(default=False, description="Can run in parallel")
+    cacheable: bool = Field(
+        default=False,
+        description="Reuse the result of an earlier run with identical agent config and inputs "
+        "(only for steps without side effects)",
+    )
+
+    # Cached result of compiled_inputs(); not part of the serialized model
+    _compiled_inputs: Optional[List[Tuple[str, Any]]] = PrivateAttr(default=None)
+    # Agent built from agent_config by the engine on first execution and reused
+    # afterwards (agents keep no per-call state)
+    _agent: Any = PrivateAttr(default=None)
+
+    def compiled_inputs(self) -> List[Tuple[str, Any]]:
+        """Inputs with ``"{{path}}"`` templates parsed once and cached.
+
+        Returns:
+            (key, value) pairs where template values are ContextPath instances
+            and every other value is passed through as-is
+        """
+        if self._compiled_inputs is None:
+            compiled = []
+            for key, value in self.inputs.items():
+                if isinstance(value, str) and value.startswith("{{") and value.endswith("}}"):
+                    value = ContextPath.parse(value[2:-2].strip())
+                compiled.append((key, value))
+            self._compiled_inputs = compiled
+        return self._compiled_inputs
 
 
 class StepResult(BaseModel):
-    """Result from a workflow step execution."""
+    """Result from a workflow step execution.
+
+    The engine builds these with ``model_construct`` from values it already
+    controls, skipping validation on every step.
+    """
 
     step_id: str
     status: WorkflowStatus
@@ -64,11 +177,62 @@ class WorkflowConfig(BaseModel):
     max_retries: int = Field(default=3, description="Maximum retries per step")
     timeout: int = Field(default=3600, description="Total workflow timeout")
     parallel_execution: bool = Field(default=False, description="Enable parallel execution")
+    max_parallel_steps: int = Field(default=32, description="Maximum steps running at once in parallel execution")
+    result_cache_ttl: int = Field(default=3600, description="Seconds cached results of cacheable steps stay valid")
+    quiet: bool = Field(default=False, description="Log per-step progress at debug instead of info level")
     on_failure: str = Field(default="stop", description="Failure handling: 'stop', 'continue', 'rollback'")
     save_intermediate: bool = Field(default=True, description="Save intermediate results")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
+class WorkflowAdjacency(NamedTuple):
+    """Step dependency graph in CSR form, indexed by step position.
+
+    Successors of step ``i`` are ``succ_indices[succ_offsets[i]:succ_offsets[i + 1]]``
+    and ``indeg[i]`` counts its distinct dependencies. A dependency on an unknown
+    step id still counts towards ``indeg`` but has no edge, so that step never
+    becomes ready.
+    """
+
+    step_index: Dict[str, int]
+    indeg: np.ndarray
+    succ_offsets: np.ndarray
+    succ_indices: np.ndarray
+
+
+def build_adjacency(steps: List[WorkflowStep]) -> WorkflowAdjacency:
+    """Build the CSR dependency graph for a list of steps.
+
+    Args:
+        steps: Workflow steps
+
+    Returns:
+        Adjacency with integer step indices
+    """
+    step_index: Dict[str, int] = {}
+    for i, step in enumerate(steps):
+        step_index.setdefault(step.id, i)
+
+    indeg = np.zeros(len(steps), dtype=np.int32)
+    sources: List[int] = []
+    targets: List[int] = []
+    for i, step in enumerate(steps):
+        # dict.fromkeys drops repeated dependencies while keeping their order
+        for dep in dict.fromkeys(step.depends_on):
+            indeg[i] += 1
+            source = step_index.get(dep)
+            if source is not None:
+                sources.append(source)
+                targets.append(i)
+
+    sources_arr = np.asarray(sources, dtype=np.int32)
+    succ_offsets = np.zeros(len(steps) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(sources_arr, minlength=len(steps)), out=succ_offsets[1:])
+    succ_indices = np.asarray(targets, dtype=np.int32)[np.argsort(sources_arr, kind="stable")]
+
+    return WorkflowAdjacency(step_index, indeg, succ_offsets, succ_indices)
+
+
 class Workflow(BaseModel):
     """Complete workflow definition."""
 
@@ -78,6 +242,30 @@ class Workflow(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Precomputed by WorkflowBuilder.build(); not part of the serialized model
+    _adjacency: Optional[WorkflowAdjacency] = PrivateAttr(default=None)
+
+    def get_adjacency(self) -> WorkflowAdjacency:
+        """Get the step dependency graph, building it on first use."""
+        if self._adjacency is None:
+            self._adjacency = build_adjacency(self.steps)
+        return self._adjacency
+
+
+# Stable small-integer codes for statuses stored in numpy columns
+STATUS_CODES: Dict[WorkflowStatus, int] = {status: code for code, status in enumerate(WorkflowStatus)}
+
+
+class StepResultColumns(NamedTuple):
+    """Per-step status and timing of a workflow result as parallel arrays.
+
+    ``statuses`` holds ``STATUS_CODES`` values, aligned with ``step_ids``.
+    """
+
+    step_ids: List[str]
+    statuses: np.ndarray
+    execution_times: np.ndarray
+
 
 class WorkflowResult(BaseModel):
     """Result from workflow execution."""
@@ -92,18 +280,77 @@ class WorkflowResult(BaseModel):
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    def step_columns(self) -> StepResultColumns:
+        """Gather step statuses and execution times into arrays for aggregation."""
+        n = len(self.step_results)
+        statuses = np.empty(n, dtype=np.uint8)
+        execution_times = np.empty(n, dtype=np.float64)
+        for i, step_result in enumerate(self.step_results.values()):
+            statuses[i] = STATUS_CODES[step_result.status]
+            execution_times[i] = step_result.execution_time
+        return StepResultColumns(list(self.step_results), statuses, execution_times)
 
-class WorkflowExecutionContext(BaseModel):
-    """Context maintained during workflow execution."""
+    def status_counts(self) -> Dict[WorkflowStatus, int]:
+        """Count steps per status, omitting statuses no step has."""
+        counts = np.bincount(self.step_columns().statuses, minlength=len(STATUS_CODES))
+        return {status: int(counts[code]) for status, code in STATUS_CODES.items() if counts[code]}
+
+    def total_step_time(self) -> float:
+        """Sum of the steps' own execution times."""
+        return float(self.step_columns().execution_times.sum())
+
+
+@dataclass(slots=True)
+class WorkflowExecutionContext:
+    """Context maintained during workflow execution.
+
+    A plain slotted dataclass: the engine updates it after every step, and
+    pydantic's attribute handling is pure overhead on that path. Use
+    to_dict/from_dict to (de)serialize it.
+    """
 
     workflow_id: str
     current_step: Optional[str] = None
-    completed_steps: List[str] = Field(default_factory=list)
-    step_outputs: Dict[str, Any] = Field(default_factory=dict)
-    variables: Dict[str, Any] = Field(default_factory=dict)
-    started_at: datetime = Field(default_factory=datetime.utcnow)
-
+    # Ordered for reporting; membership checks go through completed_step_ids
+    completed_steps: List[str] = field(default_factory=list)
+    completed_step_ids: Set[str] = field(default_factory=set)
+    step_outputs: Dict[str, Any] = field(default_factory=dict)
+    variables: Dict[str, Any] = field(default_factory=dict)
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    # Logger bound to the workflow by the engine; not serialized
+    logger: Any = field(default=None, repr=False, compare=False)
 
+    def mark_completed(self, step_id: str) -> None:
+        """Record a finished step."""
+        self.completed_steps.append(step_id)
+        self.completed_step_ids.add(step_id)
 
+    def is_completed(self, step_id: str) -> bool:
+        """Check whether a step has finished, in O(1)."""
+        return step_id in self.completed_step_ids
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        return {
+            "workflow_id": self.workflow_id,
+            "current_step": self.current_step,
+            "completed_steps": list(self.completed_steps),
+            "step_outputs": dict(self.step_outputs),
+            "variables": dict(self.variables),
+            "started_at": self.started_at.isoformat(),
+        }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowExecutionContext":
+        """Create a context from a dictionary produced by to_dict."""
+        started_at = data.get("started_at")
+        completed_steps = list(data.get("completed_steps", []))
+        return cls(
+            workflow_id=data["workflow_id"],
+            current_step=data.get("current_step"),
+            completed_steps=completed_steps,
+            completed_step_ids=set(completed_steps),
+            step_outputs=dict(data.get("step_outputs", {})),
+            variables=dict(data.get("variables", {})),
+            started_at=datetime.fromisoformat(started_at) if started_at else datetime.utcnow(),
+        )
@@ -0,0 +1,205 @@
+"""Background worker that runs queued workflow executions.
+
+Run with ``arq src.workflows.worker.WorkerSettings`` or ``ai-automation worker``.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from ..config import get_settings
+from ..database import AsyncSessionLocal
+from ..database.models import Workflow as DBWorkflow
+from ..database.models import WorkflowExecution
+from ..database.models import WorkflowStatus as DBWorkflowStatus
+from .engine import WorkflowEngine
+from .models import Workflow, WorkflowConfig, WorkflowStatus, WorkflowStep
+
+logger = structlog.get_logger(__name__)
+
+settings = get_settings()
+
+RUN_WORKFLOW_EXECUTION = "run_workflow_execution"
+
+# arq cancels jobs after job_timeout (300 s by default); allow the default
+# workflow timeout plus time to load and persist the execution. Workflows
+# configured to run longer are cancelled and recorded as failed.
+WORKFLOW_JOB_TIMEOUT = WorkflowConfig.model_fields["timeout"].default + 300
+
+# Built once so stored step lists are validated without rebuilding a schema per job
+_steps_adapter = TypeAdapter(List[WorkflowStep])
+
+# Prepared engine workflows kept per worker process, keyed by (id, updated_at)
+WORKFLOW_PLAN_CACHE_SIZE = 128
+
+_STATUS_MAP = {
+    WorkflowStatus.COMPLETED: DBWorkflowStatus.SUCCESS,
+    WorkflowStatus.FAILED: DBWorkflowStatus.FAILED,
+    WorkflowStatus.CANCELLED: DBWorkflowStatus.CANCELLED,
+}
+
+
+def _to_engine_workflow(db_workflow: DBWorkflow) -> Workflow:
+    """Convert a stored workflow row into an engine workflow definition."""
+    return Workflow(
+        id=db_workflow.id,
+        config=WorkflowConfig(
+            **{
+                "name": db_workflow.name,
+                "description": db_workflow.description or "",
+                **(db_workflow.config or {}),
+            }
+        ),
+        steps=_steps_adapter.validate_python(db_workflow.steps),
+        created_at=db_workflow.created_at,
+        # Versions the engine's cached dependency graph for this workflow
+        updated_at=db_workflow.updated_at,
+    )
+
+
+_plans: "OrderedDict[Tuple[str, datetime], Workflow]" = OrderedDict()
+
+
+def _get_engine_workflow(engine: WorkflowEngine, db_workflow: DBWorkflow) -> Workflow:
+    """Get a prepared engine workflow for a stored row, reusing it while the row is unchanged.
+
+    Reuse keeps step-level caches (parsed input templates, compiled
+    conditions, agents) alive across jobs instead of rebuilding them from
+    the row every time.
+    """
+    key = (db_workflow.id, db_workflow.updated_at)
+    workflow = _plans.get(key)
+    if workflow is not None:
+        _plans.move_to_end(key)
+        return workflow
+
+    workflow = engine.prepare(_to_engine_workflow(db_workflow))
+    _plans[key] = workflow
+    if len(_plans) > WORKFLOW_PLAN_CACHE_SIZE:
+        _plans.popitem(last=False)
+    return workflow
+
+
+async def run_workflow_execution(ctx: Dict[str, Any], execution_id: str) -> Optional[str]:
+    """Run a pending workflow execution and persist its result.
+
+    Args:
+        ctx: arq job context
+        execution_id: ID of the WorkflowExecution row to run
+
+    Returns:
+        Final execution status, or None if the execution no longer exists
+    """
+    engine = ctx.get("engine") or WorkflowEngine()
+    start_time = time.time()
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(WorkflowExecution, DBWorkflow)
+            .join(DBWorkflow, WorkflowExecution.workflow_id == DBWorkflow.id)
+            .where(WorkflowExecution.id == execution_id)
+        )
+        row = result.first()
+        if row is None:
+            logger.warning("Workflow execution not found", execution_id=execution_id)
+            return None
+
+        execution, db_workflow = row
+        # A redelivered job must not run an execution that already started
+        if execution.status != DBWorkflowStatus.PENDING:
+            logger.warning(
+                "Workflow execution is not pending, skipping",
+                execution_id=execution_id,
+                status=execution.status,
+            )
+            return execution.status.value
+
+        execution.status = DBWorkflowStatus.RUNNING
+        await db.commit()
+
+        try:
+            workflow_result = await engine.execute(
+                _get_engine_workflow(engine, db_workflow), execution.input_data
+            )
+            execution.status = _STATUS_MAP.get(workflow_result.status, DBWorkflowStatus.FAILED)
+            execution.output_data = (
+                {"final_output": workflow_result.final_output}
+                if workflow_result.final_output is not None
+                else None
+            )
+            execution.error = workflow_result.error
+            execution.current_step = len(workflow_result.step_results)
+        except Exception as e:
+            logger.error(
+                "Workflow execution crashed",
+                execution_id=execution_id,
+                error=str(e),
+                exc_info=True,
+            )
+            execution.status = DBWorkflowStatus.FAILED
+            execution.error = str(e)
+        except BaseException:
+            # Cancelled (e.g. by arq's job timeout): record the failure before
+            # propagating, so the row does not stay RUNNING
+            execution.status = DBWorkflowStatus.FAILED
+            execution.error = "Workflow execution was cancelled"
+            execution.execution_time = time.time() - start_time
+            execution.completed_at = datetime.utcnow()
+            await asyncio.shield(db.commit())
+            raise
+
+        execution.execution_time = time.time() - start_time
+        execution.completed_at = datetime.utcnow()
+        await db.commit()
+
+        logger.info(
+            "Workflow execution finished",
+            execution_id=execution_id,
+            status=execution.status,
+            execution_time=execution.execution_time,
+        )
+        return execution.status.value
+
+
+async def startup(ctx: Dict[str, Any]) -> None:
+    """Create one engine per worker so cached dependency graphs survive across jobs."""
+    ctx["engine"] = WorkflowEngine()
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [run_workflow_execution]
+    on_startup = startup
+    job_timeout = WORKFLOW_JOB_TIMEOUT
+    # Executions are not idempotent; a failed job is recorded, not retried
+    max_tries = 1
+    redis_settings = RedisSettings.from_dsn(settings.redis.url)
+
+
+# Global queue connection pool
+_queue: Optional[ArqRedis] = None
+
+
+async def get_workflow_queue() -> ArqRedis:
+    """Get the global arq connection pool used to enqueue workflow executions."""
+    global _queue
+    if _queue is None:
+        _queue = await create_pool(WorkerSettings.redis_settings)
+    return _queue
+
+
+async def close_workflow_queue() -> None:
+    """Close the global arq connection pool."""
+    global _queue
+    if _queue:
+        await _queue.close()
+        _queue = None
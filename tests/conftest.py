@@ -1,22 +1,31 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
-from typing import AsyncGenerator, Generator
+import json
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
+from src.agents.decision import DecisionConfig
+from src.agents.task import TaskConfig
 from src.api import app
+from src.caching import WorkflowCache, get_workflow_cache
+from src.caching.workflow_cache import WORKFLOW_LIST_KEY_PREFIX
 from src.database import Base, get_db
 from src.config import get_settings
+from src.routers import workflows_router
+from src.workflows.worker import get_workflow_queue
 
 settings = get_settings()
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Test database URL; a shared-cache in-memory database, so the schema created
+# once per session is visible to every connection
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
 # Create test engine
 test_engine = create_async_engine(
@@ -25,55 +34,149 @@ test_engine = create_async_engine(
     pool_pre_ping=True,
 )
 
-# Create test session factory
-TestSessionLocal = sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
 
+# pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    # Create tables
+
+@pytest_asyncio.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create the database schema once for the test session."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create session
-    async with TestSessionLocal() as session:
-        yield session
+    yield
 
-    # Drop tables after test
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(db_schema) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session whose changes are rolled back afterwards.
+
+    The session runs inside an outer transaction; its commits only release
+    SAVEPOINTs, so rolling back the outer transaction undoes the whole test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+class FakeWorkflowCache(WorkflowCache):
+    """In-process stand-in for the Redis-backed workflow cache."""
+
+    def __init__(self):
+        super().__init__(redis_url="redis://unused")
+        self.store: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = self.store.get(key)
+        return json.loads(data) if data is not None else None
+
+    async def set(self, key: str, value: Any) -> None:
+        self.store[key] = json.dumps(value, default=str)
+
+    async def invalidate(self, workflow_id: Optional[str] = None) -> None:
+        for key in [key for key in self.store if key.startswith(WORKFLOW_LIST_KEY_PREFIX)]:
+            del self.store[key]
+        if workflow_id is not None:
+            self.store.pop(self.workflow_key(workflow_id), None)
+
+
+class FakeWorkflowQueue:
+    """Records enqueued jobs instead of sending them to Redis."""
+
+    def __init__(self):
+        self.jobs: List[Tuple[str, tuple]] = []
+        # Set to an exception to simulate Redis being unreachable
+        self.error: Optional[Exception] = None
+
+    async def enqueue_job(self, function: str, *args: Any, **kwargs: Any) -> None:
+        if self.error is not None:
+            raise self.error
+        self.jobs.append((function, args))
+
+
+# The workflow routes are not mounted on the main app, so they get their own
+workflows_app = FastAPI()
+workflows_app.include_router(workflows_router)
+
+
+@pytest.fixture
+def workflow_cache() -> FakeWorkflowCache:
+    """Create an empty in-process workflow cache."""
+    return FakeWorkflowCache()
 
 
 @pytest.fixture
-def client(db_session: AsyncSession) -> TestClient:
-    """Create a test client with database override."""
+def workflow_queue() -> FakeWorkflowQueue:
+    """Create an empty in-process workflow queue."""
+    return FakeWorkflowQueue()
+
+
+@pytest.fixture(scope="session")
+def app_client() -> TestClient:
+    """Create one test client, running the app's startup/shutdown once per session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(
+    app_client: TestClient, db_session: AsyncSession, workflow_cache: FakeWorkflowCache
+) -> TestClient:
+    """Get the shared test client with the database and cache overridden for this test."""
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_workflow_cache] = lambda: workflow_cache
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
 
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def workflows_client(
+    db_session: AsyncSession,
+    workflow_cache: FakeWorkflowCache,
+    workflow_queue: FakeWorkflowQueue,
+) -> TestClient:
+    """Create a test client for the workflow routes, with database, cache and queue overridden."""
+
+    async def override_get_db():
+        yield db_session
+
+    workflows_app.dependency_overrides[get_db] = override_get_db
+    workflows_app.dependency_overrides[get_workflow_cache] = lambda: workflow_cache
+    workflows_app.dependency_overrides[get_workflow_queue] = lambda: workflow_queue
+
+    yield TestClient(workflows_app)
+
+    workflows_app.dependency_overrides.clear()
+
+
 @pytest.fixture
 def mock_llm_response():
     """Mock LLM response for testing."""
@@ -89,23 +192,23 @@ def mock_llm_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_agent_config():
-    """Sample agent configuration for testing."""
-    return {
+    """Sample agent configuration for testing (read-only; vary it with {**config, ...})."""
+    return MappingProxyType({
         "name": "test_agent",
         "description": "Test agent",
         "max_retries": 3,
         "timeout": 300,
         "enable_caching": True,
         "cache_ttl": 3600,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_task_config():
-    """Sample task configuration for testing."""
-    return {
+    """Sample task configuration for testing (read-only; vary it with {**config, ...})."""
+    return MappingProxyType({
         "name": "test_task_agent",
         "description": "Test task agent",
         "task_type": "email_processing",
@@ -114,13 +217,13 @@ def sample_task_config():
         "validate_output": True,
         "max_retries": 3,
         "timeout": 300,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_decision_config():
-    """Sample decision configuration for testing."""
-    return {
+    """Sample decision configuration for testing (read-only; vary it with {**config, ...})."""
+    return MappingProxyType({
         "name": "test_decision_agent",
         "description": "Test decision agent",
         "decision_criteria": ["urgency", "impact", "resources"],
@@ -129,11 +232,16 @@ def sample_decision_config():
         "reasoning_steps": 3,
         "max_retries": 3,
         "timeout": 300,
-    }
-
-
-
+    })
 
 
+@pytest.fixture(scope="session")
+def task_config(sample_task_config) -> TaskConfig:
+    """Validated task configuration, shared by tests (model_copy() before changing)."""
+    return TaskConfig(**sample_task_config)
 
 
+@pytest.fixture(scope="session")
+def decision_config(sample_decision_config) -> DecisionConfig:
+    """Validated decision configuration, shared by tests (model_copy() before changing)."""
+    return DecisionConfig(**sample_decision_config)
@@ -1,14 +1,15 @@
 """Tests for agent functionality."""
 
+import copy
+
 import pytest
 from src.agents.base import AgentConfig, AgentResult
-from src.agents.task import TaskAgent, TaskConfig, TaskStep
-from src.agents.decision import DecisionAgent, DecisionConfig
+from src.agents.task import TaskAgent, TaskStep
+from src.agents.decision import DecisionAgent
 from src.testing import AgentTester, create_test_agent, create_test_scenario
 
 
-@pytest.mark.asyncio
-async def test_base_agent_config(sample_agent_config):
+def test_base_agent_config(sample_agent_config):
     """Test agent configuration creation."""
     config = AgentConfig(**sample_agent_config)
     assert config.name == "test_agent"
@@ -16,24 +17,19 @@ async def test_base_agent_config(sample_agent_config):
     assert config.timeout == 300
 
 
-@pytest.mark.asyncio
-async def test_task_agent_creation(sample_task_config):
+def test_task_agent_creation(task_config):
     """Test task agent creation."""
-    config = TaskConfig(**sample_task_config)
-    agent = TaskAgent(config)
+    agent = TaskAgent(task_config)
 
     assert agent.config.name == "test_task_agent"
     assert agent.task_config.task_type == "email_processing"
     assert len(agent.task_config.required_tools) == 2
 
 
-@pytest.mark.asyncio
-async def test_task_agent_validation(sample_task_config):
+def test_task_agent_validation(task_config):
     """Test task agent input validation."""
-    # Create config with required fields
-    config_dict = sample_task_config.copy()
-    config_dict["required_input_fields"] = ["email_id", "content"]
-    config = TaskConfig(**config_dict)
+    # Copy the shared config with required fields
+    config = task_config.model_copy(update={"required_input_fields": ["email_id", "content"]})
     agent = TaskAgent(config)
 
     # Valid input
@@ -45,22 +41,18 @@ async def test_task_agent_validation(sample_task_config):
     assert agent.validate_input(invalid_input) is False
 
 
-@pytest.mark.asyncio
-async def test_decision_agent_creation(sample_decision_config):
+def test_decision_agent_creation(decision_config):
     """Test decision agent creation."""
-    config = DecisionConfig(**sample_decision_config)
-    agent = DecisionAgent(config)
+    agent = DecisionAgent(decision_config)
 
     assert agent.config.name == "test_decision_agent"
     assert agent.decision_config.confidence_threshold == 0.8
     assert len(agent.decision_config.decision_criteria) == 3
 
 
-@pytest.mark.asyncio
-async def test_decision_agent_validation(sample_decision_config):
+def test_decision_agent_validation(decision_config):
     """Test decision agent input validation."""
-    config = DecisionConfig(**sample_decision_config)
-    agent = DecisionAgent(config)
+    agent = DecisionAgent(decision_config)
 
     # Valid input
     valid_input = {"situation": "Test situation", "constraints": []}
@@ -71,8 +63,7 @@ async def test_decision_agent_validation(sample_decision_config):
     assert agent.validate_input(invalid_input) is False
 
 
-@pytest.mark.asyncio
-async def test_agent_result_creation():
+def test_agent_result_creation():
     """Test agent result model."""
     result = AgentResult(
         success=True,
@@ -87,8 +78,7 @@ async def test_agent_result_creation():
     assert result.error is None
 
 
-@pytest.mark.asyncio
-async def test_task_step_creation():
+def test_task_step_creation():
     """Test task step model."""
     step = TaskStep(
         name="test_step",
@@ -104,34 +94,44 @@ async def test_task_step_creation():
     assert step.retry_on_failure is True
 
 
-@pytest.mark.asyncio
-async def test_agent_tester_creation():
-    """Test agent tester creation."""
-    tester = AgentTester(TaskAgent)
-    assert tester.agent_class == TaskAgent
-    assert tester.agent_config.name == "test_agent"
+@pytest.fixture(scope="module")
+def task_tester():
+    """Create an agent tester for TaskAgent, shared by the module's tests."""
+    return AgentTester(TaskAgent)
 
 
-@pytest.mark.asyncio
-async def test_agent_tester_with_scenarios():
+def test_agent_tester_creation(task_tester):
+    """Test agent tester creation."""
+    assert task_tester.agent_class == TaskAgent
+    assert task_tester.agent_config.name == "test_agent"
+
+
+@pytest.fixture(scope="module")
+def canonical_scenarios():
+    """Create one succeeding and one failing test scenario."""
+    return [
+        create_test_scenario(
+            name="success_scenario",
+            input_data={"task": "test task", "data": "test data"},
+            expected_success=True
+        ),
+        create_test_scenario(
+            name="failure_scenario",
+            input_data={"invalid": "data"},
+            expected_success=False
+        ),
+    ]
+
+
+def test_agent_tester_with_scenarios(task_tester, canonical_scenarios):
     """Test agent tester with test scenarios."""
-    tester = AgentTester(TaskAgent)
+    # Own scenario list, so the shared tester is left untouched
+    tester = copy.copy(task_tester)
+    tester.test_scenarios = []
 
     # Add test scenarios
-    scenario1 = create_test_scenario(
-        name="success_scenario",
-        input_data={"task": "test task", "data": "test data"},
-        expected_success=True
-    )
-
-    scenario2 = create_test_scenario(
-        name="failure_scenario",
-        input_data={"invalid": "data"},
-        expected_success=False
-    )
-
-    tester.add_scenario(scenario1)
-    tester.add_scenario(scenario2)
+    for scenario in canonical_scenarios:
+        tester.add_scenario(scenario)
 
     assert len(tester.test_scenarios) == 2
 
@@ -139,8 +139,7 @@ async def test_agent_tester_with_scenarios():
     # This test validates the framework setup
 
 
-@pytest.mark.asyncio
-async def test_create_test_agent():
+def test_create_test_agent():
     """Test test agent creation utility."""
     agent = create_test_agent(name="custom_test_agent", description="Custom test")
     assert agent.config.name == "custom_test_agent"
@@ -148,8 +147,7 @@ async def test_create_test_agent():
     assert agent.config.enable_caching is False  # Disabled for tests
 
 
-@pytest.mark.asyncio
-async def test_test_scenario_creation():
+def test_test_scenario_creation():
     """Test test scenario creation."""
     scenario = create_test_scenario(
         name="test_scenario",
@@ -1,6 +1,5 @@
 """Tests for API endpoints."""
 
-import pytest
 from fastapi import status
 
 
@@ -39,14 +38,13 @@ def test_app_info(client):
     assert "environment" in data
 
 
-@pytest.mark.asyncio
-async def test_create_agent(client, sample_task_config):
+def test_create_agent(client, sample_task_config):
     """Test agent creation endpoint."""
     payload = {
         "name": "test_agent",
         "description": "Test agent",
         "agent_type": "task",
-        "config": sample_task_config,
+        "config": dict(sample_task_config),
     }
 
     response = client.post("/agents/", json=payload)
@@ -58,8 +56,7 @@ async def test_create_agent(client, sample_task_config):
     assert "id" in data
 
 
-@pytest.mark.asyncio
-async def test_list_agents(client):
+def test_list_agents(client):
     """Test listing agents."""
     response = client.get("/agents/")
     assert response.status_code == status.HTTP_200_OK
@@ -68,8 +65,7 @@ async def test_list_agents(client):
     assert isinstance(data, list)
 
 
-@pytest.mark.asyncio
-async def test_get_agent_not_found(client):
+def test_get_agent_not_found(client):
     """Test getting non-existent agent."""
     response = client.get("/agents/nonexistent-id")
     assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -80,3 +76,68 @@ async def test_get_agent_not_found(client):
 
 
 
+
+
+WORKFLOW_PAYLOAD = {
+    "name": "test_workflow",
+    "description": "Test workflow",
+    "steps": [{"id": "step1", "name": "Step 1", "agent_type": "task"}],
+}
+
+
+def test_get_workflow_served_from_cache(workflows_client):
+    """Test that a workflow lookup misses once, then hits the cache."""
+    workflow_id = workflows_client.post("/workflows/", json=WORKFLOW_PAYLOAD).json()["id"]
+
+    first = workflows_client.get(f"/workflows/{workflow_id}")
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-Cache"] == "MISS"
+
+    second = workflows_client.get(f"/workflows/{workflow_id}")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_workflow_cache_invalidated_on_create_and_delete(workflows_client, workflow_cache):
+    """Test that creating or deleting a workflow drops the cached entries."""
+    assert workflows_client.get("/workflows/").headers["X-Cache"] == "MISS"
+    assert workflows_client.get("/workflows/").headers["X-Cache"] == "HIT"
+
+    created = workflows_client.post("/workflows/", json=WORKFLOW_PAYLOAD)
+    assert created.status_code == status.HTTP_201_CREATED
+    workflow_id = created.json()["id"]
+
+    listing = workflows_client.get("/workflows/")
+    assert listing.headers["X-Cache"] == "MISS"
+    assert [w["id"] for w in listing.json()] == [workflow_id]
+    workflows_client.get(f"/workflows/{workflow_id}")
+    assert workflow_cache.workflow_key(workflow_id) in workflow_cache.store
+
+    response = workflows_client.delete(f"/workflows/{workflow_id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert workflow_cache.store == {}
+    assert workflows_client.get(f"/workflows/{workflow_id}").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_execute_workflow_queues_execution(workflows_client, workflow_queue):
+    """Test that executing a workflow records a pending execution and queues it."""
+    workflow_id = workflows_client.post("/workflows/", json=WORKFLOW_PAYLOAD).json()["id"]
+
+    response = workflows_client.post(f"/workflows/{workflow_id}/execute", json={"input_data": {"x": 1}})
+    assert response.status_code == status.HTTP_200_OK
+    execution = response.json()
+    assert execution["status"] == "pending"
+    assert workflow_queue.jobs == [("run_workflow_execution", (execution["id"],))]
+
+
+def test_execute_workflow_marks_execution_failed_when_queue_is_down(workflows_client, workflow_queue):
+    """Test that an execution that cannot be queued is not left pending."""
+    workflow_id = workflows_client.post("/workflows/", json=WORKFLOW_PAYLOAD).json()["id"]
+    workflow_queue.error = ConnectionError("Redis unreachable")
+
+    response = workflows_client.post(f"/workflows/{workflow_id}/execute", json={})
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    executions = workflows_client.get(f"/workflows/{workflow_id}/executions").json()
+    assert [e["status"] for e in executions] == ["failed"]
+    assert "Redis unreachable" in executions[0]["error"]
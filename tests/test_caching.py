@@ -0,0 +1,57 @@
+"""Tests for caching infrastructure."""
+
+import pytest
+
+from src.caching import workflow_cache as workflow_cache_module
+from src.caching.workflow_cache import WORKFLOW_CACHE_RETRY_BACKOFF, WorkflowCache
+
+
+class FlakyRedis:
+    """Redis client stub whose ping fails until the server is marked up."""
+
+    server_up = False
+    connections = 0
+
+    def __init__(self):
+        FlakyRedis.connections += 1
+        self.data = {}
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        return cls()
+
+    async def ping(self):
+        if not FlakyRedis.server_up:
+            raise ConnectionError("Redis unreachable")
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_workflow_cache_reconnects_after_backoff(monkeypatch):
+    """Test that an unreachable Redis is retried after the backoff, not latched off."""
+    now = [1000.0]
+    monkeypatch.setattr(workflow_cache_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(workflow_cache_module.redis, "Redis", FlakyRedis)
+    FlakyRedis.server_up = False
+    FlakyRedis.connections = 0
+
+    cache = WorkflowCache(redis_url="redis://test")
+    await cache.set("wf:1", {"id": "1"})
+    assert await cache.get("wf:1") is None
+    # Within the backoff no new connection is attempted
+    assert FlakyRedis.connections == 1
+
+    FlakyRedis.server_up = True
+    now[0] += WORKFLOW_CACHE_RETRY_BACKOFF + 1
+    await cache.set("wf:1", {"id": "1"})
+    assert await cache.get("wf:1") == {"id": "1"}
+    assert FlakyRedis.connections == 2
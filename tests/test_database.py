@@ -3,8 +3,10 @@
 import pytest
 from datetime import datetime
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from src.database.models import (
+    APIRequest,
     Agent,
     AgentExecution,
     AgentStatus,
@@ -27,7 +29,6 @@ async def test_create_agent(db_session):
 
     db_session.add(agent)
     await db_session.commit()
-    await db_session.refresh(agent)
 
     assert agent.id is not None
     assert agent.name == "test_agent"
@@ -56,7 +57,6 @@ async def test_create_agent_execution(db_session):
     )
     db_session.add(execution)
     await db_session.commit()
-    await db_session.refresh(execution)
 
     assert execution.id is not None
     assert execution.agent_id == agent.id
@@ -77,19 +77,22 @@ async def test_agent_execution_relationship(db_session):
     await db_session.commit()
 
     # Create multiple executions
-    for i in range(3):
-        execution = AgentExecution(
+    db_session.add_all([
+        AgentExecution(
             agent_id=agent.id,
             status=AgentStatus.SUCCESS,
             input_data={"iteration": i},
             output_data={"result": i * 2},
         )
-        db_session.add(execution)
+        for i in range(3)
+    ])
 
     await db_session.commit()
 
     # Query agent with executions
-    result = await db_session.execute(select(Agent).where(Agent.id == agent.id))
+    result = await db_session.execute(
+        select(Agent).options(selectinload(Agent.executions)).where(Agent.id == agent.id)
+    )
     agent_with_execs = result.scalar_one()
 
     assert len(agent_with_execs.executions) == 3
@@ -110,7 +113,6 @@ async def test_create_workflow(db_session):
 
     db_session.add(workflow)
     await db_session.commit()
-    await db_session.refresh(workflow)
 
     assert workflow.id is not None
     assert workflow.name == "test_workflow"
@@ -130,7 +132,6 @@ async def test_create_user(db_session):
 
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     assert user.id is not None
     assert user.email == "test@example.com"
@@ -141,8 +142,6 @@ async def test_create_user(db_session):
 @pytest.mark.asyncio
 async def test_user_api_requests_relationship(db_session):
     """Test user-api_requests relationship."""
-    from src.database.models import APIRequest
-
     user = User(
         email="test@example.com",
         username="testuser",
@@ -152,20 +151,23 @@ async def test_user_api_requests_relationship(db_session):
     await db_session.commit()
 
     # Create API requests
-    for i in range(2):
-        request = APIRequest(
+    db_session.add_all([
+        APIRequest(
             user_id=user.id,
             endpoint=f"/api/test/{i}",
             method="GET",
             status_code=200,
             response_time=0.1,
         )
-        db_session.add(request)
+        for i in range(2)
+    ])
 
     await db_session.commit()
 
     # Query user with requests
-    result = await db_session.execute(select(User).where(User.id == user.id))
+    result = await db_session.execute(
+        select(User).options(selectinload(User.api_requests)).where(User.id == user.id)
+    )
     user_with_reqs = result.scalar_one()
 
     assert len(user_with_reqs.api_requests) == 2
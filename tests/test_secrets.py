@@ -0,0 +1,109 @@
+"""Tests for the secrets manager."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import pytest
+from src.secrets.providers import SecretsProvider
+from src.secrets.secrets_manager import SecretsManager
+
+
+class FakeProvider(SecretsProvider):
+    """In-memory provider that can fail or hold lookups open."""
+
+    def __init__(self):
+        self.secrets: Dict[str, str] = {}
+        self.failures = 0
+        self.gate: Optional[asyncio.Event] = None
+        self.calls = 0
+
+    async def get_secret(self, key: str, default: Any = None) -> Optional[str]:
+        """Read the value, then wait on the gate if one is set."""
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("backend unreachable")
+        value = self.secrets.get(key, default)
+        if self.gate is not None:
+            await self.gate.wait()
+        return value
+
+    async def set_secret(self, key: str, value: str) -> None:
+        """Store a value."""
+        self.secrets[key] = value
+
+    async def delete_secret(self, key: str) -> None:
+        """Remove a value."""
+        self.secrets.pop(key, None)
+
+    async def list_secrets(self, prefix: str = "") -> Dict[str, str]:
+        """List stored values with prefix."""
+        return {k: v for k, v in self.secrets.items() if k.startswith(prefix)}
+
+
+@pytest.fixture
+async def secrets():
+    """Create a manager whose only provider is a FakeProvider."""
+    manager = SecretsManager()
+    await manager.initialize()
+    provider = FakeProvider()
+    manager.providers = {"fake": provider}
+    manager.provider_priority = ["fake"]
+    return manager, provider
+
+
+@pytest.mark.asyncio
+async def test_get_secret_is_cached(secrets):
+    """Test that a found secret is served from the cache."""
+    manager, provider = secrets
+    provider.secrets["TOKEN"] = "abc"
+
+    assert await manager.get_secret("TOKEN") == "abc"
+    assert await manager.get_secret("TOKEN") == "abc"
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_is_not_cached(secrets):
+    """Test that a lookup is retried once a failing provider recovers."""
+    manager, provider = secrets
+    provider.secrets["TOKEN"] = "abc"
+    provider.failures = 1
+
+    assert await manager.get_secret("TOKEN", default="fallback") == "fallback"
+    assert await manager.get_secret("TOKEN") == "abc"
+
+
+@pytest.mark.asyncio
+async def test_missing_secret_uses_miss_ttl(secrets):
+    """Test that a miss is only remembered for miss_ttl."""
+    manager, provider = secrets
+    manager._miss_ttl = 0
+
+    assert await manager.get_secret("TOKEN") is None
+    provider.secrets["TOKEN"] = "abc"
+
+    assert await manager.get_secret("TOKEN") == "abc"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ["set", "delete"])
+async def test_write_during_fetch_is_not_overwritten(secrets, write):
+    """Test that a fetch racing a set or delete does not cache the old value."""
+    manager, provider = secrets
+    provider.secrets["TOKEN"] = "old"
+    provider.gate = asyncio.Event()
+
+    fetch = asyncio.create_task(manager.get_secret("TOKEN"))
+    while provider.calls == 0:
+        await asyncio.sleep(0)
+
+    if write == "set":
+        await manager.set_secret("TOKEN", "new", provider="fake")
+    else:
+        await manager.delete_secret("TOKEN", provider="fake")
+    provider.gate.set()
+
+    assert await fetch == "old"
+    expected = "new" if write == "set" else None
+    assert await manager.get_secret("TOKEN") == expected
@@ -0,0 +1,67 @@
+"""Tests for the agent testing utilities."""
+
+import pytest
+
+from src.agents.base import AgentConfig, AgentResult
+from src.agents.task import TaskAgent
+from src.testing import AgentTester, LLMMocker, MockResponse, create_test_scenario
+
+
+@pytest.mark.asyncio
+async def test_llm_mocker_first_registered_match_wins():
+    """Test that the earliest registered mock wins, regardless of match position."""
+    mocker = LLMMocker()
+    mocker.add_simple_response(content="first", input_pattern=r"summary")
+    mocker.add_simple_response(content="second", input_pattern=r"email")
+
+    response = await mocker.generate("email to process, then write a summary")
+    assert response.content == "first"
+
+
+@pytest.mark.asyncio
+async def test_llm_mocker_respects_system_prompt_constraints():
+    """Test that constrained mocks keep their priority over later plain mocks."""
+    mocker = LLMMocker()
+    mocker.add_response(MockResponse("constrained", input_pattern="report", system_prompt_pattern="analyst"))
+    mocker.add_simple_response(content="plain", input_pattern="report")
+
+    with_system = await mocker.generate("weekly report", system_prompt="You are an analyst")
+    without_system = await mocker.generate("weekly report")
+
+    assert with_system.content == "constrained"
+    assert without_system.content == "plain"
+
+
+@pytest.mark.asyncio
+async def test_llm_mocker_default_response():
+    """Test fallback to the default response when nothing matches."""
+    mocker = LLMMocker()
+    mocker.add_simple_response(content="never", input_pattern=r"^nomatch$")
+    mocker.set_default_response("fallback")
+
+    response = await mocker.generate("something else")
+    assert response.content == "fallback"
+
+
+@pytest.mark.asyncio
+async def test_llm_mocker_counts_calls_without_history():
+    """Test that call counts are tracked when history recording is disabled."""
+    mocker = LLMMocker(record_history=False)
+
+    await mocker.generate("hello")
+    await mocker.chat([{"role": "user", "content": "hi"}])
+    await mocker.generate("again")
+
+    assert mocker.get_call_history() == []
+    assert mocker.get_call_count("generate") == 2
+    assert mocker.get_call_count("chat") == 1
+    assert mocker.get_call_count() == 3
+
+
+def test_agent_tester_compares_outputs_by_equality():
+    """Test that outputs equal under == pass even when their JSON forms differ."""
+    tester = AgentTester(TaskAgent, AgentConfig(name="test_agent", description="Test agent"))
+    scenario = create_test_scenario(name="numeric", input_data={}, expected_output={"n": 1, "ok": True})
+
+    assert tester._validate_result(scenario, AgentResult(success=True, data={"n": 1.0, "ok": 1}))
+    assert not tester._validate_result(scenario, AgentResult(success=True, data={"n": 2, "ok": True}))
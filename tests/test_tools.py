@@ -1,7 +1,12 @@
 """Tests for tool functionality."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
+from src.tools import email_tool
 from src.tools.base import Tool, ToolConfig, ToolResult
+from src.tools.email_tool import EmailTool
 
 
 class TestTool(Tool):
@@ -10,13 +15,71 @@ class TestTool(Tool):
     async def execute(self, **kwargs) -> ToolResult:
         """Execute test tool."""
         test_input = kwargs.get("input", "")
-        return ToolResult(
+        return ToolResult.model_construct(
             success=True,
             data={"output": f"processed_{test_input}"},
             execution_time=0.1
         )
 
 
+class FailingTool(Tool):
+    """Tool whose execution always raises."""
+
+    async def execute(self, **kwargs) -> ToolResult:
+        """Fail unconditionally."""
+        raise Exception("Tool failed")
+
+
+class FakeSMTP:
+    """Records SMTP traffic in place of aiosmtplib.SMTP."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_connected = False
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def login(self, username, password):
+        pass
+
+    async def noop(self):
+        return SimpleNamespace(code=250)
+
+    async def send_message(self, msg, recipients=()):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        self.sent.append((msg["Subject"], tuple(recipients)))
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    """Patch aiosmtplib.SMTP for the email tool."""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(email_tool.aiosmtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+@pytest.fixture
+def email(fake_smtp):
+    """Create an email tool backed by the fake SMTP server."""
+    return EmailTool(ToolConfig(name="email", description="Send emails"))
+
+
 @pytest.fixture
 def tool_config():
     """Create test tool configuration."""
@@ -30,8 +93,7 @@ def tool_config():
     )
 
 
-@pytest.mark.asyncio
-async def test_tool_creation(tool_config):
+def test_tool_creation(tool_config):
     """Test tool creation."""
     tool = TestTool(tool_config)
 
@@ -52,8 +114,7 @@ async def test_tool_execution(tool_config):
     assert result.execution_time >= 0
 
 
-@pytest.mark.asyncio
-async def test_tool_result_model():
+def test_tool_result_model():
     """Test tool result model."""
     result = ToolResult(
         success=True,
@@ -72,14 +133,61 @@ async def test_tool_result_model():
 @pytest.mark.asyncio
 async def test_tool_error_handling(tool_config):
     """Test tool error handling."""
-
-    class FailingTool(Tool):
-        async def execute(self, **kwargs) -> ToolResult:
-            raise Exception("Tool failed")
-
     tool = FailingTool(tool_config)
     result = await tool.run()
 
     assert result.success is False
     assert "Tool failed" in result.error
 
+
+
+@pytest.mark.asyncio
+async def test_email_tool_reuses_connection(email, fake_smtp):
+    """Test that sends share one SMTP connection and never interleave on it."""
+    results = await asyncio.gather(*(
+        email.execute(to_emails=[f"user{i}@example.com"], subject=f"s{i}", body="hi", from_email="bot@example.com")
+        for i in range(3)
+    ))
+
+    assert all(result.success for result in results)
+    assert len(fake_smtp.instances) == 1
+    server = fake_smtp.instances[0]
+    assert sorted(subject for subject, _ in server.sent) == ["s0", "s1", "s2"]
+    assert server.max_active == 1
+
+    await email.aclose()
+    assert server.is_connected is False
+
+
+@pytest.mark.asyncio
+async def test_email_tool_reconnects_after_drop(email, fake_smtp):
+    """Test that a dropped connection is replaced on the next send."""
+    await email.execute(to_emails=["a@example.com"], subject="first", body="hi", from_email="bot@example.com")
+    fake_smtp.instances[0].is_connected = False
+
+    result = await email.execute(to_emails=["a@example.com"], subject="second", body="hi", from_email="bot@example.com")
+
+    assert result.success is True
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[1].sent == [("second", ("a@example.com",))]
+
+
+@pytest.mark.asyncio
+async def test_email_tool_send_batch(email, fake_smtp):
+    """Test that a batch is sent over one connection with per-message results."""
+    results = await email.send_batch([
+        {"to_emails": ["a@example.com"], "subject": "one", "body": "hi", "from_email": "bot@example.com",
+         "bcc_emails": ["audit@example.com"]},
+        {"to_emails": ["b@example.com"], "subject": "two", "body": "hi", "from_email": "bot@example.com",
+         "bogus": True},
+        {"to_emails": ["c@example.com"], "subject": "three", "body": "hi", "from_email": "bot@example.com"},
+    ])
+
+    assert [result.success for result in results] == [True, False, True]
+    assert results[0].data["sent_to"] == ["a@example.com"]
+    assert "bogus" in results[1].error
+    assert len(fake_smtp.instances) == 1
+    assert fake_smtp.instances[0].sent == [
+        ("one", ("a@example.com", "audit@example.com")),
+        ("three", ("c@example.com",)),
+    ]
@@ -0,0 +1,146 @@
+"""Tests for vector store implementations."""
+
+import json
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def hnsw_store():
+    """Create an empty HNSW store, skipping when hnswlib is not installed."""
+    pytest.importorskip("hnswlib")
+    from src.vector_store.hnsw_store import HNSWMemoryStore
+
+    return HNSWMemoryStore()
+
+
+def _unit(*components):
+    """Build a float32 vector."""
+    return np.asarray(components, dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_hnsw_store_and_search(hnsw_store):
+    """Test that the nearest stored vector ranks first."""
+    await hnsw_store.store("x", _unit(1, 0, 0), {"content": "x axis"})
+    await hnsw_store.store("y", _unit(0, 1, 0))
+    await hnsw_store.store("z", _unit(0, 0, 1))
+
+    results = await hnsw_store.search(_unit(0.9, 0.1, 0), limit=2)
+
+    assert [result.id for result in results] == ["x", "y"]
+    assert results[0].score == pytest.approx(0.9939, abs=1e-3)
+    assert results[0].content == "x axis"
+    assert hnsw_store.get_stats()["total_vectors"] == 3
+
+
+@pytest.mark.asyncio
+async def test_hnsw_store_delete(hnsw_store):
+    """Test that deleted vectors are no longer returned."""
+    await hnsw_store.store("x", _unit(1, 0, 0))
+    await hnsw_store.store("y", _unit(0, 1, 0))
+
+    assert await hnsw_store.delete("x") is True
+    assert await hnsw_store.delete("x") is False
+
+    results = await hnsw_store.search(_unit(1, 0, 0), limit=5)
+
+    assert [result.id for result in results] == ["y"]
+    assert hnsw_store.get_stats()["total_vectors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hnsw_store_overwrite(hnsw_store):
+    """Test that storing an existing id replaces its vector and metadata."""
+    await hnsw_store.store("a", _unit(1, 0, 0), {"version": 1})
+    await hnsw_store.store("a", _unit(0, 1, 0), {"version": 2})
+
+    results = await hnsw_store.search(_unit(0, 1, 0), limit=5)
+
+    assert len(results) == 1
+    assert results[0].id == "a"
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+    assert results[0].metadata == {"version": 2}
+
+
+@pytest.mark.asyncio
+async def test_hnsw_store_reuses_deleted_slots(hnsw_store):
+    """Test that a deleted id can be stored again."""
+    await hnsw_store.store("a", _unit(1, 0, 0))
+    await hnsw_store.delete("a")
+    await hnsw_store.store("a", _unit(0, 0, 1))
+
+    results = await hnsw_store.search(_unit(0, 0, 1), limit=5)
+
+    assert [result.id for result in results] == ["a"]
+
+
+@pytest.fixture
+def persist_path(tmp_path, monkeypatch):
+    """Point the in-memory store at a temporary persistence directory."""
+    from src import vector_store
+
+    path = tmp_path / "vectors"
+    monkeypatch.setattr(vector_store.settings.vector_store, "persist_path", str(path))
+    return path
+
+
+@pytest.mark.asyncio
+async def test_memory_store_persistence_round_trip(persist_path):
+    """Test that a saved store is restored, and can be updated and saved again."""
+    from src.vector_store.memory_store import MemoryVectorStore
+
+    store = MemoryVectorStore()
+    await store.store("x", _unit(1, 0, 0), {"content": "x axis"})
+    await store.store("y", _unit(0, 1, 0))
+    await store.close()
+
+    restored = MemoryVectorStore()
+    results = await restored.search(_unit(1, 0, 0), limit=2)
+    assert [result.id for result in results] == ["x", "y"]
+    assert results[0].content == "x axis"
+
+    # Saving over the directory the restored matrix is mapped from
+    await restored.store("z", _unit(0, 0, 1))
+    await restored.delete("y")
+    await restored.close()
+
+    reloaded = MemoryVectorStore()
+    assert reloaded.get_stats()["total_vectors"] == 2
+    assert [result.id for result in await reloaded.search(_unit(0, 0, 1), limit=1)] == ["z"]
+    assert sorted(p.name for p in persist_path.parent.iterdir()) == ["vectors"]
+
+
+@pytest.mark.asyncio
+async def test_memory_store_rejects_inconsistent_save(persist_path):
+    """Test that a save whose files disagree on the row count is not loaded."""
+    from src.vector_store.memory_store import MemoryVectorStore
+
+    store = MemoryVectorStore()
+    await store.store("x", _unit(1, 0, 0))
+    await store.close()
+
+    index_file = persist_path / "index.json"
+    index = json.loads(index_file.read_text())
+    index["ids"].append("ghost")
+    index["metadata"].append({})
+    index_file.write_text(json.dumps(index))
+
+    with pytest.raises(ValueError, match="inconsistent"):
+        MemoryVectorStore()
+
+
+@pytest.mark.asyncio
+async def test_memory_store_loads_previous_save_after_interrupted_swap(persist_path):
+    """Test that the previous save is used when the new one was never moved in."""
+    from src.vector_store.memory_store import MemoryVectorStore
+
+    store = MemoryVectorStore()
+    await store.store("x", _unit(1, 0, 0))
+    await store.close()
+    persist_path.rename(persist_path.with_name("vectors.old"))
+
+    restored = MemoryVectorStore()
+
+    assert [result.id for result in await restored.search(_unit(1, 0, 0))] == ["x"]
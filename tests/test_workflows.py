@@ -1,11 +1,22 @@
 """Tests for workflow functionality."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
-from src.workflows.models import WorkflowConfig, WorkflowStep, Workflow
+from src.database.models import Workflow as DBWorkflow
+from src.database.models import WorkflowExecution
+from src.database.models import WorkflowStatus as DBWorkflowStatus
+from src.workflows import worker
+from src.workflows.models import (
+    StepCondition, WorkflowConfig, WorkflowStep, Workflow, StepResult, WorkflowResult, WorkflowStatus,
+)
 from src.workflows.engine import WorkflowEngine
+from src.workflows.builder import WorkflowBuilder
+from src.agents.base import AgentResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def workflow_config():
     """Create a test workflow configuration."""
     return WorkflowConfig(
@@ -17,7 +28,7 @@ def workflow_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def workflow_steps():
     """Create test workflow steps."""
     return [
@@ -54,26 +65,10 @@ def workflow_steps():
     ]
 
 
-@pytest.mark.asyncio
-async def test_workflow_creation(workflow_config, workflow_steps):
-    """Test workflow creation."""
-    workflow = Workflow(
-        id="test_workflow_1",
-        config=workflow_config,
-        steps=workflow_steps
-    )
-
-    assert workflow.id == "test_workflow_1"
-    assert workflow.config.name == "test_workflow"
-    assert len(workflow.steps) == 2
-
-
-@pytest.mark.asyncio
-async def test_workflow_engine_dependency_graph():
-    """Test workflow engine dependency graph building."""
-    engine = WorkflowEngine()
-
-    steps = [
+@pytest.fixture(scope="module")
+def dependency_graph_steps():
+    """Create a step1 -> (step2, step3) fan-out for dependency graph tests."""
+    return [
         WorkflowStep(
             id="step1",
             name="Step 1",
@@ -103,7 +98,25 @@ async def test_workflow_engine_dependency_graph():
         )
     ]
 
-    graph = engine._build_dependency_graph(steps)
+
+def test_workflow_creation(workflow_config, workflow_steps):
+    """Test workflow creation."""
+    workflow = Workflow(
+        id="test_workflow_1",
+        config=workflow_config,
+        steps=workflow_steps
+    )
+
+    assert workflow.id == "test_workflow_1"
+    assert workflow.config.name == "test_workflow"
+    assert len(workflow.steps) == 2
+
+
+def test_workflow_engine_dependency_graph(dependency_graph_steps):
+    """Test workflow engine dependency graph building."""
+    engine = WorkflowEngine()
+
+    graph = engine._build_dependency_graph(dependency_graph_steps)
 
     # First level should have step1
     assert len(graph) == 2
@@ -111,11 +124,10 @@ async def test_workflow_engine_dependency_graph():
 
     # Second level should have step2 and step3
     assert len(graph[1]) == 2
-    assert set(s.id for s in graph[1]) == {"step2", "step3"}
+    assert {s.id for s in graph[1]} == {"step2", "step3"}
 
 
-@pytest.mark.asyncio
-async def test_workflow_step_creation():
+def test_workflow_step_creation():
     """Test workflow step model."""
     step = WorkflowStep(
         id="test_step",
@@ -140,3 +152,253 @@ async def test_workflow_step_creation():
     assert step.timeout == 60
     assert step.condition == "true"
 
+
+
+def test_workflow_builder_adjacency():
+    """Test that build() precomputes the CSR dependency graph."""
+    workflow = (
+        WorkflowBuilder("adjacency")
+        .add_step("A", "task", step_id="a")
+        .add_step("B", "task", step_id="b", depends_on=["a", "a"])
+        .add_step("C", "task", step_id="c", depends_on=["a", "b"])
+        .build()
+    )
+
+    adjacency = workflow._adjacency
+    assert adjacency.step_index == {"a": 0, "b": 1, "c": 2}
+    assert adjacency.indeg.tolist() == [0, 1, 2]
+    assert adjacency.succ_offsets.tolist() == [0, 2, 3, 3]
+    assert adjacency.succ_indices.tolist() == [1, 2, 2]
+    assert "_adjacency" not in workflow.model_dump()
+
+    graph = WorkflowEngine()._build_dependency_graph(workflow.steps, adjacency)
+    assert [[s.id for s in level] for level in graph] == [["a"], ["b"], ["c"]]
+
+
+def test_workflow_engine_dependency_graph_cache_uses_current_steps(workflow_config, workflow_steps):
+    """Test that cached levels are filled from the workflow being executed."""
+    engine = WorkflowEngine()
+    first = Workflow(id="cached", config=workflow_config, steps=workflow_steps)
+    second = first.model_copy(deep=True)
+
+    engine._get_dependency_graph(first)
+    graph = engine._get_dependency_graph(second)
+
+    assert len(engine._dep_graph_cache) == 1
+    scheduled = [step for level in graph for step in level]
+    assert len(scheduled) == len(second.steps)
+    assert all(step is expected for step, expected in zip(scheduled, second.steps))
+
+
+def test_step_condition_prepare():
+    """Test that prepare() fills the predicate and field path caches."""
+    condition = StepCondition(type="compare", field="step1.output.count", value=3, operator="greater_than")
+
+    condition.prepare()
+
+    assert condition._field_path.parts == ("step1", "output", "count")
+    assert condition._predicate is not None
+    assert condition.compile()(5) is True
+    assert condition.compile()(1) is False
+
+    with pytest.raises(ValueError):
+        StepCondition(type="compare", field="x", value="many", operator="greater_than").prepare()
+
+
+def test_workflow_builder_timestamps_are_naive_utc():
+    """Test that built workflows use the same naive UTC timestamps as Workflow defaults."""
+    workflow = WorkflowBuilder("timestamps").add_step("A", "task").build()
+    default = Workflow(id="default", config=workflow.config, steps=[])
+
+    assert workflow.created_at.tzinfo is None
+    assert workflow.created_at == workflow.updated_at
+    assert workflow.created_at <= default.created_at
+
+
+def test_workflow_builder_rejects_invalid_graphs():
+    """Test that build() rejects duplicate IDs, unknown dependencies and cycles."""
+    with pytest.raises(ValueError, match="Duplicate step IDs"):
+        WorkflowBuilder("dup").add_step("A", "task", step_id="a").add_step("B", "task", step_id="a").build()
+
+    with pytest.raises(ValueError, match="unknown steps"):
+        WorkflowBuilder("unknown").add_step("A", "task", depends_on=["missing"]).build()
+
+    with pytest.raises(ValueError, match="cycle: a -> b -> a"):
+        (
+            WorkflowBuilder("cycle")
+            .add_step("A", "task", step_id="a", depends_on=["b"])
+            .add_step("B", "task", step_id="b", depends_on=["a"])
+            .build()
+        )
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_reuses_cacheable_step_results():
+    """Test that cacheable steps skip the agent for repeated inputs."""
+    calls = []
+
+    class EchoAgent:
+        def __init__(self, step):
+            self.step = step
+
+        async def execute(self, inputs):
+            calls.append(self.step.id)
+            return AgentResult.model_construct(success=True, data={"echo": inputs})
+
+    workflow = (
+        WorkflowBuilder("cached")
+        .add_step("Echo", "task", inputs={"topic": "{{topic}}"}, cacheable=True)
+        .build()
+    )
+    engine = WorkflowEngine()
+    engine._create_agent = EchoAgent
+
+    first = await engine.execute(workflow, {"topic": "a"})
+    second = await engine.execute(workflow, {"topic": "a"})
+    await engine.execute(workflow, {"topic": "b"})
+
+    assert calls == ["step_1", "step_1"]
+    assert second.step_results["step_1"].output == first.step_results["step_1"].output
+    assert second.step_results["step_1"].metadata["cache_hit"] is True
+
+
+def test_workflow_result_step_aggregates():
+    """Test status counts and step time totals over a workflow result."""
+    result = WorkflowResult(
+        workflow_id="wf",
+        status=WorkflowStatus.FAILED,
+        step_results={
+            "a": StepResult.model_construct(
+                step_id="a", status=WorkflowStatus.COMPLETED, execution_time=1.5
+            ),
+            "b": StepResult.model_construct(
+                step_id="b", status=WorkflowStatus.COMPLETED, execution_time=0.5
+            ),
+            "c": StepResult.model_construct(
+                step_id="c", status=WorkflowStatus.FAILED, execution_time=0.25
+            ),
+        },
+    )
+
+    assert result.status_counts() == {WorkflowStatus.COMPLETED: 2, WorkflowStatus.FAILED: 1}
+    assert result.total_step_time() == 2.25
+    assert result.step_columns().step_ids == ["a", "b", "c"]
+    assert WorkflowResult(workflow_id="wf", status=WorkflowStatus.COMPLETED).status_counts() == {}
+
+
+class StubEngine:
+    """Engine double returning a fixed result, or raising a fixed error."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    def prepare(self, workflow):
+        return workflow
+
+    async def execute(self, workflow, initial_input=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def worker_db(db_session, monkeypatch):
+    """Route the worker's database sessions to the test session."""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+
+    monkeypatch.setattr(worker, "AsyncSessionLocal", session_factory)
+    return db_session
+
+
+async def _pending_execution(db_session, status=DBWorkflowStatus.PENDING):
+    """Store a one-step workflow and an execution of it."""
+    workflow = DBWorkflow(
+        name="queued",
+        steps=[{"id": "step1", "name": "Step 1", "agent_type": "task"}],
+        config={},
+    )
+    db_session.add(workflow)
+    await db_session.commit()
+    execution = WorkflowExecution(
+        workflow_id=workflow.id, status=status, input_data={}, total_steps=1
+    )
+    db_session.add(execution)
+    await db_session.commit()
+    return execution
+
+
+@pytest.mark.parametrize(
+    "engine_status,db_status",
+    [
+        (WorkflowStatus.COMPLETED, DBWorkflowStatus.SUCCESS),
+        (WorkflowStatus.FAILED, DBWorkflowStatus.FAILED),
+        (WorkflowStatus.CANCELLED, DBWorkflowStatus.CANCELLED),
+    ],
+)
+async def test_run_workflow_execution_maps_status(worker_db, engine_status, db_status):
+    """Test that the worker persists the engine's outcome on the execution."""
+    execution = await _pending_execution(worker_db)
+    engine = StubEngine(result=WorkflowResult(
+        workflow_id=execution.workflow_id,
+        status=engine_status,
+        final_output={"answer": 42},
+        step_results={
+            "step1": StepResult.model_construct(step_id="step1", status=engine_status)
+        },
+    ))
+
+    status = await worker.run_workflow_execution({"engine": engine}, execution.id)
+
+    assert status == db_status.value
+    assert execution.status == db_status
+    assert execution.output_data == {"final_output": {"answer": 42}}
+    assert execution.current_step == 1
+    assert execution.completed_at is not None
+
+
+async def test_run_workflow_execution_missing_execution(worker_db):
+    """Test that a job for a deleted execution is a no-op."""
+    engine = StubEngine()
+    assert await worker.run_workflow_execution({"engine": engine}, "missing") is None
+    assert engine.calls == 0
+
+
+async def test_run_workflow_execution_records_crash(worker_db):
+    """Test that an engine crash marks the execution failed."""
+    execution = await _pending_execution(worker_db)
+    engine = StubEngine(error=RuntimeError("boom"))
+
+    status = await worker.run_workflow_execution({"engine": engine}, execution.id)
+
+    assert status == DBWorkflowStatus.FAILED.value
+    assert execution.status == DBWorkflowStatus.FAILED
+    assert execution.error == "boom"
+
+
+async def test_run_workflow_execution_records_cancellation(worker_db):
+    """Test that a cancelled job marks the execution failed before propagating."""
+    execution = await _pending_execution(worker_db)
+    engine = StubEngine(error=asyncio.CancelledError())
+
+    with pytest.raises(asyncio.CancelledError):
+        await worker.run_workflow_execution({"engine": engine}, execution.id)
+
+    assert execution.status == DBWorkflowStatus.FAILED
+    assert execution.error == "Workflow execution was cancelled"
+
+
+async def test_run_workflow_execution_skips_started_execution(worker_db):
+    """Test that a redelivered job does not rerun an execution."""
+    execution = await _pending_execution(worker_db, status=DBWorkflowStatus.RUNNING)
+    engine = StubEngine()
+
+    status = await worker.run_workflow_execution({"engine": engine}, execution.id)
+
+    assert status == DBWorkflowStatus.RUNNING.value
+    assert engine.calls == 0